@@ -0,0 +1,14 @@
+"""
+Content-Encoding negotiation
+
+Shared by routes that gzip their own response bodies (Places passthrough,
+/tts/voices), so they all read Accept-Encoding the same way Werkzeug does:
+parsed tokens with q-values, not a substring test.
+"""
+
+from flask import request
+
+
+def accepts_gzip() -> bool:
+    """True if the current request's Accept-Encoding allows gzip (q > 0)"""
+    return request.accept_encodings['gzip'] > 0
@@ -0,0 +1,62 @@
+"""
+orjson-backed JSON provider for Flask
+
+Replaces Flask's stdlib json provider so every jsonify() response and
+request.get_json() call goes through orjson. Falls back to Flask's own
+serializer for anything orjson can't encode natively (Decimal, objects
+with __html__, etc).
+
+The wire format stays Flask's: keys are sorted when sort_keys is set (the
+default), and datetimes/dates and dataclasses are passed through to Flask's
+default() (RFC 822 http_date strings, asdict()) instead of orjson's own
+ISO 8601 / dataclass encoding. Calls with extra json.dumps kwargs (indent
+etc) go to the stdlib provider unchanged.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+from core.json_utils import ORJSON_AVAILABLE
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+_ORJSON_OPTS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+) if ORJSON_AVAILABLE else 0
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider using orjson for encode/decode.
+
+    Register with: app.json = OrjsonProvider(app)
+    """
+
+    def _options(self) -> int:
+        return _ORJSON_OPTS | orjson.OPT_SORT_KEYS if self.sort_keys else _ORJSON_OPTS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Build the response body as bytes, skipping the str round trip"""
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)  # pretty-printed
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options()) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def install_json_provider(app) -> bool:
+    """Swap app.json for the orjson provider when orjson is installed"""
+    if not ORJSON_AVAILABLE:
+        return False
+    app.json = OrjsonProvider(app)
+    return True
@@ -15,14 +15,15 @@ The AiCara frontends call these endpoints via http://your_url.com.
 This file translates those requests to the substrate's consciousness loop.
 """
 
-import json
-import asyncio
+import time
 import logging
 from datetime import datetime
 from flask import Blueprint, Response, request, jsonify
 from typing import Dict, Any, Optional
 
 from core.config import get_model_or_default, DEFAULT_TEMPERATURE
+from core.json_utils import parse_request_json, dumps_bytes
+from core.async_runner import run_async_isolated, iter_async_isolated
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,11 @@ _consciousness_loop = None
 _state_manager = None
 _rate_limiter = None
 
+# Pre-encoded stream frames (chunks are yielded as bytes so Werkzeug skips
+# the per-chunk str -> UTF-8 encode)
+_NDJSON_DONE = b'{"delta":"","done":true}\n'
+_SSE_DONE = b"data: [DONE]\n\n"
+
 
 def init_aicara_routes(consciousness_loop, state_manager, rate_limiter=None):
     """Initialize AiCara compatibility routes with dependencies"""
@@ -44,6 +50,105 @@ def init_aicara_routes(consciousness_loop, state_manager, rate_limiter=None):
     logger.info("🌐 AiCara compatibility routes initialized")
 
 
+def _extract_user_message(data: Dict[str, Any]) -> str:
+    """
+    Pull the incoming user message out of a request body.
+
+    History lives server-side (the consciousness loop loads it per session),
+    so only the newest message is needed. Clients may send the slim
+    {"message": "..."} form; otherwise the last entry of "messages" is used.
+    """
+    message = data.get('message')
+    if isinstance(message, str):
+        return message
+
+    messages = data.get('messages')
+    if not messages or not isinstance(messages, list):
+        return ""
+
+    last_msg = messages[-1]
+    if not isinstance(last_msg, dict):
+        return ""
+    return last_msg.get('content', '') or ''
+
+
+def _resolve_model() -> str:
+    """Model from agent state, falling back to the .env default"""
+    model = _state_manager.get_state("agent:model") if _state_manager else None
+    return model or get_model_or_default()
+
+
+def _dispatch_stream(user_message: str, session_id: str, model: str, history_limit: int):
+    """
+    Shared streaming dispatcher for /chat and /v1/chat/completions.
+
+    Drives the consciousness loop and yields normalized
+    {"delta": str, "done": bool} dicts. Always finishes with exactly one
+    done chunk, even if the underlying stream ends without one. Each route
+    only supplies a formatter for its wire format.
+    """
+    async_gen = _consciousness_loop.process_message_stream(
+        user_message=user_message,
+        session_id=session_id,
+        model=model,
+        include_history=True,
+        history_limit=history_limit
+    )
+
+    # Private loop per turn: the loop makes blocking DB/tool calls inline,
+    # which would stall every other request on the shared loop
+    for chunk in iter_async_isolated(async_gen):
+        if isinstance(chunk, dict):
+            delta = chunk.get('delta', chunk.get('content', ''))
+            done = chunk.get('done', False)
+        else:
+            delta = str(chunk)
+            done = False
+
+        yield {"delta": delta, "done": done}
+        if done:
+            return
+
+    yield {"delta": "", "done": True}
+
+
+def _ndjson_format(chunk: Dict[str, Any]) -> bytes:
+    """wolfeEngine.ts NDJSON line for a normalized chunk"""
+    if chunk["done"] and not chunk["delta"]:
+        return _NDJSON_DONE
+    return dumps_bytes(chunk) + b'\n'
+
+
+def _openai_format(chunk: Dict[str, Any], completion_id: str, created: int, model: str) -> bytes:
+    """OpenAI chat.completion.chunk SSE frame(s) for a normalized chunk"""
+    out = b""
+    if chunk["delta"]:
+        out += b"data: " + dumps_bytes({
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "delta": {"content": chunk["delta"]},
+                "finish_reason": None
+            }]
+        }) + b"\n\n"
+    if chunk["done"]:
+        out += b"data: " + dumps_bytes({
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "delta": {},
+                "finish_reason": "stop"
+            }]
+        }) + b"\n\n" + _SSE_DONE
+    return out
+
+
 # ============================================
 # /chat - Web wolfeEngine.ts Compatibility
 # ============================================
@@ -55,7 +160,7 @@ def aicara_chat():
     
     wolfeEngine.ts sends:
     {
-        "messages": [{"role": "user", "content": "..."}],
+        "messages": [{"role": "user", "content": "..."}],  // or "message": "..."
         "max_tokens": 2048,
         "temperature": 0.55,
         "top_p": 0.9,
@@ -76,19 +181,17 @@ def aicara_chat():
         return jsonify({"error": "Consciousness loop not initialized"}), 500
     
     try:
-        data = request.get_json()
+        data = parse_request_json(request)
+        if not isinstance(data, dict):
+            return jsonify({"error": "Invalid JSON body"}), 400
         
         # Extract from wolfeEngine format
-        messages = data.get('messages', [])
         stream = data.get('stream', True)
         max_tokens = data.get('max_tokens', 2048)
         temperature = data.get('temperature', DEFAULT_TEMPERATURE)
         
-        # Get user message (last message in array)
-        user_message = ""
-        if messages:
-            last_msg = messages[-1]
-            user_message = last_msg.get('content', '')
+        # Only the newest message is used - history is loaded server-side
+        user_message = _extract_user_message(data)
         
         if not user_message:
             return jsonify({"error": "No message content"}), 400
@@ -100,8 +203,8 @@ def aicara_chat():
         # 📍 Extract and store location context from mobile/web clients
         location_data = data.get('location')
         if location_data and isinstance(location_data, dict):
-            from api.routes_places import _location_contexts
-            _location_contexts[session_id] = {
+            from api.routes_places import store_location_context
+            store_location_context(session_id, {
                 'latitude': location_data.get('latitude'),
                 'longitude': location_data.get('longitude'),
                 'city': location_data.get('city'),
@@ -111,8 +214,9 @@ def aicara_chat():
                 'speed': location_data.get('speed'),
                 'accuracy': location_data.get('accuracy'),
                 'updated_at': datetime.now().isoformat(),
-            }
-            logger.info(f"📍 Location from /chat: {location_data.get('city')}, {location_data.get('region')} (session={session_id})")
+            })
+            logger.info("📍 Location from /chat: %s, %s (session=%s)",
+                        location_data.get('city'), location_data.get('region'), session_id)
 
         # 📍 Prepend a <message_context> block with current location metadata so
         # the AI receives it as part of the incoming message (not just the
@@ -121,14 +225,13 @@ def aicara_chat():
         location_block = build_location_context_block(session_id)
         if location_block and user_message:
             user_message = location_block + user_message
-            logger.info(f"📍 Location metadata prepended to user message ({len(location_block)} chars)")
+            logger.info("📍 Location metadata prepended to user message (%d chars)", len(location_block))
 
-        logger.info(f"🌐 AiCara /chat: session={session_id}, stream={stream}, msg_len={len(user_message)}")
+        logger.info("🌐 AiCara /chat: session=%s, stream=%s, msg_len=%d",
+                    session_id, stream, len(user_message))
         
         # Get model from state or use default from .env configuration
-        model = _state_manager.get_state("agent:model") if _state_manager else None
-        if not model:
-            model = get_model_or_default()
+        model = _resolve_model()
         
         if stream:
             # STREAMING MODE - Return NDJSON
@@ -142,21 +245,15 @@ def aicara_chat():
             )
         else:
             # NON-STREAMING MODE
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    _consciousness_loop.process_message(
-                        user_message=user_message,
-                        session_id=session_id,
-                        model=model,
-                        include_history=True,
-                        history_limit=24
-                    )
+            result = run_async_isolated(
+                _consciousness_loop.process_message(
+                    user_message=user_message,
+                    session_id=session_id,
+                    model=model,
+                    include_history=True,
+                    history_limit=24
                 )
-            finally:
-                loop.close()
+            )
             
             response_text = result.get('response', '')
             
@@ -180,45 +277,12 @@ def _generate_ndjson_stream(user_message: str, session_id: str, model: str):
     {"delta": " world", "done": false}  
     {"delta": "", "done": true}
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
     try:
-        async_gen = _consciousness_loop.process_message_stream(
-            user_message=user_message,
-            session_id=session_id,
-            model=model,
-            include_history=True,
-            history_limit=24
-        )
-        
-        while True:
-            try:
-                chunk = loop.run_until_complete(async_gen.__anext__())
-                
-                # Substrate stream format -> wolfeEngine NDJSON format
-                if isinstance(chunk, dict):
-                    delta = chunk.get('delta', chunk.get('content', ''))
-                    done = chunk.get('done', False)
-                else:
-                    delta = str(chunk)
-                    done = False
-                
-                yield json.dumps({"delta": delta, "done": done}) + '\n'
-                
-                if done:
-                    break
-                    
-            except StopAsyncIteration:
-                # Send final done message
-                yield json.dumps({"delta": "", "done": True}) + '\n'
-                break
-                
+        for chunk in _dispatch_stream(user_message, session_id, model, history_limit=24):
+            yield _ndjson_format(chunk)
     except Exception as e:
         logger.error(f"❌ Streaming error: {e}", exc_info=True)
-        yield json.dumps({"error": str(e), "done": True}) + '\n'
-    finally:
-        loop.close()
+        yield dumps_bytes({"error": str(e), "done": True}) + b'\n'
 
 
 # ============================================
@@ -232,7 +296,7 @@ def openai_chat_completions():
     
     wolfeEngine.js (mobile) sends:
     {
-        "messages": [{"role": "user", "content": "..."}],
+        "messages": [{"role": "user", "content": "..."}],  // or "message": "..."
         "max_tokens": 256,
         "temperature": 0.7,
         "top_p": 0.9,
@@ -264,19 +328,23 @@ def openai_chat_completions():
         return jsonify({"error": "Consciousness loop not initialized"}), 500
     
     try:
-        data = request.get_json()
+        data = parse_request_json(request)
+        if not isinstance(data, dict):
+            return jsonify({
+                "error": {
+                    "message": "Invalid JSON body",
+                    "type": "invalid_request_error",
+                    "code": 400
+                }
+            }), 400
         
         # Extract from OpenAI format
-        messages = data.get('messages', [])
         stream = data.get('stream', False)
         max_tokens = data.get('max_tokens', 256)
         temperature = data.get('temperature', DEFAULT_TEMPERATURE)
         
-        # Get user message (last message in array)
-        user_message = ""
-        if messages:
-            last_msg = messages[-1]
-            user_message = last_msg.get('content', '')
+        # Only the newest message is used - history is loaded server-side
+        user_message = _extract_user_message(data)
         
         if not user_message:
             return jsonify({"error": "No message content"}), 400
@@ -285,12 +353,10 @@ def openai_chat_completions():
         # Using same session ID across all interfaces so Agent remembers conversations
         session_id = request.headers.get('X-Session-Id', 'nate_conversation')
         
-        logger.info(f"📱 AiCara /v1/chat/completions: session={session_id}, stream={stream}")
+        logger.info("📱 AiCara /v1/chat/completions: session=%s, stream=%s", session_id, stream)
         
         # Get model from state or use default from .env configuration
-        model = _state_manager.get_state("agent:model") if _state_manager else None
-        if not model:
-            model = get_model_or_default()
+        model = _resolve_model()
         
         if stream:
             # STREAMING MODE - OpenAI SSE format
@@ -304,30 +370,25 @@ def openai_chat_completions():
             )
         else:
             # NON-STREAMING MODE - Standard OpenAI response
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    _consciousness_loop.process_message(
-                        user_message=user_message,
-                        session_id=session_id,
-                        model=model,
-                        include_history=True,
-                        history_limit=8  # Shorter for mobile
-                    )
+            result = run_async_isolated(
+                _consciousness_loop.process_message(
+                    user_message=user_message,
+                    session_id=session_id,
+                    model=model,
+                    include_history=True,
+                    history_limit=8  # Shorter for mobile
                 )
-            finally:
-                loop.close()
+            )
             
             response_text = result.get('response', '')
             usage = result.get('usage', {})
             
             # Return in OpenAI format
+            created = int(time.time())
             return jsonify({
-                "id": f"chatcmpl-{session_id}-{int(datetime.now().timestamp())}",
+                "id": f"chatcmpl-{session_id}-{created}",
                 "object": "chat.completion",
-                "created": int(datetime.now().timestamp()),
+                "created": created,
                 "model": model,
                 "choices": [{
                     "index": 0,
@@ -364,72 +425,17 @@ def _generate_openai_stream(user_message: str, session_id: str, model: str):
     
     data: [DONE]
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
-    completion_id = f"chatcmpl-{session_id}-{int(datetime.now().timestamp())}"
+    created = int(time.time())
+    completion_id = f"chatcmpl-{session_id}-{created}"
     
     try:
-        async_gen = _consciousness_loop.process_message_stream(
-            user_message=user_message,
-            session_id=session_id,
-            model=model,
-            include_history=True,
-            history_limit=8
-        )
-        
-        while True:
-            try:
-                chunk = loop.run_until_complete(async_gen.__anext__())
-                
-                # Convert to OpenAI streaming format
-                if isinstance(chunk, dict):
-                    delta = chunk.get('delta', chunk.get('content', ''))
-                    done = chunk.get('done', False)
-                else:
-                    delta = str(chunk)
-                    done = False
-                
-                if delta:
-                    event = {
-                        "id": completion_id,
-                        "object": "chat.completion.chunk",
-                        "created": int(datetime.now().timestamp()),
-                        "model": model,
-                        "choices": [{
-                            "index": 0,
-                            "delta": {"content": delta},
-                            "finish_reason": None
-                        }]
-                    }
-                    yield f"data: {json.dumps(event)}\n\n"
-                
-                if done:
-                    # Send finish event
-                    finish_event = {
-                        "id": completion_id,
-                        "object": "chat.completion.chunk",
-                        "created": int(datetime.now().timestamp()),
-                        "model": model,
-                        "choices": [{
-                            "index": 0,
-                            "delta": {},
-                            "finish_reason": "stop"
-                        }]
-                    }
-                    yield f"data: {json.dumps(finish_event)}\n\n"
-                    yield "data: [DONE]\n\n"
-                    break
-                    
-            except StopAsyncIteration:
-                yield "data: [DONE]\n\n"
-                break
-                
+        for chunk in _dispatch_stream(user_message, session_id, model, history_limit=8):
+            frame = _openai_format(chunk, completion_id, created, model)
+            if frame:
+                yield frame
     except Exception as e:
         logger.error(f"❌ OpenAI stream error: {e}", exc_info=True)
-        yield f"data: {json.dumps({'error': str(e)})}\n\n"
-    finally:
-        loop.close()
+        yield b"data: " + dumps_bytes({'error': str(e)}) + b"\n\n"
 
 
 # ============================================
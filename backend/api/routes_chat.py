@@ -129,9 +129,9 @@ def chat():
         # 📍 Extract and store location context from mobile/web clients
         location_data = data.get('location')
         if location_data and isinstance(location_data, dict):
-            from api.routes_places import _location_contexts
+            from api.routes_places import store_location_context
             from datetime import datetime
-            _location_contexts[session_id] = {
+            store_location_context(session_id, {
                 'latitude': location_data.get('latitude'),
                 'longitude': location_data.get('longitude'),
                 'city': location_data.get('city'),
@@ -141,7 +141,7 @@ def chat():
                 'speed': location_data.get('speed'),
                 'accuracy': location_data.get('accuracy'),
                 'updated_at': datetime.now().isoformat(),
-            }
+            })
             logger.info(f"📍 Location from /api/chat: {location_data.get('city')}, {location_data.get('region')} (session={session_id})")
 
         # Rate limiting
@@ -12,12 +12,19 @@ All data flows through consciousness loop for Assistant awareness.
 """
 
 import os
+import atexit
 import json
 import logging
+import time
+import threading
+from operator import itemgetter
 from datetime import datetime, timedelta
 from flask import Blueprint, request, jsonify
 from typing import Dict, Any, Optional, List
 
+from core.json_utils import parse_request_json
+from core.redis_client import SharedStateMap
+
 logger = logging.getLogger(__name__)
 
 guardian_bp = Blueprint('guardian', __name__, url_prefix='/api/guardian')
@@ -27,20 +34,122 @@ _consciousness_loop = None
 _state_manager = None
 _postgres_manager = None
 
-# In-memory tracking (will move to Redis/Postgres for production)
-_active_sessions: Dict[str, Dict] = {}
-_emergency_contacts: Dict[str, List[Dict]] = {}
+# Per-user Guardian state, shared across workers via Redis when REDIS_URL is
+# set (in-process dicts otherwise). Values are copies - write back after edits.
+_active_sessions = SharedStateMap("guardian:sessions")
+_emergency_contacts = SharedStateMap("guardian:contacts")
+
+# Striped per-user locks for read-modify-write on the maps above. Different
+# users rarely share a stripe, so there's no global lock to contend on.
+# (Serializes threads within a worker; cross-worker writes stay last-wins.)
+_USER_LOCK_STRIPES = 64
+_user_locks = [threading.Lock() for _ in range(_USER_LOCK_STRIPES)]
+
+# Heartbeat write-batcher: heartbeats are buffered and flushed to Postgres in
+# one multi-row INSERT instead of one round trip per heartbeat. Emergency
+# records bypass the buffer and are written synchronously. A failed batch is
+# put back (up to HEARTBEAT_BUFFER_MAX_ROWS, oldest dropped first) and the
+# buffer is flushed once more at interpreter exit.
+HEARTBEAT_FLUSH_INTERVAL_S = 2.0
+HEARTBEAT_FLUSH_MAX_ROWS = 500
+HEARTBEAT_BUFFER_MAX_ROWS = 10 * HEARTBEAT_FLUSH_MAX_ROWS
+_heartbeat_buffer: List[tuple] = []
+_heartbeat_lock = threading.Lock()
+_heartbeat_flush_event = threading.Event()
+_heartbeat_flusher: Optional[threading.Thread] = None
+
+# Fatigue alert threshold (session start_time is stored as epoch seconds)
+LONG_DRIVE_ALERT_S = 2 * 3600
 
 
 def init_guardian_routes(consciousness_loop, state_manager, postgres_manager=None):
     """Initialize Guardian routes with dependencies"""
-    global _consciousness_loop, _state_manager, _postgres_manager
+    global _consciousness_loop, _state_manager, _postgres_manager, _heartbeat_flusher
     _consciousness_loop = consciousness_loop
     _state_manager = state_manager
     _postgres_manager = postgres_manager
+
+    if _postgres_manager and _heartbeat_flusher is None:
+        _heartbeat_flusher = threading.Thread(
+            target=_heartbeat_flush_loop,
+            name="guardian-heartbeat-flush",
+            daemon=True
+        )
+        _heartbeat_flusher.start()
+        atexit.register(flush_heartbeats)
+
     logger.info("🛡️ Guardian Mode routes initialized")
 
 
+def _user_lock(user_id: str) -> threading.Lock:
+    """Return the lock stripe guarding a user's Guardian state"""
+    return _user_locks[hash(user_id) & (_USER_LOCK_STRIPES - 1)]
+
+
+def session_elapsed_seconds(session: Dict) -> float:
+    """Seconds since a Guardian session's start_time (epoch seconds)"""
+    start_time = session['start_time']
+    if isinstance(start_time, str):
+        # Sessions stored before start_time became epoch seconds
+        start_time = datetime.fromisoformat(start_time).timestamp()
+    return time.time() - start_time
+
+
+def _buffer_heartbeat(user_id: str, location: Dict, device: Dict):
+    """Queue a heartbeat row for the next batched Postgres flush"""
+    if not _postgres_manager:
+        return
+
+    row = (
+        user_id,
+        datetime.now(),
+        location.get('latitude'),
+        location.get('longitude'),
+        location.get('speed'),
+        device.get('battery_level'),
+    )
+    with _heartbeat_lock:
+        _heartbeat_buffer.append(row)
+        if len(_heartbeat_buffer) >= HEARTBEAT_FLUSH_MAX_ROWS:
+            _heartbeat_flush_event.set()
+
+
+def flush_heartbeats() -> int:
+    """Write all buffered heartbeats to Postgres in a single batch"""
+    global _heartbeat_buffer
+    with _heartbeat_lock:
+        if not _heartbeat_buffer:
+            return 0
+        rows, _heartbeat_buffer = _heartbeat_buffer, []
+
+    try:
+        return _postgres_manager.add_guardian_heartbeats(rows)
+    except Exception as e:
+        logger.error(f"❌ Failed to flush {len(rows)} Guardian heartbeats (re-queued): {e}")
+        _requeue_heartbeats(rows)
+        return 0
+
+
+def _requeue_heartbeats(rows: List[tuple]):
+    """Put a failed batch back ahead of newer rows, keeping the buffer bounded"""
+    global _heartbeat_buffer
+    with _heartbeat_lock:
+        _heartbeat_buffer = rows + _heartbeat_buffer
+        overflow = len(_heartbeat_buffer) - HEARTBEAT_BUFFER_MAX_ROWS
+        if overflow > 0:
+            del _heartbeat_buffer[:overflow]
+    if overflow > 0:
+        logger.warning(f"⚠️ Guardian heartbeat buffer full, dropped {overflow} oldest rows")
+
+
+def _heartbeat_flush_loop():
+    """Background flusher: drain the buffer every interval or when it fills"""
+    while True:
+        _heartbeat_flush_event.wait(HEARTBEAT_FLUSH_INTERVAL_S)
+        _heartbeat_flush_event.clear()
+        flush_heartbeats()
+
+
 # ============================================
 # HEARTBEAT - GPS/Motion Telemetry
 # ============================================
@@ -80,7 +189,9 @@ def guardian_heartbeat():
         }
     """
     try:
-        data = request.get_json()
+        data = parse_request_json(request)
+        if not isinstance(data, dict):
+            return jsonify({"error": "Invalid JSON body"}), 400
         
         user_id = data.get('user_id', 'User_Assistant')
         session_id = data.get('session_id')
@@ -88,31 +199,37 @@ def guardian_heartbeat():
         motion = data.get('motion', {})
         device = data.get('device', {})
         
-        # Update session tracking
-        session = _active_sessions.get(user_id, {
-            'start_time': datetime.now().isoformat(),
-            'heartbeat_count': 0,
-            'last_location': None,
-            'trip_distance_km': 0,
-            'alerts_sent': []
-        })
+        _buffer_heartbeat(user_id, location, device)
         
-        session['heartbeat_count'] += 1
-        session['last_heartbeat'] = datetime.now().isoformat()
-        session['last_location'] = location
-        session['last_motion'] = motion
-        session['battery_level'] = device.get('battery_level')
-        
-        _active_sessions[user_id] = session
-        
-        # Evaluate triggers
-        triggers = _evaluate_guardian_triggers(user_id, session, location, motion)
+        # Update session tracking
+        now_iso = datetime.now().isoformat()
+        with _user_lock(user_id):
+            session = _active_sessions.get(user_id)
+            if session is None:
+                session = {
+                    'start_time': time.time(),
+                    'heartbeat_count': 0,
+                    'last_location': None,
+                    'trip_distance_km': 0,
+                    'alerts_sent': []
+                }
+            
+            session['heartbeat_count'] += 1
+            session['last_heartbeat'] = now_iso
+            session['last_location'] = location
+            session['last_motion'] = motion
+            session['battery_level'] = device.get('battery_level')
+            
+            # Evaluate triggers (records fired alerts in session['alerts_sent'])
+            triggers = _evaluate_guardian_triggers(user_id, session, location, motion)
+            
+            _active_sessions[user_id] = session
         
         # Log significant events
         if triggers:
-            logger.warning(f"🚨 Guardian triggers for {user_id}: {triggers}")
-        else:
-            logger.debug(f"💚 Guardian heartbeat #{session['heartbeat_count']} from {user_id}")
+            logger.warning("🚨 Guardian triggers for %s: %s", user_id, triggers)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("💚 Guardian heartbeat #%d from %s", session['heartbeat_count'], user_id)
         
         return jsonify({
             "status": "ok",
@@ -150,10 +267,9 @@ def _evaluate_guardian_triggers(
         })
     
     # Check for long drive (fatigue)
-    start_time = datetime.fromisoformat(session['start_time'])
-    drive_duration = datetime.now() - start_time
+    drive_seconds = session_elapsed_seconds(session)
     
-    if drive_duration > timedelta(hours=2) and 'LONG_DRIVE_2H' not in session['alerts_sent']:
+    if drive_seconds > LONG_DRIVE_ALERT_S and 'LONG_DRIVE_2H' not in session['alerts_sent']:
         triggers.append({
             "type": "LONG_DRIVE",
             "severity": "medium",
@@ -415,19 +531,23 @@ def set_emergency_contacts():
         user_id = data.get('user_id', 'User_Assistant')
         contacts = data.get('contacts', [])
         
-        # Validate contacts
-        validated_contacts = []
-        for contact in contacts:
-            if contact.get('name') and contact.get('phone'):
-                validated_contacts.append({
-                    "name": contact['name'],
-                    "phone": contact['phone'],
-                    "relationship": contact.get('relationship', 'contact'),
-                    "priority": contact.get('priority', 99),
-                    "updated_at": datetime.now().isoformat()
-                })
+        # Validate contacts (one timestamp for the whole batch)
+        updated_at = datetime.now().isoformat()
+        validated_contacts = [
+            {
+                "name": contact['name'],
+                "phone": contact['phone'],
+                "relationship": contact.get('relationship', 'contact'),
+                "priority": contact.get('priority', 99),
+                "updated_at": updated_at
+            }
+            for contact in contacts
+            if contact.get('name') and contact.get('phone')
+        ]
+        validated_contacts.sort(key=itemgetter('priority'))
         
-        _emergency_contacts[user_id] = sorted(validated_contacts, key=lambda x: x['priority'])
+        with _user_lock(user_id):
+            _emergency_contacts[user_id] = validated_contacts
         
         logger.info(f"🛡️ Updated {len(validated_contacts)} emergency contacts for {user_id}")
         
@@ -460,11 +580,13 @@ def set_emergency_contacts():
 def delete_emergency_contact(index: int):
     """Delete a specific emergency contact"""
     user_id = request.args.get('user_id', 'User_Assistant')
-    contacts = _emergency_contacts.get(user_id, [])
+    with _user_lock(user_id):
+        contacts = _emergency_contacts.get(user_id, [])
+        removed = contacts.pop(index) if 0 <= index < len(contacts) else None
+        if removed is not None:
+            _emergency_contacts[user_id] = contacts
     
-    if 0 <= index < len(contacts):
-        removed = contacts.pop(index)
-        _emergency_contacts[user_id] = contacts
+    if removed is not None:
         logger.info(f"🗑️ Removed contact {removed['name']} for {user_id}")
         return jsonify({"status": "deleted", "removed": removed})
     
@@ -481,17 +603,19 @@ def start_guardian_session():
     data = request.get_json() or {}
     user_id = data.get('user_id', 'User_Assistant')
     
-    session_id = f"guardian_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    now = datetime.now()
+    session_id = f"guardian_{now.strftime('%Y%m%d%H%M%S')}"
     
-    _active_sessions[user_id] = {
-        'session_id': session_id,
-        'start_time': datetime.now().isoformat(),
-        'heartbeat_count': 0,
-        'last_location': None,
-        'trip_distance_km': 0,
-        'alerts_sent': [],
-        'status': 'active'
-    }
+    with _user_lock(user_id):
+        _active_sessions[user_id] = {
+            'session_id': session_id,
+            'start_time': now.timestamp(),
+            'heartbeat_count': 0,
+            'last_location': None,
+            'trip_distance_km': 0,
+            'alerts_sent': [],
+            'status': 'active'
+        }
     
     logger.info(f"🛡️ Guardian session started for {user_id}: {session_id}")
     
@@ -508,20 +632,20 @@ def end_guardian_session():
     data = request.get_json() or {}
     user_id = data.get('user_id', 'User_Assistant')
     
-    session = _active_sessions.pop(user_id, None)
+    with _user_lock(user_id):
+        session = _active_sessions.pop(user_id, None)
     
     if session:
         # Calculate session stats
-        start_time = datetime.fromisoformat(session['start_time'])
-        duration = datetime.now() - start_time
+        duration_s = session_elapsed_seconds(session)
         
         logger.info(f"🛡️ Guardian session ended for {user_id}")
-        logger.info(f"📊 Duration: {duration}, Heartbeats: {session['heartbeat_count']}")
+        logger.info(f"📊 Duration: {timedelta(seconds=int(duration_s))}, Heartbeats: {session['heartbeat_count']}")
         
         return jsonify({
             "status": "ended",
             "session_id": session.get('session_id'),
-            "duration_minutes": int(duration.total_seconds() / 60),
+            "duration_minutes": int(duration_s / 60),
             "heartbeat_count": session['heartbeat_count'],
             "alerts_triggered": len(session['alerts_sent']),
             "message": "Guardian Mode off. You made it safe. Rest well, flame."
@@ -540,13 +664,10 @@ def get_guardian_status():
     session = _active_sessions.get(user_id)
     
     if session:
-        start_time = datetime.fromisoformat(session['start_time'])
-        duration = datetime.now() - start_time
-        
         return jsonify({
             "active": True,
             "session_id": session.get('session_id'),
-            "duration_minutes": int(duration.total_seconds() / 60),
+            "duration_minutes": int(session_elapsed_seconds(session) / 60),
             "heartbeat_count": session['heartbeat_count'],
             "last_location": session.get('last_location'),
             "battery_level": session.get('battery_level'),
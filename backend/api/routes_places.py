@@ -11,17 +11,32 @@ Endpoints:
 - GET  /api/places/details/:id  - Get place details
 - POST /api/guardian/find-gas   - Guardian Mode: Find gas stations
 - POST /api/guardian/find-hotel - Guardian Mode: Find hotels
+- POST /api/guardian/find-stops - Guardian Mode: Gas + hotels in parallel
 - POST /api/location/context    - Update user location context
 
 Requires: GOOGLE_PLACES_API_KEY environment variable
 """
 
 import os
+import re
+import gzip
+import time
 import logging
+import threading
 import requests
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Blueprint, jsonify, request
-from typing import Dict, Any, List, Optional
+from flask import Blueprint, Response, jsonify, request
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
+
+from api.content_encoding import accepts_gzip
+from core.json_utils import loads
+from core.redis_client import get_redis, SharedStateMap
+from core.http_pool import create_pooled_session
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +47,247 @@ places_bp = Blueprint('places', __name__)
 GOOGLE_PLACES_API_KEY = os.getenv('GOOGLE_PLACES_API_KEY', '')
 GOOGLE_PLACES_BASE_URL = 'https://maps.googleapis.com/maps/api/place'
 
-# Location context storage (in-memory, per-session)
-# In production, this could use Redis or the state manager
-_location_contexts: Dict[str, Dict[str, Any]] = {}
+# Query params shared by every Google call (read-only, merged per request)
+_BASE_PARAMS = MappingProxyType({'key': GOOGLE_PLACES_API_KEY})
+
+# Prebuilt bodies for the common short-circuit errors
+_KEY_MISSING_BODY = b'{"error":"Google Places API not configured","results":[],"status":"API_KEY_MISSING"}'
+_MISSING_LATLNG_BODY = b'{"error":"valid latitude and longitude required"}'
+
+if not GOOGLE_PLACES_API_KEY:
+    logger.warning("⚠️ Google Places API key not configured - Places/Guardian search disabled")
+
+# Keep-alive connection pool to maps.googleapis.com (no TLS handshake per call).
+# requests already asks Google for gzip and decodes it transparently.
+_http = create_pooled_session()
+
+# Gzip forwarded Google bodies for clients that accept it
+PASSTHROUGH_GZIP_MIN_BYTES = 1024
+PASSTHROUGH_GZIP_LEVEL = 5
+
+# Nearby-search response cache (Redis when REDIS_URL is set, else in-process).
+# Keyed by geohash cell (precision 6 ≈ 1.2 km) + query params.
+PLACES_CACHE_TTL = int(os.getenv('PLACES_CACHE_TTL', '600'))  # seconds, 0 = off
+PLACES_GEOHASH_PRECISION = 6
+_LOCAL_CACHE_MAX = 1024
+_local_cache: Dict[str, Tuple[float, bytes]] = {}
+_local_cache_lock = threading.Lock()
+
+# Only successful Google payloads are cached (not REQUEST_DENIED etc.)
+_CACHEABLE_STATUS = re.compile(rb'"status"\s*:\s*"(?:OK|ZERO_RESULTS)"')
+_ZERO_RESULTS_STATUS = re.compile(rb'"status"\s*:\s*"ZERO_RESULTS"')
+
+# Single-flight: concurrent identical nearby searches share one upstream call.
+# Each entry is {"event": threading.Event, "result": (status, body) | None}.
+SINGLE_FLIGHT_WAIT_S = 10
+_inflight: Dict[str, Dict[str, Any]] = {}
+_inflight_lock = threading.Lock()
+
+# Location context storage (per-session). Shared across workers via Redis
+# when REDIS_URL is set, expiring an hour after the last update.
+LOCATION_CONTEXT_TTL = 3600
+_location_contexts = SharedStateMap("loc", ttl=LOCATION_CONTEXT_TTL)
+
+
+def _json_passthrough(body: bytes) -> Response:
+    """
+    Forward an upstream Google JSON body untouched.
+
+    Google's payload is already a superset of our response shape
+    ({"results"/"result", "status", ...}), so there's no need to decode
+    and re-encode it. Content-Length is set from the bytes up front and
+    direct_passthrough hands the body to the WSGI server without Werkzeug's
+    encoding iterator wrapped around it.
+
+    Bodies over PASSTHROUGH_GZIP_MIN_BYTES are gzipped for clients that
+    accept it (nearby results shrink ~70-80%, which matters on mobile data).
+    """
+    headers = {'Vary': 'Accept-Encoding'}
+    if len(body) >= PASSTHROUGH_GZIP_MIN_BYTES and accepts_gzip():
+        body = gzip.compress(body, compresslevel=PASSTHROUGH_GZIP_LEVEL)
+        headers['Content-Encoding'] = 'gzip'
+    return Response(body, mimetype='application/json', headers=headers, direct_passthrough=True)
+
+
+def _key_missing() -> Response:
+    """503 for when GOOGLE_PLACES_API_KEY isn't set"""
+    return Response(_KEY_MISSING_BODY, status=503, mimetype='application/json')
+
+
+def _missing_latlng() -> Response:
+    """400 for a POST without usable coordinates (no GPS fix, junk body)"""
+    return Response(_MISSING_LATLNG_BODY, status=400, mimetype='application/json')
+
+
+def _request_latlng(data: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """
+    (latitude, longitude) from a request body as floats.
+
+    Accepts numbers or numeric strings ("37.77"). Returns None when either is
+    missing, non-numeric, NaN or out of range - callers answer _missing_latlng().
+    """
+    try:
+        latitude = float(data['latitude'])
+        longitude = float(data['longitude'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    # Range checks are False for NaN, so it's rejected here too
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+        return None
+    return latitude, longitude
+
+
+def _request_body() -> Dict[str, Any]:
+    """POST body as a dict - {} when empty or malformed instead of raising"""
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else {}
+
+
+_GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def _geohash(lat: float, lng: float, precision: int = PLACES_GEOHASH_PRECISION) -> str:
+    """Encode a coordinate as a geohash string"""
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if lng >= mid:
+                bits = (bits << 1) | 1
+                lng_lo = mid
+            else:
+                bits <<= 1
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_lo = mid
+            else:
+                bits <<= 1
+                lat_hi = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(chars)
+
+
+def _cache_get(key: str) -> Optional[bytes]:
+    """Look up a cached Places body"""
+    r = get_redis()
+    if r is not None:
+        try:
+            return r.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis get failed for {key}: {e}")
+            return None
+
+    with _local_cache_lock:
+        entry = _local_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        _local_cache.pop(key, None)
+    return None
+
+
+def _cache_set(key: str, body: bytes):
+    """Store a Places body for PLACES_CACHE_TTL seconds"""
+    r = get_redis()
+    if r is not None:
+        try:
+            r.setex(key, PLACES_CACHE_TTL, body)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis setex failed for {key}: {e}")
+        return
+
+    with _local_cache_lock:
+        if len(_local_cache) >= _LOCAL_CACHE_MAX:
+            # Drop the oldest insertion (dicts keep insertion order)
+            _local_cache.pop(next(iter(_local_cache)))
+        _local_cache[key] = (time.monotonic() + PLACES_CACHE_TTL, body)
+
+
+def _nearby_search(latitude: float, longitude: float, params: Dict[str, str]) -> Tuple[int, bytes]:
+    """
+    Google nearbysearch with a geohash-bucketed response cache.
+
+    Args:
+        latitude/longitude: Search center
+        params: Extra query params (radius, type, keyword, opennow)
+
+    Returns:
+        (http_status, body_bytes)
+    """
+    query = '&'.join(f"{k}={v}" for k, v in sorted(params.items()))
+    cache_key = f"places:nearby:{_geohash(latitude, longitude)}:{query}"
+
+    if PLACES_CACHE_TTL > 0:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            logger.debug("📦 Places cache hit: %s", cache_key)
+            return 200, cached
+
+    # Join an identical in-flight request if there is one
+    with _inflight_lock:
+        flight = _inflight.get(cache_key)
+        leader = flight is None
+        if leader:
+            flight = {"event": threading.Event(), "result": None}
+            _inflight[cache_key] = flight
+
+    if not leader:
+        if flight["event"].wait(SINGLE_FLIGHT_WAIT_S) and flight["result"] is not None:
+            logger.debug("🔗 Places single-flight join: %s", cache_key)
+            return flight["result"]
+        # Leader failed or timed out - fall through and fetch ourselves
+
+    try:
+        response = _http.get(
+            f"{GOOGLE_PLACES_BASE_URL}/nearbysearch/json",
+            params={
+                **_BASE_PARAMS,
+                'location': f"{latitude},{longitude}",
+                **params
+            },
+            timeout=10
+        )
+        body = response.content
+
+        if PLACES_CACHE_TTL > 0 and response.ok and _CACHEABLE_STATUS.search(body):
+            _cache_set(cache_key, body)
+
+        result = (response.status_code, body)
+        if leader:
+            flight["result"] = result
+        return result
+    finally:
+        if leader:
+            flight["event"].set()
+            with _inflight_lock:
+                _inflight.pop(cache_key, None)
+
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _haversine_km(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """Great-circle distance in km from (lat, lng) to each point in lats/lngs"""
+    lat1 = np.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlng = np.radians(lngs - lng)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
 
 # ============================================
@@ -56,39 +309,30 @@ def search_nearby_places():
         "open_now": true          // optional, only open places
     }
     
-    Response:
+    Response (Google's nearbysearch body, forwarded as-is):
     {
         "results": [...],
-        "status": "OK"
+        "status": "OK",
+        ...
     }
     """
     if not GOOGLE_PLACES_API_KEY:
-        logger.warning("⚠️ Google Places API key not configured")
-        return jsonify({
-            "error": "Google Places API not configured",
-            "results": [],
-            "status": "API_KEY_MISSING"
-        }), 503
+        return _key_missing()
     
     try:
-        data = request.get_json()
+        data = _request_body()
         
-        latitude = data.get('latitude')
-        longitude = data.get('longitude')
+        coords = _request_latlng(data)
+        if coords is None:
+            return _missing_latlng()
+        latitude, longitude = coords
         radius = data.get('radius', 5000)
         place_type = data.get('type')
         keyword = data.get('keyword')
         open_now = data.get('open_now', False)
         
-        if not latitude or not longitude:
-            return jsonify({"error": "latitude and longitude required"}), 400
-        
         # Build Google Places API request
-        params = {
-            'location': f"{latitude},{longitude}",
-            'radius': str(radius),
-            'key': GOOGLE_PLACES_API_KEY
-        }
+        params = {'radius': str(radius)}
         
         if place_type:
             params['type'] = place_type
@@ -97,32 +341,20 @@ def search_nearby_places():
         if open_now:
             params['opennow'] = 'true'
         
-        # Call Google Places API
-        response = requests.get(
-            f"{GOOGLE_PLACES_BASE_URL}/nearbysearch/json",
-            params=params,
-            timeout=10
-        )
+        # Call Google Places API (cached)
+        status_code, body = _nearby_search(latitude, longitude, params)
         
-        if not response.ok:
-            logger.error(f"Google Places API error: {response.status_code}")
+        if status_code != 200:
+            logger.error(f"Google Places API error: {status_code}")
             return jsonify({
-                "error": f"Google Places API error: {response.status_code}",
+                "error": f"Google Places API error: {status_code}",
                 "results": [],
                 "status": "API_ERROR"
             }), 500
         
-        data = response.json()
-        
-        if data.get('status') not in ['OK', 'ZERO_RESULTS']:
-            logger.warning(f"Google Places API status: {data.get('status')}")
-        
-        logger.info(f"🔍 Places search: {place_type or keyword} near {latitude},{longitude} - {len(data.get('results', []))} results")
+        logger.info(f"🔍 Places search: {place_type or keyword} near {latitude},{longitude} - {len(body)} bytes")
         
-        return jsonify({
-            "results": data.get('results', []),
-            "status": data.get('status', 'OK')
-        })
+        return _json_passthrough(body)
     
     except requests.exceptions.Timeout:
         logger.error("Google Places API timeout")
@@ -149,18 +381,18 @@ def get_place_details(place_id: str):
     Response includes: name, address, phone, website, hours, reviews, etc.
     """
     if not GOOGLE_PLACES_API_KEY:
-        return jsonify({"error": "Google Places API not configured"}), 503
+        return _key_missing()
     
     try:
         # Fields to request (controls billing)
         fields = request.args.get('fields', 'name,formatted_address,formatted_phone_number,website,opening_hours,rating,reviews,price_level,geometry')
         
-        response = requests.get(
+        response = _http.get(
             f"{GOOGLE_PLACES_BASE_URL}/details/json",
             params={
+                **_BASE_PARAMS,
                 'place_id': place_id,
-                'fields': fields,
-                'key': GOOGLE_PLACES_API_KEY
+                'fields': fields
             },
             timeout=10
         )
@@ -168,14 +400,9 @@ def get_place_details(place_id: str):
         if not response.ok:
             return jsonify({"error": f"API error: {response.status_code}"}), 500
         
-        data = response.json()
-        
         logger.info(f"📍 Place details retrieved for: {place_id}")
         
-        return jsonify({
-            "result": data.get('result', {}),
-            "status": data.get('status', 'OK')
-        })
+        return _json_passthrough(response.content)
     
     except Exception as e:
         logger.error(f"❌ Place details error: {e}", exc_info=True)
@@ -186,6 +413,123 @@ def get_place_details(place_id: str):
 # GUARDIAN MODE ENDPOINTS
 # ============================================
 
+# Gas search radius by urgency: (query param string, meters)
+GAS_RADIUS_BY_URGENCY = MappingProxyType({
+    'low': ('5000', 5000),
+    'medium': ('10000', 10000),
+    'high': ('15000', 15000),
+    'critical': ('25000', 25000)
+})
+
+# Small pool for fanning out independent Places searches in one request
+_fanout_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='places-fanout')
+
+
+class PlacesUpstreamError(Exception):
+    """Google Places returned a non-200 response"""
+
+
+def _find_gas_stations(latitude: float, longitude: float, urgency: str) -> Dict[str, Any]:
+    """Search open gas stations and annotate them with distance/ETA"""
+    radius_param, radius = GAS_RADIUS_BY_URGENCY.get(urgency, GAS_RADIUS_BY_URGENCY['medium'])
+    
+    # Search for gas stations (cached)
+    status_code, body = _nearby_search(latitude, longitude, {
+        'radius': radius_param,
+        'type': 'gas_station',
+        'opennow': 'true'
+    })
+    
+    if status_code != 200:
+        raise PlacesUpstreamError(status_code)
+    
+    # Out of coverage (rural roads, late at night): nothing to decode or enhance
+    if _ZERO_RESULTS_STATUS.search(body):
+        logger.info(f"⛽ Guardian find-gas: no stations within {radius/1000}km")
+        return {
+            "results": [],
+            "urgency": urgency,
+            "radius_km": radius / 1000,
+            "status": "ZERO_RESULTS"
+        }
+    
+    places_data = loads(body)
+    results = places_data.get('results', [])
+    
+    # Enhance results with distance estimates (top 10 with coordinates)
+    places = []
+    for place in results[:10]:
+        loc = place.get('geometry', {}).get('location', {})
+        if loc.get('lat') and loc.get('lng'):
+            places.append((place, loc['lat'], loc['lng']))
+    
+    enhanced_results = []
+    if places:
+        distances = _haversine_km(
+            latitude, longitude,
+            np.fromiter((p[1] for p in places), dtype=np.float64, count=len(places)),
+            np.fromiter((p[2] for p in places), dtype=np.float64, count=len(places))
+        )
+        
+        for (place, _, _), distance_km in zip(places, distances.tolist()):
+            # Estimate drive time (assuming 40 km/h average in urban areas)
+            eta_minutes = int(distance_km / 40 * 60)
+            
+            enhanced_results.append({
+                **place,
+                'distance_km': round(distance_km, 2),
+                'eta_minutes': eta_minutes,
+                'eta_text': f"{eta_minutes} min" if eta_minutes < 60 else f"{eta_minutes // 60}h {eta_minutes % 60}m"
+            })
+    
+    # Sort by distance
+    enhanced_results.sort(key=itemgetter('distance_km'))
+    
+    logger.info(f"⛽ Guardian find-gas: {len(enhanced_results)} stations within {radius/1000}km")
+    
+    return {
+        "results": enhanced_results,
+        "urgency": urgency,
+        "radius_km": radius / 1000,
+        "status": places_data.get('status', 'OK')
+    }
+
+
+def _find_hotels(latitude: float, longitude: float, price_level: Optional[int]) -> Dict[str, Any]:
+    """Search lodging within 15km, optionally capped by price level"""
+    status_code, body = _nearby_search(latitude, longitude, {
+        'radius': '15000',  # 15km
+        'type': 'lodging'
+    })
+    
+    if status_code != 200:
+        raise PlacesUpstreamError(status_code)
+    
+    if _ZERO_RESULTS_STATUS.search(body):
+        logger.info("🏨 Guardian find-hotel: no hotels found")
+        return {"results": [], "status": "ZERO_RESULTS"}
+    
+    places_data = loads(body)
+    results = places_data.get('results', [])
+    
+    # Optional filters, all applied in one lazy pass that stops at 10 matches
+    predicates = []
+    if price_level:
+        predicates.append(lambda r: r.get('price_level', 2) <= price_level)
+    
+    if predicates:
+        results = list(islice((r for r in results if all(p(r) for p in predicates)), 10))
+    else:
+        results = results[:10]
+    
+    logger.info(f"🏨 Guardian find-hotel: {len(results)} hotels found")
+    
+    return {
+        "results": results,
+        "status": places_data.get('status', 'OK')
+    }
+
+
 @places_bp.route('/api/guardian/find-gas', methods=['POST'])
 def guardian_find_gas():
     """
@@ -207,84 +551,21 @@ def guardian_find_gas():
     Response includes distance and ETA estimates.
     """
     if not GOOGLE_PLACES_API_KEY:
-        return jsonify({"error": "Google Places API not configured"}), 503
+        return _key_missing()
     
     try:
-        data = request.get_json()
+        data = _request_body()
         
-        latitude = data.get('latitude')
-        longitude = data.get('longitude')
+        coords = _request_latlng(data)
+        if coords is None:
+            return _missing_latlng()
+        latitude, longitude = coords
         urgency = data.get('urgency', 'medium')
         
-        if not latitude or not longitude:
-            return jsonify({"error": "latitude and longitude required"}), 400
-        
-        # Set radius based on urgency
-        radius_map = {
-            'low': 5000,
-            'medium': 10000,
-            'high': 15000,
-            'critical': 25000
-        }
-        radius = radius_map.get(urgency, 10000)
-        
-        # Search for gas stations
-        response = requests.get(
-            f"{GOOGLE_PLACES_BASE_URL}/nearbysearch/json",
-            params={
-                'location': f"{latitude},{longitude}",
-                'radius': str(radius),
-                'type': 'gas_station',
-                'opennow': 'true',
-                'key': GOOGLE_PLACES_API_KEY
-            },
-            timeout=10
-        )
-        
-        if not response.ok:
-            return jsonify({"error": "API error"}), 500
-        
-        places_data = response.json()
-        results = places_data.get('results', [])
-        
-        # Enhance results with distance estimates
-        enhanced_results = []
-        for place in results[:10]:  # Limit to top 10
-            place_lat = place.get('geometry', {}).get('location', {}).get('lat')
-            place_lng = place.get('geometry', {}).get('location', {}).get('lng')
-            
-            # Simple distance calculation (Haversine would be more accurate)
-            if place_lat and place_lng:
-                import math
-                R = 6371  # Earth's radius in km
-                dlat = math.radians(place_lat - latitude)
-                dlng = math.radians(place_lng - longitude)
-                a = math.sin(dlat/2)**2 + math.cos(math.radians(latitude)) * math.cos(math.radians(place_lat)) * math.sin(dlng/2)**2
-                c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-                distance_km = R * c
-                
-                # Estimate drive time (assuming 40 km/h average in urban areas)
-                eta_minutes = int(distance_km / 40 * 60)
-                
-                enhanced_results.append({
-                    **place,
-                    'distance_km': round(distance_km, 2),
-                    'eta_minutes': eta_minutes,
-                    'eta_text': f"{eta_minutes} min" if eta_minutes < 60 else f"{eta_minutes // 60}h {eta_minutes % 60}m"
-                })
-        
-        # Sort by distance
-        enhanced_results.sort(key=lambda x: x.get('distance_km', 999))
-        
-        logger.info(f"⛽ Guardian find-gas: {len(enhanced_results)} stations within {radius/1000}km")
-        
-        return jsonify({
-            "results": enhanced_results,
-            "urgency": urgency,
-            "radius_km": radius / 1000,
-            "status": places_data.get('status', 'OK')
-        })
+        return jsonify(_find_gas_stations(latitude, longitude, urgency))
     
+    except PlacesUpstreamError:
+        return jsonify({"error": "API error"}), 500
     except Exception as e:
         logger.error(f"❌ Guardian find-gas error: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
@@ -303,50 +584,83 @@ def guardian_find_hotel():
     }
     """
     if not GOOGLE_PLACES_API_KEY:
-        return jsonify({"error": "Google Places API not configured"}), 503
+        return _key_missing()
     
     try:
-        data = request.get_json()
+        data = _request_body()
         
-        latitude = data.get('latitude')
-        longitude = data.get('longitude')
+        coords = _request_latlng(data)
+        if coords is None:
+            return _missing_latlng()
+        latitude, longitude = coords
         price_level = data.get('price_level')
         
-        if not latitude or not longitude:
-            return jsonify({"error": "latitude and longitude required"}), 400
+        return jsonify(_find_hotels(latitude, longitude, price_level))
+    
+    except PlacesUpstreamError:
+        return jsonify({"error": "API error"}), 500
+    except Exception as e:
+        logger.error(f"❌ Guardian find-hotel error: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
+@places_bp.route('/api/guardian/find-stops', methods=['POST'])
+def guardian_find_stops():
+    """
+    Guardian Mode: Find gas stations and hotels in one round trip.
+    
+    Both Places searches run concurrently, so latency is the slower of
+    the two rather than their sum.
+    
+    Request:
+    {
+        "latitude": 37.7749,
+        "longitude": -122.4194,
+        "urgency": "medium",      // gas search radius, see find-gas
+        "price_level": 2          // hotel filter, optional
+    }
+    
+    Response:
+    {
+        "gas": {...},             // same shape as find-gas
+        "hotels": {...}           // same shape as find-hotel
+    }
+    
+    A failed search is reported as {"error": "..."} in its own slot
+    without failing the other.
+    """
+    if not GOOGLE_PLACES_API_KEY:
+        return _key_missing()
+    
+    try:
+        data = _request_body()
         
-        params = {
-            'location': f"{latitude},{longitude}",
-            'radius': '15000',  # 15km
-            'type': 'lodging',
-            'key': GOOGLE_PLACES_API_KEY
-        }
+        coords = _request_latlng(data)
+        if coords is None:
+            return _missing_latlng()
+        latitude, longitude = coords
         
-        response = requests.get(
-            f"{GOOGLE_PLACES_BASE_URL}/nearbysearch/json",
-            params=params,
-            timeout=10
+        gas_future = _fanout_executor.submit(
+            _find_gas_stations, latitude, longitude, data.get('urgency', 'medium')
+        )
+        hotel_future = _fanout_executor.submit(
+            _find_hotels, latitude, longitude, data.get('price_level')
         )
         
-        if not response.ok:
-            return jsonify({"error": "API error"}), 500
-        
-        places_data = response.json()
-        results = places_data.get('results', [])
-        
-        # Filter by price level if specified
-        if price_level:
-            results = [r for r in results if r.get('price_level', 2) <= price_level]
-        
-        logger.info(f"🏨 Guardian find-hotel: {len(results)} hotels found")
+        response = {}
+        for name, future in (('gas', gas_future), ('hotels', hotel_future)):
+            try:
+                response[name] = future.result()
+            except PlacesUpstreamError:
+                response[name] = {"error": "API error"}
+            except Exception as e:
+                logger.error(f"❌ Guardian find-stops ({name}) error: {e}", exc_info=True)
+                response[name] = {"error": str(e)}
         
-        return jsonify({
-            "results": results[:10],
-            "status": places_data.get('status', 'OK')
-        })
+        return jsonify(response)
     
     except Exception as e:
-        logger.error(f"❌ Guardian find-hotel error: {e}", exc_info=True)
+        logger.error(f"❌ Guardian find-stops error: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -375,7 +689,7 @@ def update_location_context():
     where User is and can provide location-aware responses.
     """
     try:
-        data = request.get_json()
+        data = _request_body()
         
         session_id = data.get('session_id', 'default')
         
@@ -390,8 +704,7 @@ def update_location_context():
             'updated_at': datetime.now().isoformat()
         }
         
-        # Store in memory (could be Redis/DB in production)
-        _location_contexts[session_id] = location_context
+        store_location_context(session_id, location_context)
         
         logger.info(f"📍 Location updated for {session_id}: {location_context.get('city')}, {location_context.get('region')}")
         
@@ -428,17 +741,35 @@ def get_location_context():
     return jsonify({
         "status": "ok",
         "session_id": session_id,
-        "location": context
+        "location": _public_context(context)
     })
 
 
+def store_location_context(session_id: str, context: Dict[str, Any]):
+    """
+    Store a session's location context (Redis when configured, in-memory
+    otherwise) along with its prompt line, so the consciousness loop doesn't
+    rebuild it every turn. All writers go through here.
+    """
+    _location_contexts[session_id] = {
+        **context,
+        '_prompt': _format_location_prompt(context)
+    }
+
+
+def _public_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Strip internal cached fields (e.g. '_prompt') from a stored context"""
+    return {k: v for k, v in context.items() if not k.startswith('_')}
+
+
 def get_location_for_session(session_id: str) -> Optional[Dict[str, Any]]:
     """
     Helper function for other modules to get location context.
     
     Can be called from consciousness loop to inject location into prompts.
     """
-    return _location_contexts.get(session_id)
+    context = _location_contexts.get(session_id)
+    return _public_context(context) if context else context
 
 
 def format_location_for_prompt(session_id: str) -> str:
@@ -455,6 +786,15 @@ def format_location_for_prompt(session_id: str) -> str:
     if not context:
         return ""
     
+    prompt = context.get('_prompt')
+    if prompt is None:
+        # Entry written (e.g. to Redis) before store_location_context existed
+        prompt = _format_location_prompt(context)
+    return prompt
+
+
+def _format_location_prompt(context: Dict[str, Any]) -> str:
+    """Build the prompt line for a location context (see format_location_for_prompt)"""
     parts = []
     
     city = context.get('city')
@@ -13,7 +13,7 @@ import re
 from datetime import datetime
 from typing import Optional, Tuple, List, Dict, Any
 from core.sanctum_manager import get_sanctum_manager
-from api.routes_places import _location_contexts, build_location_context_block
+from api.routes_places import store_location_context, build_location_context_block
 
 logger = logging.getLogger(__name__)
 
@@ -156,7 +156,7 @@ def stream_chat():
         location_data = data.get('location')
         logger.info(f"📍 Request keys: {list(data.keys())}, has location: {location_data is not None}, session: {session_id}")
         if location_data and isinstance(location_data, dict):
-            _location_contexts[session_id] = {
+            store_location_context(session_id, {
                 'latitude': location_data.get('latitude'),
                 'longitude': location_data.get('longitude'),
                 'city': location_data.get('city'),
@@ -166,7 +166,7 @@ def stream_chat():
                 'speed': location_data.get('speed'),
                 'accuracy': location_data.get('accuracy'),
                 'updated_at': datetime.now().isoformat(),
-            }
+            })
             logger.info(f"📍 Location from chat request: {location_data.get('city')}, {location_data.get('region')} (session={session_id})")
 
         # 📍 Prepend a <message_context> block with current location metadata so
@@ -8,29 +8,51 @@ Supports multiple backends: Whisper (local), Deepgram, OpenAI Whisper API.
 Endpoints:
 - GET  /stt/health     - Health check for STT service
 - POST /stt            - Transcribe audio to text
-- POST /stt/stream     - Stream transcription (for real-time)
+- POST /stt/stream     - Stream transcription as SSE (Deepgram live)
 
 Recommended Setup:
 - Local Whisper server (faster-whisper or whisper.cpp) for free transcription
+- Or in-process faster-whisper (pip install faster-whisper) - no server hop
 - Or OpenAI Whisper API as fallback
 
 Environment Variables:
 - WHISPER_URL: Local Whisper server URL (default: http://localhost:9000)
 - WHISPER_MODEL: Model size (tiny, base, small, medium, large)
 - OPENAI_API_KEY: For OpenAI Whisper API fallback
-- STT_PROVIDER: 'whisper_local', 'openai', 'deepgram' (default: whisper_local)
+- WHISPER_DEVICE: faster_whisper device - auto, cpu, cuda (default: auto)
+- WHISPER_COMPUTE_TYPE: faster_whisper CTranslate2 compute type (default: int8)
+- STT_PROVIDER: 'whisper_local', 'faster_whisper', 'openai', 'deepgram' (default: whisper_local)
+- STT_MAX_UPLOAD_MB: Reject larger uploads with 413 (default: 25)
+- STT_CACHE_TTL: Seconds to cache transcripts by audio hash, 0 = off (default: 86400)
 """
 
-import os
 import io
+import os
+import time
+import queue
+import hashlib
 import logging
+import threading
 import requests
-from flask import Blueprint, Response, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Optional, Tuple
-import base64
+import binascii
+
+from core.http_pool import create_pooled_session
+from core.json_utils import loads, parse_request_json, dumps_bytes
+from core.redis_client import get_redis
 
 logger = logging.getLogger(__name__)
 
+# In-process Whisper (CTranslate2 int8/fp16 kernels) - optional
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
 stt_bp = Blueprint('stt', __name__)
 
 # STT Configuration
@@ -38,12 +60,50 @@ STT_PROVIDER = os.getenv('STT_PROVIDER', 'whisper_local')
 WHISPER_URL = os.getenv('WHISPER_URL', 'http://localhost:9000')
 WHISPER_MODEL = os.getenv('WHISPER_MODEL', 'base')
 WHISPER_TIMEOUT = int(os.getenv('WHISPER_TIMEOUT', '60'))
+WHISPER_DEVICE = os.getenv('WHISPER_DEVICE', 'auto')
+WHISPER_COMPUTE_TYPE = os.getenv('WHISPER_COMPUTE_TYPE', 'int8')  # int8_float16 / float16 on GPU
+STT_MAX_UPLOAD_BYTES = int(os.getenv('STT_MAX_UPLOAD_MB', '25')) * 1024 * 1024  # OpenAI Whisper API limit
+
+# Raw-body uploads up to this size are read into a reusable per-thread
+# buffer instead of a fresh bytes object per request
+STT_READ_BUFFER_BYTES = 1024 * 1024
+_read_buffers = threading.local()
+
+# /stt/stream: upload read size and how long to wait for Deepgram's last results
+STT_STREAM_CHUNK_SIZE = 8192
+STT_STREAM_FINISH_TIMEOUT = 5.0
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
 DEEPGRAM_API_KEY = os.getenv('DEEPGRAM_API_KEY', '')
 
-# Supported audio formats
-SUPPORTED_FORMATS = ['audio/wav', 'audio/mpeg', 'audio/mp3', 'audio/webm',
-                     'audio/ogg', 'audio/flac', 'audio/m4a', 'audio/x-wav']
+# Keep-alive connection pool for Whisper / OpenAI / Deepgram calls
+_http = create_pooled_session()
+
+# Transcript cache keyed by audio content hash (Redis when REDIS_URL is set,
+# else an in-process LRU). Clients resend the same clip after reconnects.
+STT_CACHE_TTL = int(os.getenv('STT_CACHE_TTL', '86400'))  # seconds, 0 = off
+STT_LOCAL_CACHE_MAX_ENTRIES = 512
+_local_transcript_cache: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, payload)
+_local_transcript_cache_lock = threading.Lock()
+
+# Supported audio formats (advertised in 415 responses; any audio/* is accepted)
+SUPPORTED_FORMATS = ('audio/wav', 'audio/mpeg', 'audio/mp3', 'audio/webm',
+                     'audio/ogg', 'audio/flac', 'audio/m4a', 'audio/x-wav')
+
+_ACCEPTED_CONTENT_TYPES = (*SUPPORTED_FORMATS, 'application/octet-stream',
+                           'application/json', 'multipart/form-data')
+
+# Upload filename extension by content type
+_EXT_MAP = MappingProxyType({
+    'audio/wav': 'wav',
+    'audio/x-wav': 'wav',
+    'audio/mpeg': 'mp3',
+    'audio/mp3': 'mp3',
+    'audio/webm': 'webm',
+    'audio/ogg': 'ogg',
+    'audio/flac': 'flac',
+    'audio/m4a': 'm4a',
+    'audio/mp4': 'mp4',
+})
 
 
 def _normalize_language_code(language: str) -> str:
@@ -79,7 +139,7 @@ def _check_whisper_health() -> dict:
         # Try common health endpoints
         for endpoint in ['/health', '/', '/v1/audio/transcriptions']:
             try:
-                response = requests.get(
+                response = _http.get(
                     f"{WHISPER_URL}{endpoint}",
                     timeout=5
                 )
@@ -124,22 +184,11 @@ def _transcribe_whisper_local(audio_data: bytes, content_type: str, language: st
     """
     try:
         # Determine file extension from content type
-        ext_map = {
-            'audio/wav': 'wav',
-            'audio/x-wav': 'wav',
-            'audio/mpeg': 'mp3',
-            'audio/mp3': 'mp3',
-            'audio/webm': 'webm',
-            'audio/ogg': 'ogg',
-            'audio/flac': 'flac',
-            'audio/m4a': 'm4a',
-            'audio/mp4': 'mp4',
-        }
-        ext = ext_map.get(content_type, 'wav')
+        ext = _EXT_MAP.get(content_type, 'wav')
 
-        # Build multipart form data
+        # Build multipart form data (raw bytes - no BytesIO copy of the clip)
         files = {
-            'file': (f'audio.{ext}', io.BytesIO(audio_data), content_type)
+            'file': (f'audio.{ext}', audio_data, content_type)
         }
         data = {
             'model': WHISPER_MODEL,
@@ -150,7 +199,7 @@ def _transcribe_whisper_local(audio_data: bytes, content_type: str, language: st
             data['language'] = _normalize_language_code(language)
 
         # Try OpenAI-compatible endpoint first (most common)
-        response = requests.post(
+        response = _http.post(
             f"{WHISPER_URL}/v1/audio/transcriptions",
             files=files,
             data=data,
@@ -158,24 +207,21 @@ def _transcribe_whisper_local(audio_data: bytes, content_type: str, language: st
         )
 
         if response.ok:
-            result = response.json()
+            result = loads(response.content)
             text = result.get('text', '').strip()
             logger.info(f"🎤 Whisper transcription: {len(text)} chars")
             return text, None
 
-        # Try alternative endpoint format - recreate BytesIO since it was consumed
-        files_retry = {
-            'file': (f'audio.{ext}', io.BytesIO(audio_data), content_type)
-        }
-        response = requests.post(
+        # Try alternative endpoint format (raw bytes, so the same files dict is reusable)
+        response = _http.post(
             f"{WHISPER_URL}/transcribe",
-            files=files_retry,
+            files=files,
             data=data,
             timeout=WHISPER_TIMEOUT
         )
 
         if response.ok:
-            result = response.json()
+            result = loads(response.content)
             text = result.get('text', result.get('transcription', '')).strip()
             return text, None
 
@@ -190,6 +236,53 @@ def _transcribe_whisper_local(audio_data: bytes, content_type: str, language: st
         return None, str(e)
 
 
+_WHISPER_MODEL = None
+_whisper_model_lock = threading.Lock()
+
+
+def _get_whisper_model():
+    """Load the faster-whisper model once per process (loading takes seconds)"""
+    global _WHISPER_MODEL
+    if _WHISPER_MODEL is None:
+        with _whisper_model_lock:
+            if _WHISPER_MODEL is None:
+                logger.info(f"🎤 Loading faster-whisper model '{WHISPER_MODEL}' "
+                            f"(device={WHISPER_DEVICE}, compute_type={WHISPER_COMPUTE_TYPE})")
+                _WHISPER_MODEL = WhisperModel(
+                    WHISPER_MODEL,
+                    device=WHISPER_DEVICE,
+                    compute_type=WHISPER_COMPUTE_TYPE
+                )
+    return _WHISPER_MODEL
+
+
+def _transcribe_faster_whisper(audio_data: bytes, content_type: str, language: str = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Transcribe audio in-process with faster-whisper (CTranslate2).
+
+    Skips the HTTP hop to a Whisper server; the container format is
+    decoded from the bytes, so content_type is unused.
+    """
+    if not FASTER_WHISPER_AVAILABLE:
+        return None, "faster-whisper not installed (pip install faster-whisper)"
+
+    try:
+        model = _get_whisper_model()
+        segments, _info = model.transcribe(
+            io.BytesIO(audio_data),
+            language=_normalize_language_code(language),
+            vad_filter=True
+        )
+        # segments is lazy - decoding happens while we iterate
+        text = "".join(segment.text for segment in segments).strip()
+        logger.info(f"🎤 faster-whisper transcription: {len(text)} chars")
+        return text, None
+
+    except Exception as e:
+        logger.exception(f"faster-whisper transcription error: {e}")
+        return None, str(e)
+
+
 def _transcribe_openai(audio_data: bytes, content_type: str, language: str = None) -> Tuple[Optional[str], Optional[str]]:
     """
     Transcribe audio using OpenAI Whisper API.
@@ -200,21 +293,10 @@ def _transcribe_openai(audio_data: bytes, content_type: str, language: str = Non
         return None, "OpenAI API key not configured"
 
     try:
-        ext_map = {
-            'audio/wav': 'wav',
-            'audio/x-wav': 'wav',
-            'audio/mpeg': 'mp3',
-            'audio/mp3': 'mp3',
-            'audio/webm': 'webm',
-            'audio/ogg': 'ogg',
-            'audio/flac': 'flac',
-            'audio/m4a': 'm4a',
-            'audio/mp4': 'mp4',
-        }
-        ext = ext_map.get(content_type, 'wav')
+        ext = _EXT_MAP.get(content_type, 'wav')
 
         files = {
-            'file': (f'audio.{ext}', io.BytesIO(audio_data), content_type)
+            'file': (f'audio.{ext}', audio_data, content_type)
         }
         data = {
             'model': 'whisper-1',
@@ -223,7 +305,7 @@ def _transcribe_openai(audio_data: bytes, content_type: str, language: str = Non
         if language:
             data['language'] = language
 
-        response = requests.post(
+        response = _http.post(
             'https://api.openai.com/v1/audio/transcriptions',
             headers={'Authorization': f'Bearer {OPENAI_API_KEY}'},
             files=files,
@@ -232,7 +314,7 @@ def _transcribe_openai(audio_data: bytes, content_type: str, language: str = Non
         )
 
         if response.ok:
-            result = response.json()
+            result = loads(response.content)
             text = result.get('text', '').strip()
             logger.info(f"🎤 OpenAI Whisper transcription: {len(text)} chars")
             return text, None
@@ -259,19 +341,19 @@ def _transcribe_deepgram(audio_data: bytes, content_type: str, language: str = N
         if language:
             params['language'] = language
 
-        response = requests.post(
+        response = _http.post(
             'https://api.deepgram.com/v1/listen',
             headers={
                 'Authorization': f'Token {DEEPGRAM_API_KEY}',
                 'Content-Type': content_type
             },
             params=params,
-            data=audio_data,
+            data=bytes(audio_data),  # requests needs bytes (not a memoryview) for a raw body
             timeout=60
         )
 
         if response.ok:
-            result = response.json()
+            result = loads(response.content)
             text = result.get('results', {}).get('channels', [{}])[0].get('alternatives', [{}])[0].get('transcript', '').strip()
             logger.info(f"🎤 Deepgram transcription: {len(text)} chars")
             return text, None
@@ -283,6 +365,51 @@ def _transcribe_deepgram(audio_data: bytes, content_type: str, language: str = N
         return None, str(e)
 
 
+def _transcript_cache_key(audio_data: bytes, language: Optional[str]) -> str:
+    """Cache key for a transcript (same clip in another language is a different entry)"""
+    digest = hashlib.blake2b(audio_data, digest_size=16).hexdigest()
+    return f"stt:{STT_PROVIDER}:{_normalize_language_code(language) or ''}:{digest}"
+
+
+def _transcript_cache_get(key: str) -> Optional[dict]:
+    """Look up a cached {"text", "provider"} result"""
+    r = get_redis()
+    if r is not None:
+        try:
+            raw = r.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis get failed for {key}: {e}")
+            return None
+        return loads(raw) if raw else None
+
+    with _local_transcript_cache_lock:
+        entry = _local_transcript_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _local_transcript_cache[key]
+            return None
+        _local_transcript_cache.move_to_end(key)
+        return entry[1]
+
+
+def _transcript_cache_set(key: str, result: dict):
+    """Store a transcript for STT_CACHE_TTL seconds"""
+    r = get_redis()
+    if r is not None:
+        try:
+            r.setex(key, STT_CACHE_TTL, dumps_bytes(result))
+        except Exception as e:
+            logger.warning(f"⚠️ Redis setex failed for {key}: {e}")
+        return
+
+    with _local_transcript_cache_lock:
+        _local_transcript_cache.pop(key, None)
+        _local_transcript_cache[key] = (time.monotonic() + STT_CACHE_TTL, result)
+        while len(_local_transcript_cache) > STT_LOCAL_CACHE_MAX_ENTRIES:
+            _local_transcript_cache.popitem(last=False)
+
+
 # ============================================
 # HEALTH CHECK
 # ============================================
@@ -306,6 +433,14 @@ def stt_health():
     """
     if STT_PROVIDER == 'whisper_local':
         health = _check_whisper_health()
+    elif STT_PROVIDER == 'faster_whisper':
+        health = {
+            "status": "healthy" if FASTER_WHISPER_AVAILABLE else "unavailable",
+            "provider": "faster_whisper",
+            "model": WHISPER_MODEL,
+            "loaded": _WHISPER_MODEL is not None,
+            "error": None if FASTER_WHISPER_AVAILABLE else "faster-whisper not installed"
+        }
     elif STT_PROVIDER == 'openai':
         health = {
             "status": "healthy" if OPENAI_API_KEY else "unavailable",
@@ -334,16 +469,59 @@ def stt_health():
 # SPEECH TO TEXT
 # ============================================
 
+def _read_raw_body():
+    """
+    Read the request body, into this thread's reusable buffer when it fits.
+
+    Returns a memoryview over that buffer (or bytes for large/unsized
+    bodies). The view is overwritten by this thread's next request, so it
+    must not outlive the response.
+    """
+    length = request.content_length
+    if not length or length > STT_READ_BUFFER_BYTES:
+        return request.get_data(cache=False)
+
+    buf = getattr(_read_buffers, 'buf', None)
+    if buf is None:
+        buf = _read_buffers.buf = bytearray(STT_READ_BUFFER_BYTES)
+
+    view = memoryview(buf)
+    stream = request.stream
+    filled = 0
+    while filled < length:
+        n = stream.readinto(view[filled:length])
+        if not n:
+            break
+        filled += n
+    return view[:filled]
+
+
+_base64_deprecation_logged = False
+
+
+def _warn_base64_deprecated():
+    """Log (once per process) that a client is still sending base64 JSON"""
+    global _base64_deprecation_logged
+    if not _base64_deprecation_logged:
+        _base64_deprecation_logged = True
+        logger.warning(
+            "⚠️ /stt base64 JSON uploads are deprecated - send raw audio "
+            "(Content-Type: audio/* or application/octet-stream) instead"
+        )
+
+
 @stt_bp.route('/stt', methods=['POST'])
 def speech_to_text():
     """
     Transcribe audio to text.
 
-    Request:
-        Content-Type: audio/wav (or other supported format)
+    Request (preferred - no base64 inflation or decode pass):
+        Content-Type: audio/wav (or other audio/* format)
+                      or application/octet-stream with ?format=webm
+        Query: ?language=en (optional)
         Body: Raw audio data
 
-        OR
+        OR (deprecated for mobile clients)
 
         Content-Type: application/json
         Body: {
@@ -356,50 +534,81 @@ def speech_to_text():
         {
             "text": "Transcribed text...",
             "provider": "whisper_local",
-            "duration_ms": 1234
+            "duration_ms": 1234,
+            "cached": false     // true when served from the transcript cache
         }
     """
-    import time
     start_time = time.time()
 
+    # Reject oversized uploads before reading/parsing the body
+    if request.content_length and request.content_length > STT_MAX_UPLOAD_BYTES:
+        return jsonify({
+            "error": f"Audio upload too large (max {STT_MAX_UPLOAD_BYTES // (1024 * 1024)} MB)",
+            "status": "error"
+        }), 413
+
     try:
         content_type = request.content_type or ''
+        mime_type = content_type.partition(';')[0].strip().lower()  # Remove charset/codecs/boundary
         audio_data = None
         audio_format = 'audio/wav'
         language = None
 
-        # Handle JSON request with base64 audio
-        if 'application/json' in content_type:
-            data = request.get_json() or {}
+        # Handle direct binary upload (preferred)
+        if mime_type.startswith('audio/') or mime_type == 'application/octet-stream':
+            audio_data = _read_raw_body()
+            if mime_type == 'application/octet-stream':
+                audio_format = f"audio/{request.args.get('format', 'wav')}"
+            else:
+                audio_format = mime_type
+            language = request.args.get('language')
+
+        # Handle JSON request with base64 audio (deprecated)
+        elif mime_type == 'application/json':
+            _warn_base64_deprecated()
+
+            # Parse without caching the raw body on the request, and take the
+            # base64 string out of the dict so it's freed right after decoding
+            data = parse_request_json(request)
+            if not isinstance(data, dict):
+                return jsonify({
+                    "error": "Invalid JSON body",
+                    "status": "error"
+                }), 400
 
-            audio_b64 = data.get('audio')
+            audio_b64 = data.pop('audio', None)
             if not audio_b64:
                 return jsonify({
                     "error": "No audio data provided",
                     "status": "error"
                 }), 400
 
+            if not isinstance(audio_b64, str):
+                return jsonify({
+                    "error": "Invalid base64 audio: expected a string",
+                    "status": "error"
+                }), 400
+
+            # Accept data URLs too ("data:audio/webm;base64,....")
+            if audio_b64.startswith('data:'):
+                audio_b64 = audio_b64.partition(',')[2]
+
             try:
-                audio_data = base64.b64decode(audio_b64)
-            except Exception as e:
+                audio_data = binascii.a2b_base64(audio_b64)
+            except (binascii.Error, ValueError) as e:
                 return jsonify({
                     "error": f"Invalid base64 audio: {e}",
                     "status": "error"
                 }), 400
+            del audio_b64
 
             # Get format from request
             fmt = data.get('format', 'wav')
             audio_format = f'audio/{fmt}'
             language = data.get('language')
 
-        # Handle direct audio upload
-        elif any(fmt in content_type for fmt in SUPPORTED_FORMATS):
-            audio_data = request.get_data()
-            audio_format = content_type.split(';')[0]  # Remove charset if present
-            language = request.args.get('language')
-
         # Handle multipart form data
-        elif 'multipart/form-data' in content_type:
+        elif mime_type == 'multipart/form-data':
             if 'audio' not in request.files:
                 return jsonify({
                     "error": "No audio file in request",
@@ -408,14 +617,14 @@ def speech_to_text():
 
             audio_file = request.files['audio']
             audio_data = audio_file.read()
-            audio_format = audio_file.content_type or 'audio/wav'
+            audio_format = audio_file.mimetype or 'audio/wav'  # parameters stripped, lowercased
             language = request.form.get('language')
 
         else:
             return jsonify({
                 "error": f"Unsupported content type: {content_type}",
                 "status": "error",
-                "supported": SUPPORTED_FORMATS + ['application/json', 'multipart/form-data']
+                "supported": _ACCEPTED_CONTENT_TYPES
             }), 415
 
         if not audio_data or len(audio_data) < 100:
@@ -426,6 +635,20 @@ def speech_to_text():
 
         logger.info(f"🎤 STT request: {len(audio_data)} bytes, format={audio_format}, provider={STT_PROVIDER}")
 
+        cache_key = _transcript_cache_key(audio_data, language) if STT_CACHE_TTL > 0 else None
+        cached = _transcript_cache_get(cache_key) if cache_key else None
+        if cached is not None:
+            duration_ms = int((time.time() - start_time) * 1000)
+            logger.info(f"✅ STT cache hit: '{cached['text'][:50]}...' ({duration_ms}ms)")
+            return jsonify({
+                "text": cached['text'],
+                "status": "success",
+                "provider": cached['provider'],
+                "duration_ms": duration_ms,
+                "audio_bytes": len(audio_data),
+                "cached": True
+            })
+
         # Transcribe based on provider
         text = None
         error = None
@@ -440,6 +663,14 @@ def speech_to_text():
                 text, error = _transcribe_openai(audio_data, audio_format, language)
                 provider_used = 'openai_fallback'
 
+        elif STT_PROVIDER == 'faster_whisper':
+            text, error = _transcribe_faster_whisper(audio_data, audio_format, language)
+
+            if error and OPENAI_API_KEY:
+                logger.warning(f"faster-whisper failed, falling back to OpenAI: {error}")
+                text, error = _transcribe_openai(audio_data, audio_format, language)
+                provider_used = 'openai_fallback'
+
         elif STT_PROVIDER == 'openai':
             text, error = _transcribe_openai(audio_data, audio_format, language)
 
@@ -465,12 +696,16 @@ def speech_to_text():
 
         logger.info(f"✅ STT success: '{text[:50]}...' ({duration_ms}ms)")
 
+        if cache_key:
+            _transcript_cache_set(cache_key, {"text": text, "provider": provider_used})
+
         return jsonify({
             "text": text,
             "status": "success",
             "provider": provider_used,
             "duration_ms": duration_ms,
-            "audio_bytes": len(audio_data)
+            "audio_bytes": len(audio_data),
+            "cached": False
         })
 
     except Exception as e:
@@ -481,6 +716,121 @@ def speech_to_text():
         }), 500
 
 
+# ============================================
+# STREAMING SPEECH TO TEXT (Deepgram)
+# ============================================
+
+@stt_bp.route('/stt/stream', methods=['POST'])
+def speech_to_text_stream():
+    """
+    Stream transcripts back as Server-Sent Events while audio uploads.
+
+    Audio is forwarded to Deepgram's live WebSocket as it arrives (send it
+    with chunked transfer for real-time use), and interim/final transcripts
+    are relayed as they come back instead of after the whole utterance.
+
+    Request:
+        Content-Type: audio/webm (or other audio/*), body: raw audio
+        Query:
+            language=en            (optional)
+            encoding=linear16      (optional, raw PCM only - omit for
+            sample_rate=16000       containers like webm/ogg/wav)
+
+    Response (text/event-stream):
+        data: {"text": "hello", "is_final": false}
+        data: {"text": "Hello there.", "is_final": true}
+        data: {"text": "Hello there.", "is_final": true, "done": true}
+    """
+    if not DEEPGRAM_API_KEY:
+        return jsonify({
+            "error": "Streaming STT requires DEEPGRAM_API_KEY",
+            "status": "error"
+        }), 503
+
+    if request.content_length and request.content_length > STT_MAX_UPLOAD_BYTES:
+        return jsonify({
+            "error": f"Audio upload too large (max {STT_MAX_UPLOAD_BYTES // (1024 * 1024)} MB)",
+            "status": "error"
+        }), 413
+
+    from core.deepgram_streaming import DeepgramStreamingClient
+
+    try:
+        sample_rate = int(request.args.get('sample_rate', '16000'))
+        if sample_rate <= 0:
+            raise ValueError(sample_rate)
+    except ValueError:
+        return jsonify({
+            "error": "sample_rate must be a positive integer",
+            "status": "error"
+        }), 400
+
+    events: "queue.Queue[dict]" = queue.Queue()
+    client = None
+    try:
+        client = DeepgramStreamingClient(
+            language=request.args.get('language', 'en'),
+            encoding=request.args.get('encoding'),
+            sample_rate=sample_rate
+        )
+        client.on_transcript(lambda text, is_final: events.put({"text": text, "is_final": is_final}))
+        client.on_error(lambda message: events.put({"error": message}))
+        client.connect()
+    except Exception as e:
+        logger.error(f"Deepgram stream setup error: {e}")
+        if client is not None:
+            # Stop the connect thread/loop (it may still be dialing Deepgram)
+            client.close()
+        return jsonify({
+            "error": f"Cannot start streaming transcription: {e}",
+            "status": "error"
+        }), 502
+
+    audio_stream = request.stream
+
+    def generate():
+        finals = []
+
+        def drain() -> bytes:
+            frames = []
+            while True:
+                try:
+                    event = events.get_nowait()
+                except queue.Empty:
+                    return b"".join(frames)
+                if event.get('is_final'):
+                    finals.append(event['text'])
+                frames.append(b"data: " + dumps_bytes(event) + b"\n\n")
+
+        try:
+            while True:
+                chunk = audio_stream.read(STT_STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                client.send_audio(chunk)
+                frames = drain()
+                if frames:
+                    yield frames
+
+            client.finish(timeout=STT_STREAM_FINISH_TIMEOUT)
+            frames = drain()
+            if frames:
+                yield frames
+
+            yield b"data: " + dumps_bytes({"text": " ".join(finals), "is_final": True, "done": True}) + b"\n\n"
+        finally:
+            client.close()
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
 # ============================================
 # COMBINED VOICE CHAT ENDPOINT
 # ============================================
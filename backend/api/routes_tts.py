@@ -11,6 +11,7 @@ Supports multiple TTS providers via voice_providers abstraction:
 Endpoints:
 - GET  /tts/health     - Health check for TTS service
 - POST /tts            - Convert text to speech
+- POST /tts/batch      - Speak several sentences with one provider call
 - POST /tts/stream     - Stream audio chunks (for real-time playback)
 
 Why proxy through substrate instead of direct to provider?
@@ -23,25 +24,145 @@ Why proxy through substrate instead of direct to provider?
 
 import os
 import re
+import select
+import time
+import hashlib
+import gzip
+import functools
 import logging
-import asyncio
+import threading
 import requests
 from flask import Blueprint, Response, request, jsonify, stream_with_context
+from collections import OrderedDict
 from typing import Optional
 import base64
 
-from core.voice_providers import get_voice_provider, reset_voice_provider
+from api.content_encoding import accepts_gzip
+from core.voice_providers import get_voice_provider, reset_voice_provider, warm_voice_provider
+from core.redis_client import get_redis
+from core.http_pool import create_pooled_session
+from core.json_utils import loads
+from core.async_runner import run_async, iter_async
 
 logger = logging.getLogger(__name__)
 
+# Linear-time regex engine for the markdown cleanup (optional). The text
+# comes from model output and arrives before any length check, so patterns
+# like the link rewrite must not go quadratic on inputs such as "[[[[...".
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+_md_re = re2 if RE2_AVAILABLE else re
+
 tts_bp = Blueprint('tts', __name__)
 
+# Open the provider's upstream connection when the app registers the
+# blueprint, so the first /tts request doesn't pay the TLS handshake
+tts_bp.record_once(lambda state: warm_voice_provider())
+
 # Pocket TTS configuration
 POCKETTTS_URL = os.getenv('POCKETTTS_URL', 'http://localhost:8001')
 POCKETTTS_TIMEOUT = int(os.getenv('POCKETTTS_TIMEOUT', '30'))
 
+# Keep-alive connection pool for Pocket TTS / ElevenLabs calls
+_http = create_pooled_session()
+
+# /tts/stream relay read size. urllib3 waits to fill each chunk before
+# handing it over, so small reads get the first audio to the client sooner.
+STREAM_CHUNK_SIZE = 2048
+
+# When the client falls behind, frames already waiting on the upstream socket
+# are merged into one yield (one WSGI write) of up to this many bytes, and
+# merging stops this long after the yield's first chunk arrived
+STREAM_COALESCE_MAX_BYTES = 65536
+STREAM_COALESCE_MAX_WAIT_S = 0.02
+
+# Max wait for each chunk from the voice provider
+TTS_PROVIDER_TIMEOUT = 60
+
 # Text preprocessing settings
 MAX_TEXT_LENGTH = 5000  # Max characters for TTS
+# Raw input bound checked before any preprocessing. Markdown cleanup only
+# shrinks text, so this leaves room for formatting while oversized bodies
+# are rejected without running the cleanup pipeline over them.
+MAX_RAW_TEXT_LENGTH = MAX_TEXT_LENGTH * 2
+# Request body bound checked before the JSON is even parsed: worst case is
+# 12 bytes per char (\uXXXX surrogate pairs) plus room for the other fields
+MAX_REQUEST_BYTES = MAX_RAW_TEXT_LENGTH * 12 + 4096
+
+# Synthesized audio cache (Redis when REDIS_URL is set, else an in-process
+# LRU bounded by total bytes). Keyed by provider + voice + speed + text.
+TTS_CACHE_TTL = int(os.getenv('TTS_CACHE_TTL', '3600'))  # seconds, 0 = off
+TTS_LOCAL_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_local_audio_cache: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, audio)
+_local_audio_cache_bytes = 0
+_local_audio_cache_lock = threading.Lock()
+
+# Optional on-disk tier behind the in-process LRU (ignored when Redis is
+# configured). Survives restarts and is shared by all workers on the host.
+# Files live at <dir>/<key[:2]>/<key> and expire TTS_CACHE_TTL after being
+# written; stale files are removed when next looked up. Unset = off.
+TTS_DISK_CACHE_DIR = os.getenv('TTS_DISK_CACHE_DIR', '')
+
+
+# ElevenLabs /voices responses for /tts/voices. The voice list changes on an
+# hours timescale, so hits skip the upstream call; expired entries revalidate
+# with If-None-Match and a 304 just extends them.
+VOICES_CACHE_TTL = 300  # seconds
+_voices_cache: dict = {}  # (base_url, api_key, path) -> (expires_at, etag, data)
+_voices_cache_lock = threading.Lock()
+
+# Gzip /tts/voices bodies (the full ElevenLabs list runs to tens of KB) for
+# clients that accept it
+VOICES_GZIP_MIN_BYTES = 1024
+VOICES_GZIP_LEVEL = 5
+
+
+# Markdown cleanup pipeline for _preprocess_text, compiled once at import.
+# Order matters: each pass sees the previous pass's output. Each entry is
+# (markers, pattern, replacement); a pass only runs if one of its marker
+# substrings is in the text, so plain prose skips nearly every rewrite.
+# Patterns stay within the RE2 subset (no lookarounds/backreferences; flags
+# inline) so they compile under either engine.
+_MD_PATTERNS = (
+    # Remove markdown bold/italic
+    (('**',), _md_re.compile(r'\*\*(.+?)\*\*'), r'\1'),       # **bold**
+    (('*',), _md_re.compile(r'\*(.+?)\*'), r'\1'),            # *italic*
+    (('__',), _md_re.compile(r'__(.+?)__'), r'\1'),           # __bold__
+    (('_',), _md_re.compile(r'_(.+?)_'), r'\1'),              # _italic_
+
+    # Remove markdown links [text](url) -> text
+    (('](',), _md_re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1'),
+
+    # Remove markdown headers
+    (('#',), _md_re.compile(r'(?m)^#{1,6}\s*'), ''),
+
+    # Remove code blocks
+    (('```',), _md_re.compile(r'```[\s\S]*?```'), ''),
+    (('`',), _md_re.compile(r'`([^`]+)`'), r'\1'),
+
+    # Remove bullet points
+    (('-', '*', '+'), _md_re.compile(r'(?m)^\s*[-*+]\s+'), ''),
+    (('.',), _md_re.compile(r'(?m)^\s*\d+\.\s+'), ''),
+
+    # Normalize whitespace
+    (('\n\n\n',), _md_re.compile(r'\n{3,}'), '\n\n'),
+    (('  ',), _md_re.compile(r' {2,}'), ' '),
+)
+
+
+# Fast path for plain prose: if none of these substrings are present and no
+# line starts like a list item, no pass above can change the text. ('.', '-'
+# and '+' alone are in most sentences, so they're checked at line starts only.)
+_MD_QUICK_MARKERS = ('*', '_', '[', '`', '#', '\n\n\n', '  ')
+_LIST_LINE_RE = _md_re.compile(r'(?m)^\s*[-+\d]')
+
+
+# Memoized cleanup results - greetings and status lines repeat a lot
+PREPROCESS_CACHE_SIZE = 1024
 
 
 def _preprocess_text(text: str) -> str:
@@ -52,42 +173,253 @@ def _preprocess_text(text: str) -> str:
     - Convert emojis to descriptions (optional)
     - Normalize whitespace
     - Handle special characters
+
+    Results for texts up to MAX_TEXT_LENGTH chars are cached; longer input
+    is cleaned uncached so oversized bodies can't bloat the cache.
     """
     if not text:
         return ""
 
-    # Remove markdown bold/italic
-    text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)  # **bold**
-    text = re.sub(r'\*(.+?)\*', r'\1', text)      # *italic*
-    text = re.sub(r'__(.+?)__', r'\1', text)      # __bold__
-    text = re.sub(r'_(.+?)_', r'\1', text)        # _italic_
+    if len(text) > MAX_TEXT_LENGTH:
+        return _clean_markdown(text)
+    return _clean_markdown_cached(text)
 
-    # Remove markdown links [text](url) -> text
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
 
-    # Remove markdown headers
-    text = re.sub(r'^#{1,6}\s*', '', text, flags=re.MULTILINE)
+def _clean_markdown(text: str) -> str:
+    if not any(marker in text for marker in _MD_QUICK_MARKERS) and not _LIST_LINE_RE.search(text):
+        return text.strip()
 
-    # Remove code blocks
-    text = re.sub(r'```[\s\S]*?```', '', text)
-    text = re.sub(r'`([^`]+)`', r'\1', text)
+    for markers, pattern, replacement in _MD_PATTERNS:
+        if any(marker in text for marker in markers):
+            text = pattern.sub(replacement, text)
+    return text.strip()
 
-    # Remove bullet points
-    text = re.sub(r'^\s*[-*+]\s+', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)
 
-    # Normalize whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = re.sub(r' {2,}', ' ', text)
-    text = text.strip()
+_clean_markdown_cached = functools.lru_cache(maxsize=PREPROCESS_CACHE_SIZE)(_clean_markdown)
+
 
-    return text
+def _audio_cache_key(provider, voice: Optional[str], speed, text: str) -> str:
+    """Cache key for synthesized audio (default voice resolved per provider)"""
+    voice_id = voice or getattr(provider, 'voice_id', '')
+    raw = f"{provider.get_provider_name()}|{voice_id}|{speed}|{text}".encode('utf-8')
+    return "tts:" + hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _audio_cache_get(key: str) -> Optional[bytes]:
+    """Look up cached audio"""
+    r = get_redis()
+    if r is not None:
+        try:
+            return r.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis get failed for {key}: {e}")
+            return None
+
+    global _local_audio_cache_bytes
+    with _local_audio_cache_lock:
+        entry = _local_audio_cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                _local_audio_cache.move_to_end(key)
+                return entry[1]
+            del _local_audio_cache[key]
+            _local_audio_cache_bytes -= len(entry[1])
+
+    if not TTS_DISK_CACHE_DIR:
+        return None
+
+    path = _disk_cache_path(key)
+    try:
+        remaining = os.stat(path).st_mtime + TTS_CACHE_TTL - time.time()
+        if remaining <= 0:
+            os.unlink(path)
+            return None
+        with open(path, 'rb') as f:
+            audio = f.read()
+    except OSError:
+        return None
+
+    _local_cache_put(key, audio, time.monotonic() + remaining)
+    return audio
+
+
+def _audio_cache_set(key: str, audio: bytes):
+    """Store audio for TTS_CACHE_TTL seconds"""
+    r = get_redis()
+    if r is not None:
+        try:
+            r.setex(key, TTS_CACHE_TTL, audio)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis setex failed for {key}: {e}")
+        return
+
+    _local_cache_put(key, audio, time.monotonic() + TTS_CACHE_TTL)
+
+    if TTS_DISK_CACHE_DIR:
+        path = _disk_cache_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(audio)
+            os.replace(tmp_path, path)  # readers never see a partial file
+        except OSError as e:
+            logger.warning(f"⚠️ TTS disk cache write failed for {key}: {e}")
+
+
+def _local_cache_put(key: str, audio: bytes, expires_at: float):
+    """Insert into the in-process LRU, evicting oldest entries past the byte cap"""
+    # Don't let one long clip evict most of the cache
+    if len(audio) > TTS_LOCAL_CACHE_MAX_BYTES // 8:
+        return
+
+    global _local_audio_cache_bytes
+    with _local_audio_cache_lock:
+        old = _local_audio_cache.pop(key, None)
+        if old is not None:
+            _local_audio_cache_bytes -= len(old[1])
+        _local_audio_cache[key] = (expires_at, audio)
+        _local_audio_cache_bytes += len(audio)
+        while _local_audio_cache_bytes > TTS_LOCAL_CACHE_MAX_BYTES:
+            _, (_, evicted) = _local_audio_cache.popitem(last=False)
+            _local_audio_cache_bytes -= len(evicted)
+
+
+def _disk_cache_path(key: str) -> str:
+    """<TTS_DISK_CACHE_DIR>/<2-char shard>/<hash> for a 'tts:<hash>' key"""
+    digest = key.partition(':')[2]
+    return os.path.join(TTS_DISK_CACHE_DIR, digest[:2], digest)
+
+
+def _fetch_elevenlabs_voices(provider, path: str) -> Optional[dict]:
+    """
+    GET an ElevenLabs voices resource ('/voices' or '/voices/<id>') through
+    the VOICES_CACHE_TTL cache. Returns the parsed body, or None if the
+    API answered with an error. Network errors propagate.
+    """
+    key = (provider.base_url, provider.api_key, path)
+    with _voices_cache_lock:
+        entry = _voices_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[2]
+
+    headers = {"xi-api-key": provider.api_key}
+    if entry is not None and entry[1]:
+        headers["If-None-Match"] = entry[1]
+
+    response = _http.get(f"{provider.base_url}{path}", headers=headers, timeout=10)
+
+    if response.status_code == 304 and entry is not None:
+        data, etag = entry[2], entry[1]
+    elif response.ok:
+        data, etag = loads(response.content), response.headers.get('ETag')
+    else:
+        return None
+
+    with _voices_cache_lock:
+        _voices_cache[key] = (time.monotonic() + VOICES_CACHE_TTL, etag, data)
+    return data
+
+
+def _voices_response(result: dict, cacheable: bool = True) -> Response:
+    """
+    JSON response for /tts/voices with an ETag over the body and a
+    VOICES_CACHE_TTL max-age, answering 304 when If-None-Match matches.
+    Responses carrying an upstream error aren't cached.
+
+    Bodies over VOICES_GZIP_MIN_BYTES are gzipped for clients that accept
+    it; the ETag is weak since it names the JSON, not either encoding.
+    """
+    response = jsonify(result)
+    response.vary.add('Accept-Encoding')
+    if cacheable:
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest(), weak=True)
+        response.cache_control.public = True
+        response.cache_control.max_age = VOICES_CACHE_TTL
+        response.make_conditional(request)
+
+    if (response.status_code == 200
+            and response.content_length >= VOICES_GZIP_MIN_BYTES
+            and accepts_gzip()):
+        response.set_data(gzip.compress(response.get_data(), compresslevel=VOICES_GZIP_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+def _open_audio_stream(provider, text: str, voice: Optional[str], speed):
+    """
+    Start a provider audio stream from sync Flask code.
+
+    Returns (first_chunk, generator_of_remaining_chunks), both pulled on the
+    shared background loop. The first chunk is awaited up front so provider
+    failures still surface as a 500 instead of a truncated 200.
+    """
+    agen = provider.text_to_speech_stream(text, voice_id=voice, speed=speed)
+
+    try:
+        first_chunk = run_async(agen.__anext__(), TTS_PROVIDER_TIMEOUT)
+    except StopAsyncIteration:
+        return b'', (chunk for chunk in ())
+    except Exception:
+        try:
+            run_async(agen.aclose())
+        except Exception:
+            pass
+        raise
+
+    return first_chunk, iter_async(agen, TTS_PROVIDER_TIMEOUT)
+
+
+def _coalesce_available(
+    raw,
+    max_bytes: int = STREAM_COALESCE_MAX_BYTES,
+    max_wait: float = STREAM_COALESCE_MAX_WAIT_S
+):
+    """
+    Relay a urllib3 response, merging chunks that arrive back to back.
+
+    The response's first chunk is yielded as soon as it's read, unmerged.
+    After that, while a zero-timeout select() reports the socket readable,
+    further chunks are pulled into the same yield - up to max_bytes, and only
+    until max_wait has passed since the yield's first chunk arrived.
+
+    select() only means at least one byte is there: each pull reads a full
+    STREAM_CHUNK_SIZE (or HTTP chunk) and can block until it has one, so
+    max_wait bounds when merging stops, not how long a started pull takes.
+    Bytes already buffered inside http.client are invisible to select() and
+    simply go out with the next yield.
+    """
+    chunks = raw.stream(STREAM_CHUNK_SIZE, decode_content=True)
+    try:
+        fd = raw.fileno()
+    except (OSError, ValueError):
+        fd = None
+
+    first = True
+    for chunk in chunks:
+        if fd is None or first:
+            first = False
+            if chunk:
+                yield chunk
+            continue
+
+        buf = bytearray(chunk)
+        deadline = time.monotonic() + max_wait
+        while (len(buf) < max_bytes
+               and time.monotonic() < deadline
+               and select.select([fd], [], [], 0)[0]):
+            more = next(chunks, None)
+            if more is None:
+                break
+            buf += more
+        if buf:
+            yield bytes(buf)
 
 
 def _check_pockettts_health() -> dict:
     """Check if Pocket TTS server is available."""
     try:
-        response = requests.get(
+        response = _http.get(
             f"{POCKETTTS_URL}/health",
             timeout=5
         )
@@ -220,6 +552,8 @@ def tts_provider_info():
             "ELEVENLABS_API_KEY": masked_key,
             "ELEVENLABS_VOICE_ID": os.getenv('ELEVENLABS_VOICE_ID', '(not set)'),
             "ELEVENLABS_MODEL": os.getenv('ELEVENLABS_MODEL', 'eleven_turbo_v2_5'),
+            "ELEVENLABS_OUTPUT_FORMAT": os.getenv('ELEVENLABS_OUTPUT_FORMAT', 'mp3_22050_32'),
+            "ELEVENLABS_OPTIMIZE_STREAMING_LATENCY": os.getenv('ELEVENLABS_OPTIMIZE_STREAMING_LATENCY', '3'),
             "AWS_ACCESS_KEY_ID": masked_aws,
             "POLLY_VOICE_ID": os.getenv('POLLY_VOICE_ID', 'Matthew'),
             "POLLY_ENGINE": os.getenv('POLLY_ENGINE', 'neural'),
@@ -282,9 +616,15 @@ def text_to_speech():
 
     Response:
         Content-Type: audio/mpeg (ElevenLabs) or audio/wav (Pocket TTS)
-        Body: Raw audio data
+        Body: Raw audio data (chunked as the provider generates it;
+              cache hits are sent whole)
     """
     try:
+        if request.content_length and request.content_length > MAX_REQUEST_BYTES:
+            return jsonify({
+                "error": f"Request too large ({request.content_length} bytes)"
+            }), 413
+
         data = request.get_json() or {}
         text = data.get('text', '')
         voice = data.get('voice')
@@ -293,6 +633,11 @@ def text_to_speech():
         if not text:
             return jsonify({"error": "Text is required"}), 400
 
+        if len(text) > MAX_RAW_TEXT_LENGTH:
+            return jsonify({
+                "error": f"Text too long ({len(text)} chars). Max: {MAX_TEXT_LENGTH}"
+            }), 400
+
         # Preprocess text
         text = _preprocess_text(text)
 
@@ -303,43 +648,132 @@ def text_to_speech():
 
         logger.info(f"🎤 TTS request: {len(text)} chars")
 
-        # Get provider and generate audio
-        provider = get_voice_provider()
+        return _synthesize_response(text, voice, speed)
 
-        # Run async in sync context
-        loop = asyncio.new_event_loop()
-        try:
-            audio_data = loop.run_until_complete(
-                provider.text_to_speech(text, voice_id=voice, speed=speed)
-            )
-        finally:
-            loop.close()
+    except Exception as e:
+        logger.exception(f"TTS error: {e}")
+        return jsonify({
+            "error": str(e),
+            "status": "error"
+        }), 500
 
-        # Determine content type based on provider
-        if provider.get_provider_name() in ('elevenlabs_turbo', 'amazon_polly'):
-            content_type = 'audio/mpeg'
-        else:
-            content_type = 'audio/wav'
 
-        logger.info(f"✅ TTS complete: {len(audio_data)} bytes via {provider.get_provider_name()}")
+@tts_bp.route('/tts/batch', methods=['POST'])
+def text_to_speech_batch():
+    """
+    Convert several sentences to speech in one provider call.
 
-        return Response(
-            audio_data,
-            mimetype=content_type,
-            headers={
-                'X-TTS-Provider': provider.get_provider_name(),
-                'X-Text-Length': str(len(text))
-            }
-        )
+    For callers that produce a turn sentence by sentence: sending the
+    sentences together pays one provider round trip instead of one each.
+
+    Request Body:
+        {
+            "sentences": ["First sentence.", "Second one."],
+            "voice": "optional-voice-id",
+            "speed": 1.0
+        }
+
+    Response:
+        Same as /tts - one audio stream for the joined text
+    """
+    try:
+        if request.content_length and request.content_length > MAX_REQUEST_BYTES:
+            return jsonify({
+                "error": f"Request too large ({request.content_length} bytes)"
+            }), 413
+
+        data = request.get_json() or {}
+        sentences = data.get('sentences')
+        voice = data.get('voice')
+        speed = data.get('speed', 1.0)
+
+        if not isinstance(sentences, list) or not all(isinstance(s, str) for s in sentences):
+            return jsonify({"error": "sentences must be a list of strings"}), 400
+
+        raw_length = sum(map(len, sentences))
+        if raw_length > MAX_RAW_TEXT_LENGTH:
+            return jsonify({
+                "error": f"Text too long ({raw_length} chars). Max: {MAX_TEXT_LENGTH}"
+            }), 400
+
+        # Preprocess per sentence so repeated sentences hit the cleanup cache
+        text = " ".join(filter(None, map(_preprocess_text, sentences)))
+
+        if not text:
+            return jsonify({"error": "Text is required"}), 400
+
+        if len(text) > MAX_TEXT_LENGTH:
+            return jsonify({
+                "error": f"Text too long ({len(text)} chars). Max: {MAX_TEXT_LENGTH}"
+            }), 400
+
+        logger.info(f"🎤 TTS batch request: {len(sentences)} sentences, {len(text)} chars")
+
+        return _synthesize_response(text, voice, speed)
 
     except Exception as e:
-        logger.exception(f"TTS error: {e}")
+        logger.exception(f"TTS batch error: {e}")
         return jsonify({
             "error": str(e),
             "status": "error"
         }), 500
 
 
+def _synthesize_response(text: str, voice: Optional[str], speed) -> Response:
+    """Audio response for preprocessed text (cache hit, or streamed from the provider)"""
+    # Get provider and generate audio
+    provider = get_voice_provider()
+
+    provider_name = provider.get_provider_name()
+
+    # Determine content type based on provider
+    if provider_name in ('elevenlabs_turbo', 'amazon_polly'):
+        content_type = 'audio/mpeg'
+    else:
+        content_type = 'audio/wav'
+
+    headers = {
+        'X-TTS-Provider': provider_name,
+        'X-Text-Length': str(len(text))
+    }
+
+    cache_key = _audio_cache_key(provider, voice, speed, text) if TTS_CACHE_TTL > 0 else None
+    audio_data = _audio_cache_get(cache_key) if cache_key else None
+
+    if audio_data is not None:
+        logger.info(f"✅ TTS complete: {len(audio_data)} bytes via {provider_name} (cache hit)")
+        headers['X-TTS-Cache'] = 'hit'
+        return Response(audio_data, mimetype=content_type, headers=headers)
+
+    # Stream provider audio as it arrives (no Content-Length; chunked)
+    first_chunk, remaining = _open_audio_stream(provider, text, voice, speed)
+
+    def generate():
+        chunks = [first_chunk] if cache_key else None
+        total = len(first_chunk)
+        try:
+            yield first_chunk
+            for chunk in remaining:
+                total += len(chunk)
+                if chunks is not None:
+                    chunks.append(chunk)
+                yield chunk
+        finally:
+            remaining.close()
+
+        # Only reached when the whole clip was delivered
+        logger.info(f"✅ TTS complete: {total} bytes via {provider_name} (cache miss)")
+        if chunks is not None and total:
+            _audio_cache_set(cache_key, b''.join(chunks))
+
+    headers['X-TTS-Cache'] = 'miss'
+    return Response(
+        stream_with_context(generate()),
+        mimetype=content_type,
+        headers=headers
+    )
+
+
 # ============================================
 # STREAMING TTS (for real-time playback)
 # ============================================
@@ -363,6 +797,11 @@ def text_to_speech_stream():
         Chunked audio stream (audio/wav or audio/mpeg)
     """
     try:
+        if request.content_length and request.content_length > MAX_REQUEST_BYTES:
+            return jsonify({
+                "error": f"Request too large ({request.content_length} bytes)"
+            }), 413
+
         data = request.get_json() or {}
         text = data.get('text', '')
         voice = data.get('voice', 'default')
@@ -371,6 +810,11 @@ def text_to_speech_stream():
         if not text:
             return jsonify({"error": "Text is required"}), 400
 
+        if len(text) > MAX_RAW_TEXT_LENGTH:
+            return jsonify({
+                "error": f"Text too long ({len(text)} chars)"
+            }), 400
+
         # Preprocess
         text = _preprocess_text(text)
 
@@ -381,35 +825,59 @@ def text_to_speech_stream():
 
         logger.info(f"🎤 TTS stream request: {len(text)} chars")
 
-        # Stream from Pocket TTS
+        # Open the upstream stream before answering so a Pocket TTS failure
+        # is a 502 rather than an empty 200.
+        # This stays a blocking relay on purpose: the app is served over WSGI
+        # (SocketIO async_mode='threading'), which holds a thread per response
+        # until the body iterator finishes regardless of how upstream is read,
+        # and Flask can't return an async generator as a WSGI body. Moving the
+        # read onto aiohttp would add a loop hop per chunk without freeing
+        # the thread; that only pays off once this runs under an ASGI server.
+        try:
+            response = _http.post(
+                f"{POCKETTTS_URL}/tts",
+                json={
+                    "text": text,
+                    "voice": voice,
+                },
+                timeout=POCKETTTS_TIMEOUT,
+                stream=True
+            )
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Pocket TTS stream connect error: {e}")
+            return jsonify({"error": f"Pocket TTS unavailable: {e}"}), 502
+
+        if not response.ok:
+            logger.error(f"Pocket TTS stream error: {response.status_code}")
+            response.close()
+            return jsonify({"error": f"Pocket TTS error: {response.status_code}"}), 502
+
         def generate():
             try:
-                response = requests.post(
-                    f"{POCKETTTS_URL}/tts",
-                    json={
-                        "text": text,
-                        "voice": voice,
-                    },
-                    timeout=POCKETTTS_TIMEOUT,
-                    stream=True
-                )
-
-                if response.ok:
-                    for chunk in response.iter_content(chunk_size=4096):
-                        if chunk:
-                            yield chunk
-                else:
-                    logger.error(f"Pocket TTS stream error: {response.status_code}")
-
+                # Relay straight off the urllib3 response (no iter_content layer)
+                yield from _coalesce_available(response.raw)
             except Exception as e:
                 logger.exception(f"TTS stream error: {e}")
-
+            finally:
+                # Returns the connection to the pool even if the client
+                # disconnects mid-stream
+                response.close()
+
+        # direct_passthrough hands the generator straight to the WSGI server
+        # instead of through Werkzeug's per-chunk encode/close wrappers; it
+        # needs no request context, so no stream_with_context layer either.
+        # A sendfile()/splice path isn't possible here: the upstream body is
+        # chunk-framed on the socket, so the bytes must pass through urllib3.
         return Response(
-            stream_with_context(generate()),
+            generate(),
             mimetype='audio/wav',
+            direct_passthrough=True,
             headers={
                 'X-TTS-Engine': 'pockettts',
-                'Transfer-Encoding': 'chunked'
+                'Transfer-Encoding': 'chunked',
+                # Keep proxies (nginx) from buffering or re-encoding the audio
+                'X-Accel-Buffering': 'no',
+                'Cache-Control': 'no-cache, no-transform'
             }
         )
 
@@ -451,26 +919,19 @@ def list_voices():
                 "model": provider.model_id
             }
 
-            # Try to get the voice name from API
+            # Try to get the voice name from API (cached)
             try:
                 if show_all:
                     # Fetch all voices
-                    response = requests.get(
-                        f"{provider.base_url}/voices",
-                        headers={"xi-api-key": provider.api_key},
-                        timeout=10
-                    )
+                    data = _fetch_elevenlabs_voices(provider, "/voices")
                 else:
                     # Fetch just the configured voice
-                    response = requests.get(
-                        f"{provider.base_url}/voices/{provider.voice_id}",
-                        headers={"xi-api-key": provider.api_key},
-                        timeout=10
-                    )
-
-                if response.ok:
-                    data = response.json()
+                    data = _fetch_elevenlabs_voices(provider, f"/voices/{provider.voice_id}")
 
+                if data is None:
+                    # Upstream non-2xx - answer, but don't let clients pin it
+                    return _voices_response(result, cacheable=False)
+                else:
                     if show_all:
                         # Return all voices
                         voices = []
@@ -490,8 +951,9 @@ def list_voices():
             except Exception as e:
                 logger.warning(f"Could not fetch voice info from ElevenLabs: {e}")
                 result["voice_name"] = "Unknown (API error)"
+                return _voices_response(result, cacheable=False)
 
-            return jsonify(result)
+            return _voices_response(result)
 
         # Amazon Polly
         elif provider_name == 'amazon_polly':
@@ -520,8 +982,9 @@ def list_voices():
                 except Exception as e:
                     logger.warning(f"Could not list Polly voices: {e}")
                     result["voices_error"] = str(e)
+                    return _voices_response(result, cacheable=False)
 
-            return jsonify(result)
+            return _voices_response(result)
 
         # Pocket TTS
         else:
@@ -533,13 +996,15 @@ def list_voices():
 
             if show_all:
                 try:
-                    response = requests.get(f"{POCKETTTS_URL}/v1/voices", timeout=5)
-                    if response.ok:
-                        result["voices"] = response.json().get('voices', [])
-                except:
-                    pass
+                    response = _http.get(f"{POCKETTTS_URL}/v1/voices", timeout=5)
+                    if not response.ok:
+                        return _voices_response(result, cacheable=False)
+                    result["voices"] = loads(response.content).get('voices', [])
+                except Exception as e:
+                    logger.warning(f"Could not list Pocket TTS voices: {e}")
+                    return _voices_response(result, cacheable=False)
 
-            return jsonify(result)
+            return _voices_response(result)
 
     except Exception as e:
         logger.exception(f"List voices error: {e}")
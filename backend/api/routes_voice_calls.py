@@ -266,15 +266,14 @@ def _check_voice_call_triggers(user_id: str, location_data: Dict) -> List[str]:
 
 def _evaluate_trigger(condition: str, user_id: str, location_data: Dict) -> bool:
     """Evaluate a trigger condition against current data."""
-    from .routes_guardian import _active_sessions
+    from .routes_guardian import _active_sessions, session_elapsed_seconds
 
     session = _active_sessions.get(user_id)
 
     # Long drive check - use real session data
     if 'driving_duration > 180' in condition:
         if session and 'start_time' in session:
-            start = datetime.fromisoformat(session['start_time'])
-            driving_minutes = (datetime.now() - start).total_seconds() / 60
+            driving_minutes = session_elapsed_seconds(session) / 60
             return driving_minutes > 180
         return False
 
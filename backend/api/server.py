@@ -29,7 +29,7 @@ from dotenv import load_dotenv
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.state_manager import StateManager
-from core.config import get_model_or_default, get_api_provider, FALLBACK_MODEL, is_ollama_cloud_configured
+from core.config import get_model_or_default, get_api_provider, FALLBACK_MODEL, is_ollama_cloud_configured, reload_config
 from core.openrouter_client import OpenRouterClient
 from core.grok_client import GrokClient  # ⚡ Agent's Grok integration!
 from core.mistral_client import MistralClient  # Mistral AI (Direct API access)
@@ -39,6 +39,8 @@ from core.context_window_calculator import ContextWindowCalculator
 from core.cost_tracker import CostTracker
 from core.error_handler import setup_logging, validate_environment, SubstrateAIError
 from api.rate_limiter import RateLimiter
+from api.json_provider import install_json_provider
+from api.upload_request import UploadFriendlyRequest
 from tools.memory_tools import MemoryTools
 from core.consciousness_loop import ConsciousnessLoop
 from core.consciousness_broadcast import init_consciousness_broadcast
@@ -82,6 +84,7 @@ logger = logging.getLogger(__name__)
 
 # Load environment
 load_dotenv()  # Loads .env from current directory or parent
+reload_config()  # core.config was imported above, before .env was read
 
 # Validate environment configuration
 try:
@@ -93,8 +96,13 @@ except Exception as e:
 
 # Initialize Flask app
 app = Flask(__name__)
+app.request_class = UploadFriendlyRequest  # 🎙️ Keep audio uploads in RAM (no temp-file spool)
 CORS(app)  # Enable CORS for React dev server
 
+# ⚡ orjson for jsonify()/get_json() across all blueprints
+if install_json_provider(app):
+    logger.info("⚡ orjson JSON provider installed")
+
 # Disable werkzeug's default request logging (we have our own with emojis! 🎨)
 werkzeug_logger = logging.getLogger('werkzeug')
 werkzeug_logger.setLevel(logging.WARNING)  # Only show warnings/errors, not every request
@@ -629,9 +637,9 @@ def ollama_compat_chat():
         # 📍 Extract and store location context from mobile/web clients
         location_data = data.get('location')
         if location_data and isinstance(location_data, dict):
-            from api.routes_places import _location_contexts
+            from api.routes_places import store_location_context
             from datetime import datetime as dt
-            _location_contexts[session_id] = {
+            store_location_context(session_id, {
                 'latitude': location_data.get('latitude'),
                 'longitude': location_data.get('longitude'),
                 'city': location_data.get('city'),
@@ -641,7 +649,7 @@ def ollama_compat_chat():
                 'speed': location_data.get('speed'),
                 'accuracy': location_data.get('accuracy'),
                 'updated_at': dt.now().isoformat(),
-            }
+            })
             logger.info(f"📍 Location from chat request: {location_data.get('city')}, {location_data.get('region')} (session={session_id})")
 
         # Rate limiting check
@@ -0,0 +1,35 @@
+"""
+Upload-friendly Flask request class
+
+Werkzeug spools multipart file parts to a temp file on disk once they pass
+500 KB, so a typical voice clip uploaded to /stt takes a disk round trip
+before we read it straight back into memory. This request class raises the
+in-memory threshold so audio-sized uploads stay in RAM; anything larger
+still spools to disk.
+"""
+
+from tempfile import SpooledTemporaryFile
+from typing import IO, Optional
+
+from flask import Request
+
+# Uploaded file parts up to this size stay in memory
+UPLOAD_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+
+class UploadFriendlyRequest(Request):
+    """
+    Flask request that keeps uploaded files in memory up to
+    UPLOAD_SPOOL_MAX_BYTES.
+
+    Register with: app.request_class = UploadFriendlyRequest
+    """
+
+    def _get_file_stream(
+        self,
+        total_content_length: Optional[int],
+        content_type: Optional[str],
+        filename: Optional[str] = None,
+        content_length: Optional[int] = None
+    ) -> IO[bytes]:
+        return SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_BYTES, mode="rb+")
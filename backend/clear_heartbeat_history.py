@@ -287,6 +287,8 @@ def clear_heartbeat_messages(session_id=None, dry_run=True, include_summaries=Fa
     print(f"\nDeleted {deleted} messages")
     print(f"Remaining messages: {remaining}")
 
+    # Refresh planner stats the delete may have left stale
+    cursor.execute("PRAGMA optimize")
     conn.close()
 
     print("\n" + "=" * 60)
@@ -9,18 +9,80 @@ Usage:
     python clear_message_history.py --all               # Clear ALL messages (dangerous!)
     python clear_message_history.py --list              # List sessions
 """
-import sqlite3
+import argparse
+import atexit
 import os
 import sys
-from datetime import datetime
+
+
+# SQL kept as module constants so the shared connection's statement cache
+# reuses each prepared statement across calls
+# Session-scoped queries pin the (session_id, timestamp) index that
+# state_manager creates, so the planner walks one session's rows newest-first
+# and stops after LIMIT rather than scanning and sorting
+_SQL_ENSURE_SESSION_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_messages_session
+    ON messages(session_id, timestamp);
+"""
+_SQL_PREVIEW_RECENT_BY_SESSION = """
+    SELECT id, role, content, timestamp, session_id
+    FROM messages INDEXED BY idx_messages_session
+    WHERE session_id = ?
+    ORDER BY timestamp DESC
+    LIMIT ?;
+"""
+_SQL_PREVIEW_RECENT = """
+    SELECT id, role, content, timestamp, session_id
+    FROM messages
+    ORDER BY timestamp DESC
+    LIMIT ?;
+"""
+_SQL_DELETE_RECENT_BY_SESSION = """
+    DELETE FROM messages WHERE id IN (
+        SELECT id FROM messages INDEXED BY idx_messages_session
+        WHERE session_id = ?
+        ORDER BY timestamp DESC
+        LIMIT ?
+    );
+"""
+_SQL_DELETE_RECENT = """
+    DELETE FROM messages WHERE id IN (
+        SELECT id FROM messages
+        ORDER BY timestamp DESC
+        LIMIT ?
+    );
+"""
+_SQL_COUNT_BY_SESSION = "SELECT COUNT(*) FROM messages WHERE session_id = ?;"
+_SQL_COUNT = "SELECT COUNT(*) FROM messages;"
+_SQL_DELETE_SESSION = "DELETE FROM messages WHERE session_id = ?;"
+_SQL_DELETE_ALL = "DELETE FROM messages;"
+_SQL_HAS_SUMMARIES = "SELECT name FROM sqlite_master WHERE type='table' AND name='conversation_summaries';"
+_SQL_DELETE_SUMMARIES_BY_SESSION = "DELETE FROM conversation_summaries WHERE session_id = ?;"
+_SQL_DELETE_SUMMARIES = "DELETE FROM conversation_summaries;"
+_SQL_LIST_SESSIONS = """
+    SELECT session_id, COUNT(*) as msg_count,
+           MIN(timestamp) as first_msg,
+           MAX(timestamp) as last_msg
+    FROM messages
+    GROUP BY session_id
+    ORDER BY last_msg DESC;
+"""
+
+_DB_PATH = None
+_conn = None
 
 
 def find_database():
-    """Find the substrate database file"""
+    """Find the substrate database file (remembered once found)"""
+    global _DB_PATH
+    if _DB_PATH is not None:
+        return _DB_PATH
+
     # Check environment variable first (same as server.py uses)
     env_path = os.getenv("SQLITE_DB_PATH")
     if env_path and os.path.exists(env_path):
-        return env_path
+        _DB_PATH = env_path
+        return _DB_PATH
 
     possible_paths = [
         './data/db/substrate_state.db',
@@ -34,11 +96,55 @@ def find_database():
 
     for path in possible_paths:
         if os.path.exists(path):
-            return path
+            _DB_PATH = path
+            return _DB_PATH
 
     return None
 
 
+def _get_conn():
+    """
+    Shared connection to the database found by find_database().
+
+    Autocommit mode (isolation_level=None) so each caller wraps its work in
+    one explicit BEGIN IMMEDIATE ... COMMIT - a single WAL commit/fsync
+    instead of one per statement. Opened lazily, optimized and closed at exit.
+    """
+    global _conn
+    if _conn is None:
+        # Imported here so --help and the no-database paths skip loading it
+        import sqlite3
+        _conn = sqlite3.connect(
+            _DB_PATH,
+            isolation_level=None,
+            cached_statements=128,
+            check_same_thread=False
+        )
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        # Normally already there; INDEXED BY fails outright without it
+        _conn.execute(_SQL_ENSURE_SESSION_INDEX)
+        atexit.register(_close_conn)
+    return _conn
+
+
+def _close_conn():
+    """Refresh planner stats after the deletes, then close"""
+    import sqlite3
+    try:
+        # Re-analyzes only tables whose stats have drifted; milliseconds
+        _conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+    _conn.close()
+
+
+def _rollback(conn):
+    """Roll back an open transaction after a failure"""
+    if conn is not None and conn.in_transaction:
+        conn.execute("ROLLBACK")
+
+
 def clear_recent_messages(count, session_id=None):
     """Delete the N most recent messages"""
     print("=" * 60)
@@ -53,67 +159,62 @@ def clear_recent_messages(count, session_id=None):
 
     print(f"\nDatabase: {db_path}")
 
+    conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _get_conn()
         cursor = conn.cursor()
-
-        # Get the messages to delete
+        cursor.execute("BEGIN IMMEDIATE")
+
+        # Preview what's about to go (interactive runs only - piped/cron
+        # runs skip the extra query and the Python round trip)
+        if sys.stdout.isatty():
+            if session_id:
+                cursor.execute(_SQL_PREVIEW_RECENT_BY_SESSION, (session_id, count))
+            else:
+                cursor.execute(_SQL_PREVIEW_RECENT, (count,))
+
+            # Stream rows instead of materializing all N (--recent 100000)
+            cursor.arraysize = 256
+            shown = 0
+            for msg_id, role, content, timestamp, sess in cursor:
+                if not shown:
+                    print("\nMessages to delete:")
+                    print("-" * 50)
+                shown += 1
+                preview = content[:50].replace('\n', ' ')
+                if len(content) > 50:
+                    preview += "..."
+                print(f"  [{timestamp[-8:]}] {role}: {preview}")
+
+            if shown:
+                print("-" * 50)
+                print(f"({shown} messages)")
+
+        # One DELETE with a subquery over the (session_id, timestamp) index -
+        # no per-id placeholders, so any N works
         if session_id:
-            cursor.execute("""
-                SELECT id, role, content, timestamp, session_id
-                FROM messages
-                WHERE session_id = ?
-                ORDER BY timestamp DESC
-                LIMIT ?;
-            """, (session_id, count))
+            cursor.execute(_SQL_DELETE_RECENT_BY_SESSION, (session_id, count))
         else:
-            cursor.execute("""
-                SELECT id, role, content, timestamp, session_id
-                FROM messages
-                ORDER BY timestamp DESC
-                LIMIT ?;
-            """, (count,))
-
-        messages = cursor.fetchall()
+            cursor.execute(_SQL_DELETE_RECENT, (count,))
+        deleted = cursor.rowcount
 
-        if not messages:
+        if not deleted:
             print("\nNo messages found!")
-            conn.close()
+            cursor.execute("COMMIT")
             return 0
 
-        print(f"\nMessages to delete ({len(messages)}):")
-        print("-" * 50)
-
-        ids_to_delete = []
-        for msg in messages:
-            msg_id, role, content, timestamp, sess = msg
-            ids_to_delete.append(msg_id)
-            preview = content[:50].replace('\n', ' ')
-            if len(content) > 50:
-                preview += "..."
-            print(f"  [{timestamp[-8:]}] {role}: {preview}")
-
-        print("-" * 50)
-
-        # Delete by IDs
-        placeholders = ','.join('?' for _ in ids_to_delete)
-        cursor.execute(f"DELETE FROM messages WHERE id IN ({placeholders});", ids_to_delete)
-        deleted = cursor.rowcount
-        conn.commit()
-
         print(f"\nDeleted {deleted} messages")
 
         # Show what remains
         if session_id:
-            cursor.execute("SELECT COUNT(*) FROM messages WHERE session_id = ?;", (session_id,))
+            cursor.execute(_SQL_COUNT_BY_SESSION, (session_id,))
         else:
-            cursor.execute("SELECT COUNT(*) FROM messages;")
+            cursor.execute(_SQL_COUNT)
 
         remaining = cursor.fetchone()[0]
+        cursor.execute("COMMIT")
         print(f"Remaining messages: {remaining}")
 
-        conn.close()
-
         print("\n" + "=" * 60)
         print("DONE - Restart substrate for changes to take effect")
         print("=" * 60 + "\n")
@@ -121,6 +222,7 @@ def clear_recent_messages(count, session_id=None):
         return 0
 
     except Exception as e:
+        _rollback(conn)
         print(f"\nError: {e}")
         import traceback
         traceback.print_exc()
@@ -141,48 +243,46 @@ def clear_all_messages(session_id=None, clear_summaries=False):
 
     print(f"\nDatabase: {db_path}")
 
+    conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _get_conn()
         cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
 
-        # Count current messages
+        # Delete - the changed-row count is the number of messages there were,
+        # so no separate COUNT(*) pass over the table
         if session_id:
-            cursor.execute("SELECT COUNT(*) FROM messages WHERE session_id = ?;", (session_id,))
+            cursor.execute(_SQL_DELETE_SESSION, (session_id,))
         else:
-            cursor.execute("SELECT COUNT(*) FROM messages;")
+            cursor.execute(_SQL_DELETE_ALL)
 
-        message_count = cursor.fetchone()[0]
+        deleted = cursor.rowcount
         scope = f" for session '{session_id}'" if session_id else " total"
-        print(f"\nFound {message_count} messages{scope}")
+        print(f"\nFound {deleted} messages{scope}")
 
-        if message_count == 0:
+        if deleted == 0:
             print("No messages to clear!")
-            conn.close()
+            cursor.execute("COMMIT")
             return 0
 
-        # Delete
-        if session_id:
-            cursor.execute("DELETE FROM messages WHERE session_id = ?;", (session_id,))
-        else:
-            cursor.execute("DELETE FROM messages;")
-
-        deleted = cursor.rowcount
-        conn.commit()
         print(f"Deleted {deleted} messages")
 
         # Optionally clear summaries
         if clear_summaries:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='conversation_summaries';")
+            cursor.execute(_SQL_HAS_SUMMARIES)
             if cursor.fetchone():
                 if session_id:
-                    cursor.execute("DELETE FROM conversation_summaries WHERE session_id = ?;", (session_id,))
+                    cursor.execute(_SQL_DELETE_SUMMARIES_BY_SESSION, (session_id,))
                 else:
-                    cursor.execute("DELETE FROM conversation_summaries;")
+                    cursor.execute(_SQL_DELETE_SUMMARIES)
                 summary_deleted = cursor.rowcount
-                conn.commit()
                 print(f"Deleted {summary_deleted} summaries")
 
-        conn.close()
+        cursor.execute("COMMIT")
+
+        # Emptying (most of) the table leaves the stats describing the old
+        # row counts; refresh them so the next run's plans use the indexes
+        cursor.execute("ANALYZE messages")
 
         print("\n" + "=" * 60)
         print("DONE - Restart substrate for changes to take effect")
@@ -191,6 +291,7 @@ def clear_all_messages(session_id=None, clear_summaries=False):
         return 0
 
     except Exception as e:
+        _rollback(conn)
         print(f"\nError: {e}")
         import traceback
         traceback.print_exc()
@@ -204,20 +305,12 @@ def list_sessions():
         print("Could not find database!")
         return
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    cursor = _get_conn().cursor()
 
     print("\nSessions with messages:")
     print("-" * 50)
 
-    cursor.execute("""
-        SELECT session_id, COUNT(*) as msg_count,
-               MIN(timestamp) as first_msg,
-               MAX(timestamp) as last_msg
-        FROM messages
-        GROUP BY session_id
-        ORDER BY last_msg DESC;
-    """)
+    cursor.execute(_SQL_LIST_SESSIONS)
 
     rows = cursor.fetchall()
     if not rows:
@@ -230,55 +323,47 @@ def list_sessions():
             print(f"    Last:  {last}")
             print()
 
-    conn.close()
 
-
-def print_usage():
-    print("""
+_USAGE_EXAMPLES = """
 Usage:
   python clear_message_history.py --recent 20           # Delete 20 most recent messages
   python clear_message_history.py --recent 20 discord   # Delete 20 most recent from 'discord' session
   python clear_message_history.py --all                 # Delete ALL messages (dangerous!)
   python clear_message_history.py --all --summaries     # Also delete summaries
   python clear_message_history.py --list                # List sessions and message counts
-""")
+"""
 
+_parser = argparse.ArgumentParser(
+    description="Clear conversation message history from the substrate SQLite database.",
+    epilog=_USAGE_EXAMPLES,
+    formatter_class=argparse.RawDescriptionHelpFormatter
+)
+_parser.add_argument("--recent", type=int, metavar="N", help="delete the N most recent messages")
+_parser.add_argument("--all", action="store_true", help="delete ALL messages (dangerous!)")
+_parser.add_argument("--summaries", action="store_true", help="with --all, also delete summaries")
+_parser.add_argument("--list", action="store_true", help="list sessions and message counts")
+_parser.add_argument("session_id", nargs="?", help="limit to one session")
 
-if __name__ == "__main__":
-    args = sys.argv[1:]
 
-    if not args or "--help" in args or "-h" in args:
+def print_usage():
+    print(_USAGE_EXAMPLES)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 1:
         print_usage()
         sys.exit(0)
 
-    if "--list" in args:
+    ns = _parser.parse_args()
+
+    if ns.list:
         list_sessions()
         sys.exit(0)
 
-    # Parse --recent N
-    recent_count = None
-    session_id = None
-    clear_summaries = "--summaries" in args
-    clear_all = "--all" in args
-
-    i = 0
-    while i < len(args):
-        if args[i] == "--recent" and i + 1 < len(args):
-            try:
-                recent_count = int(args[i + 1])
-                i += 2
-                continue
-            except ValueError:
-                print(f"Error: --recent requires a number, got '{args[i + 1]}'")
-                sys.exit(1)
-        elif not args[i].startswith("--"):
-            session_id = args[i]
-        i += 1
-
-    if recent_count:
-        sys.exit(clear_recent_messages(recent_count, session_id))
-    elif clear_all:
-        sys.exit(clear_all_messages(session_id, clear_summaries))
+    if ns.recent:
+        sys.exit(clear_recent_messages(ns.recent, ns.session_id))
+    elif ns.all:
+        sys.exit(clear_all_messages(ns.session_id, ns.summaries))
     else:
         print("Error: Specify --recent N or --all")
         print_usage()
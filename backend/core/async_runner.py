@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Shared Background Event Loop
+============================
+
+One persistent asyncio loop, running in its own daemon thread, for sync
+Flask code that needs to call async APIs (consciousness loop, voice
+providers). Handlers hand coroutines to it instead of paying for
+asyncio.new_event_loop() + close() on every request.
+
+- run_async(coro)       -> block for a coroutine's result
+- iter_async(async_gen) -> drive an async generator from a sync generator
+
+Blocking calls made via run_in_executor(None, ...) share one bounded pool.
+
+The shared loop is only for coroutines that never block it (provider HTTP
+streams). Work that makes synchronous calls from inside its coroutines -
+chat turns hit the DB, embeddings and tools inline - goes through
+run_async_isolated / iter_async_isolated instead: a private loop in the
+calling request thread, so a slow call stalls only its own request.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+
+# libuv-backed loop: cheaper socket reads/writes for the provider streams
+# this loop carries. Not available on Windows; plain asyncio is the fallback.
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+EXECUTOR_MAX_WORKERS = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_async_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use"""
+    global _executor, _loop
+    if _loop is not None:
+        return _loop
+
+    with _loop_lock:
+        if _loop is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=EXECUTOR_MAX_WORKERS,
+                thread_name_prefix='async-worker'
+            )
+            loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+            loop.set_default_executor(_executor)
+            threading.Thread(
+                target=loop.run_forever,
+                name="substrate-async",
+                daemon=True
+            ).start()
+            _loop = loop
+    return _loop
+
+
+def run_async(coro, timeout: Optional[float] = None):
+    """
+    Run a coroutine on the shared loop and block for its result.
+
+    On timeout the coroutine is cancelled and
+    concurrent.futures.TimeoutError is raised.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_async_loop())
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise
+
+
+def iter_async(async_gen, timeout: Optional[float] = None):
+    """
+    Drive an async generator from a sync (WSGI) generator.
+
+    Each item is pulled on the shared loop (waiting at most `timeout`
+    seconds per item). If the client disconnects and the sync generator is
+    closed early, the async generator is closed too.
+    """
+    try:
+        while True:
+            try:
+                yield run_async(async_gen.__anext__(), timeout)
+            except StopAsyncIteration:
+                return
+    finally:
+        try:
+            run_async(async_gen.aclose())
+        except Exception:
+            pass
+
+
+# ============================================
+# PER-REQUEST LOOPS
+# ============================================
+
+def _close_loop(loop: asyncio.AbstractEventLoop):
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+def run_async_isolated(coro):
+    """Run a coroutine to completion on a private loop in the calling thread"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        _close_loop(loop)
+
+
+def iter_async_isolated(async_gen):
+    """
+    iter_async() on a private loop in the calling thread.
+
+    The loop lives as long as the sync generator; closing the generator
+    early (client disconnect) closes the async generator and the loop.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(async_gen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        try:
+            loop.run_until_complete(async_gen.aclose())
+        except Exception:
+            pass
+        _close_loop(loop)
@@ -37,8 +37,13 @@ from typing import Optional, Iterator
 
 import aiohttp
 
+from core.http_pool import create_pooled_session, get_aiohttp_session
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool for the sync streaming path
+_http = create_pooled_session()
+
 # Cartesia API endpoints
 CARTESIA_TTS_URL = "https://api.cartesia.ai/tts/bytes"
 CARTESIA_TTS_SSE_URL = "https://api.cartesia.ai/tts/sse"
@@ -122,30 +127,32 @@ class CartesiaSonicProvider:
         payload = self._build_payload(text, speed)
 
         try:
-            response = http_requests.post(
+            # Context manager hands the connection back to the pool even if
+            # the caller stops iterating early
+            with _http.post(
                 CARTESIA_TTS_URL,
                 headers=self._build_headers(),
                 json=payload,
                 stream=True,
                 timeout=30,
-            )
-            response.raise_for_status()
+            ) as response:
+                response.raise_for_status()
 
-            total_bytes = 0
-            buffer = bytearray()
+                total_bytes = 0
+                buffer = bytearray()
 
-            for data in response.iter_content(chunk_size=chunk_size):
-                buffer.extend(data)
-                while len(buffer) >= chunk_size:
-                    chunk = bytes(buffer[:chunk_size])
-                    buffer = buffer[chunk_size:]
-                    total_bytes += len(chunk)
-                    yield chunk
+                for data in response.iter_content(chunk_size=chunk_size):
+                    buffer.extend(data)
+                    while len(buffer) >= chunk_size:
+                        chunk = bytes(buffer[:chunk_size])
+                        buffer = buffer[chunk_size:]
+                        total_bytes += len(chunk)
+                        yield chunk
 
-            # Yield remaining buffer
-            if buffer:
-                total_bytes += len(buffer)
-                yield bytes(buffer)
+                # Yield remaining buffer
+                if buffer:
+                    total_bytes += len(buffer)
+                    yield bytes(buffer)
 
             logger.info(
                 f"✅ Cartesia TTS streamed: {len(text)} chars -> "
@@ -197,20 +204,20 @@ class CartesiaSonicProvider:
             payload["voice"]["id"] = voice_id
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    CARTESIA_TTS_URL,
-                    headers=self._build_headers(),
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(
-                            f"Cartesia TTS failed ({response.status}): {error_text[:200]}"
-                        )
-
-                    pcm_data = await response.read()
+            session = get_aiohttp_session()
+            async with session.post(
+                CARTESIA_TTS_URL,
+                headers=self._build_headers(),
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(
+                        f"Cartesia TTS failed ({response.status}): {error_text[:200]}"
+                    )
+
+                pcm_data = await response.read()
 
             # Wrap in WAV
             wav_io = io.BytesIO()
@@ -6,6 +6,10 @@ This ensures consistency across the codebase and proper env var handling.
 """
 
 import os
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
+from typing import Optional
 
 
 # ============================================
@@ -18,6 +22,38 @@ HEBBIAN_MIN_STRENGTH = float(os.environ.get('HEBBIAN_MIN_STRENGTH', '0.3'))
 HEBBIAN_MAX_PER_SEED = int(os.environ.get('HEBBIAN_MAX_PER_SEED', '3'))
 
 
+# ============================================
+# MODEL/PROVIDER ENV SNAPSHOT
+# ============================================
+# The model getters below are called on every LLM request and agent
+# lookup, so the env vars they depend on are read once into an immutable
+# snapshot. Call reload_config() after changing them at runtime - and after
+# load_dotenv(), since this module is usually imported before .env is read.
+
+@dataclass(frozen=True)
+class _ModelEnv:
+    mistral_model: Optional[str]
+    model_name: Optional[str]
+    default_llm_model: Optional[str]
+    ollama_api_url: Optional[str]
+    ollama_model: str
+    fallback_model: Optional[str]
+
+
+def _read_model_env() -> _ModelEnv:
+    return _ModelEnv(
+        mistral_model=os.getenv('MISTRAL_MODEL'),
+        model_name=os.getenv('MODEL_NAME'),
+        default_llm_model=os.getenv('DEFAULT_LLM_MODEL'),
+        ollama_api_url=os.getenv('OLLAMA_API_URL'),
+        ollama_model=os.getenv('OLLAMA_MODEL', '').strip(),
+        fallback_model=os.getenv('FALLBACK_MODEL'),
+    )
+
+
+_ENV = _read_model_env()
+
+
 # ============================================
 # OLLAMA HELPERS (must be defined before get_default_model)
 # ============================================
@@ -28,6 +64,8 @@ def is_ollama_cloud_configured() -> bool:
 
     Requires OLLAMA_API_URL + OLLAMA_MODEL (+ OLLAMA_API_KEY for auth).
     This competes with Mistral/Grok/OpenRouter in the provider chain.
+
+    Reads the environment live: startup checks call this after load_dotenv().
     """
     has_cloud_url = bool(os.getenv('OLLAMA_API_URL'))
     has_model = bool(os.getenv('OLLAMA_MODEL', '').strip())
@@ -74,23 +112,28 @@ def get_default_model() -> str:
     NOTE: USE_OLLAMA=true does NOT enter this chain. It enables local Ollama
     for vision (OLLAMA_VISION_MODEL) and embedding fallback only.
     """
-    model = os.getenv('MISTRAL_MODEL') or os.getenv('MODEL_NAME') or os.getenv('DEFAULT_LLM_MODEL')
+    return _resolve_default_model(_ENV)
+
+
+def _resolve_default_model(env: _ModelEnv) -> str:
+    """get_default_model() against a given env snapshot"""
+    model = env.mistral_model or env.model_name or env.default_llm_model
     if model:
         return model
 
     # Check for Ollama Cloud provider (OLLAMA_API_URL required)
-    ollama_model = os.getenv('OLLAMA_MODEL', '').strip() or None
-    if is_ollama_cloud_configured():
+    ollama_model = env.ollama_model or None
+    if env.ollama_api_url and ollama_model:
         return f'ollama:{ollama_model}'
 
     # Warn if Ollama Cloud is partially configured
-    if bool(os.getenv('OLLAMA_API_URL')) and not ollama_model:
+    if bool(env.ollama_api_url) and not ollama_model:
         import logging
         _logger = logging.getLogger(__name__)
         _logger.warning("⚠️  OLLAMA_API_URL is set but OLLAMA_MODEL is not set — Ollama Cloud will not be used")
 
     # Check for explicit fallback
-    fallback = os.getenv('FALLBACK_MODEL')
+    fallback = env.fallback_model
     if fallback:
         return fallback
 
@@ -109,20 +152,50 @@ def get_fallback_model() -> str:
     Returns:
         Fallback model from FALLBACK_MODEL env var, or None if not set.
     """
-    return os.getenv('FALLBACK_MODEL', 'moonshotai/kimi-k2-0905')
+    return _ENV.fallback_model or 'moonshotai/kimi-k2-0905'
 
 
-# Cached values for performance (loaded once at import)
-try:
-    DEFAULT_MODEL = get_default_model()
-except ValueError:
-    # During import, if no model is configured, use a placeholder
-    # This allows the module to load, but will error when actually used
-    DEFAULT_MODEL = None
+def _default_model_or_none() -> Optional[str]:
+    try:
+        return get_default_model()
+    except ValueError:
+        # If no model is configured, use a placeholder
+        # This allows the module to load, but will error when actually used
+        return None
+
 
+# Cached values for performance (loaded once at import)
+DEFAULT_MODEL = _default_model_or_none()
 FALLBACK_MODEL = get_fallback_model()
 
 
+_reload_lock = threading.Lock()
+
+
+def reload_config():
+    """
+    Re-read the model and provider env vars: the model snapshot, PROVIDERS,
+    the *_API_KEY / *_BASE_URL constants, DEFAULT_MODEL, FALLBACK_MODEL and
+    API_PROVIDER.
+
+    Call once after load_dotenv() (or after changing the env at runtime), not
+    per request. Modules that imported the constants by name keep their old
+    values; the getters see the new ones.
+    """
+    global _ENV, DEFAULT_MODEL, FALLBACK_MODEL, API_PROVIDER, PROVIDERS
+    global MISTRAL_API_KEY, MISTRAL_BASE_URL, OPENROUTER_API_KEY, OPENROUTER_BASE_URL
+    global GROK_API_KEY, GROK_BASE_URL
+    with _reload_lock:
+        _ENV = _read_model_env()
+        PROVIDERS = _read_providers()
+        MISTRAL_API_KEY, MISTRAL_BASE_URL = PROVIDERS['mistral'].key, PROVIDERS['mistral'].base_url
+        OPENROUTER_API_KEY, OPENROUTER_BASE_URL = PROVIDERS['openrouter'].key, PROVIDERS['openrouter'].base_url
+        GROK_API_KEY, GROK_BASE_URL = PROVIDERS['grok'].key, PROVIDERS['grok'].base_url
+        DEFAULT_MODEL = _default_model_or_none()
+        FALLBACK_MODEL = get_fallback_model()
+        API_PROVIDER = _compute_api_provider()
+
+
 # ============================================
 # MODEL PARAMETERS
 # ============================================
@@ -143,20 +216,40 @@ DEFAULT_AGENT_ID = os.getenv('DEFAULT_AGENT_ID', '41dc0e38-bdb6-4563-a3b6-49aa09
 # API CONFIGURATION
 # ============================================
 
-# Mistral AI (direct API access to latest models)
-MISTRAL_API_KEY = os.getenv('MISTRAL_API_KEY')
-MISTRAL_BASE_URL = os.getenv('MISTRAL_API_URL', 'https://api.mistral.ai/v1')
+# Key-based LLM providers in priority order:
+# (name, API key env var, base URL env var, default base URL)
+_PROVIDERS = (
+    ('mistral', 'MISTRAL_API_KEY', 'MISTRAL_API_URL', 'https://api.mistral.ai/v1'),  # direct API access to latest models
+    ('grok', 'GROK_API_KEY', 'GROK_BASE_URL', 'https://api.x.ai/v1'),
+    ('openrouter', 'OPENROUTER_API_KEY', 'OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1'),
+)
+
+
+def _read_providers() -> MappingProxyType:
+    """name -> (key, base_url); key is None when not configured"""
+    return MappingProxyType({
+        name: SimpleNamespace(key=os.getenv(key_env), base_url=os.getenv(url_env, default_url))
+        for name, key_env, url_env, default_url in _PROVIDERS
+    })
+
+
+# Read at import; reload_config() rebuilds it (and the constants below)
+PROVIDERS = _read_providers()
+
+# Mistral AI
+MISTRAL_API_KEY = PROVIDERS['mistral'].key
+MISTRAL_BASE_URL = PROVIDERS['mistral'].base_url
 
 # OpenRouter
-OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
-OPENROUTER_BASE_URL = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
+OPENROUTER_API_KEY = PROVIDERS['openrouter'].key
+OPENROUTER_BASE_URL = PROVIDERS['openrouter'].base_url
 
 # Grok/xAI
-GROK_API_KEY = os.getenv('GROK_API_KEY')
-GROK_BASE_URL = os.getenv('GROK_BASE_URL', 'https://api.x.ai/v1')
+GROK_API_KEY = PROVIDERS['grok'].key
+GROK_BASE_URL = PROVIDERS['grok'].base_url
 
 # Determine which API to use
-def get_api_provider() -> str:
+def _compute_api_provider() -> str:
     """
     Determine which API provider to use based on available keys.
 
@@ -169,17 +262,23 @@ def get_api_provider() -> str:
 
     NOTE: USE_OLLAMA (local) does not appear here — it's for vision/embeddings only.
     """
-    if MISTRAL_API_KEY:
-        return 'mistral'
-    elif GROK_API_KEY:
-        return 'grok'
-    elif OPENROUTER_API_KEY:
-        return 'openrouter'
-    elif is_ollama_cloud_configured():
+    for name, provider in PROVIDERS.items():
+        if provider.key:
+            return name
+    if is_ollama_cloud_configured():
         return 'ollama_cloud'
     return 'none'
 
 
+# Resolved at import and by reload_config()
+API_PROVIDER = _compute_api_provider()
+
+
+def get_api_provider() -> str:
+    """Active API provider: 'mistral', 'grok', 'openrouter', 'ollama_cloud' or 'none'"""
+    return API_PROVIDER
+
+
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
@@ -203,8 +302,9 @@ def get_model_or_default(model: str = None) -> str:
     if DEFAULT_MODEL:
         return DEFAULT_MODEL
 
-    # Try to get it fresh (in case env was set after import)
-    return get_default_model()
+    # Try it fresh from the env (in case it was set after import) - read
+    # locally, so request threads never rewrite the module globals
+    return _resolve_default_model(_read_model_env())
 
 
 def validate_config() -> dict:
@@ -219,7 +319,8 @@ def validate_config() -> dict:
 
     # Check for API keys / provider
     ollama_cloud_ok = is_ollama_cloud_configured()
-    if not MISTRAL_API_KEY and not OPENROUTER_API_KEY and not GROK_API_KEY and not ollama_cloud_ok:
+    keyed_providers = sum(bool(provider.key) for provider in PROVIDERS.values())
+    if not keyed_providers and not ollama_cloud_ok:
         issues.append("No provider configured. Set MISTRAL_API_KEY, OPENROUTER_API_KEY, GROK_API_KEY, or OLLAMA_API_URL + OLLAMA_MODEL.")
 
     # Check for model
@@ -230,7 +331,7 @@ def validate_config() -> dict:
             issues.append(str(e))
 
     # Warnings about multiple keys
-    key_count = sum([bool(MISTRAL_API_KEY), bool(GROK_API_KEY), bool(OPENROUTER_API_KEY), ollama_cloud_ok])
+    key_count = keyed_providers + ollama_cloud_ok
     if key_count > 1:
         warnings.append(f"Multiple providers configured. Priority: Mistral > Grok > OpenRouter > Ollama Cloud. Using: {get_api_provider()}")
 
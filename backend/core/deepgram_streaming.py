@@ -18,6 +18,7 @@ Usage:
     client.on_utterance_end(callback)   # Register utterance-end handler
     await client.connect()
     client.send_audio(pcm_bytes)        # Send audio chunks
+    client.finish()                     # Optional: flush final transcripts
     await client.close()
 """
 
@@ -49,6 +50,7 @@ class DeepgramStreamingClient:
         model: str = "nova-3",
         endpointing_ms: int = 500,
         sample_rate: int = 16000,
+        encoding: Optional[str] = "linear16",
     ):
         self.api_key = DEEPGRAM_API_KEY
         if not self.api_key:
@@ -58,6 +60,7 @@ class DeepgramStreamingClient:
         self.model = model
         self.endpointing_ms = endpointing_ms
         self.sample_rate = sample_rate
+        self.encoding = encoding  # None = containerized audio (webm/ogg/wav), auto-detected
 
         # Callbacks
         self._on_transcript: Optional[Callable] = None
@@ -118,12 +121,16 @@ class DeepgramStreamingClient:
             logger.error("websockets package not installed. Install with: pip install websockets")
             return
 
+        raw_audio_params = (
+            f"&encoding={self.encoding}"
+            f"&sample_rate={self.sample_rate}"
+            f"&channels=1"
+        ) if self.encoding else ""
+
         params = (
             f"?model={self.model}"
             f"&language={self.language}"
-            f"&encoding=linear16"
-            f"&sample_rate={self.sample_rate}"
-            f"&channels=1"
+            f"{raw_audio_params}"
             f"&endpointing={self.endpointing_ms}"
             f"&interim_results=true"
             f"&utterance_end_ms=1000"
@@ -212,6 +219,24 @@ class DeepgramStreamingClient:
         except Exception as e:
             logger.debug(f"Failed to send audio to Deepgram: {e}")
 
+    def finish(self, timeout: float = 5.0):
+        """Signal end of audio and wait for Deepgram to flush final results.
+
+        Deepgram sends any remaining transcripts and then closes the socket,
+        which ends the listener thread. Call close() afterwards.
+        """
+        if self._ws and self._loop and self._connected:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._ws.send(json.dumps({"type": "CloseStream"})),
+                    self._loop,
+                )
+            except Exception:
+                pass
+
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+
     def close(self):
         """Close the Deepgram WebSocket connection."""
         self._closing = True
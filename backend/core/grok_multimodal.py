@@ -21,6 +21,14 @@ Model: grok-4 or grok-4-1-fast-reasoning
 from typing import List, Dict, Any, Optional, Union
 import base64
 from pathlib import Path
+from types import MappingProxyType
+
+# Image extensions Grok accepts -> data-URL MIME type
+IMAGE_MIME_TYPES = MappingProxyType({
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png'
+})
 
 
 class GrokMultimodalMessage:
@@ -111,23 +119,19 @@ class GrokMultimodalMessage:
 
         # Determine MIME type from extension
         ext = path.suffix.lower()
-        mime_types = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png'
-        }
+        mime_type = IMAGE_MIME_TYPES.get(ext)
 
-        if ext not in mime_types:
+        if mime_type is None:
             raise ValueError(
                 f"Unsupported image format: {ext}. "
-                f"Supported: {', '.join(mime_types.keys())}"
+                f"Supported: {', '.join(IMAGE_MIME_TYPES.keys())}"
             )
 
         # Read and encode file
         with open(file_path, "rb") as f:
             image_data = base64.b64encode(f.read()).decode('utf-8')
 
-        self.add_image_base64(image_data, mime_types[ext], detail)
+        self.add_image_base64(image_data, mime_type, detail)
         return self
 
     def to_dict(self) -> Dict[str, Any]:
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP Sessions
+====================
+
+Module-level requests.Session factory for routes that call the same
+upstream over and over (Google Places, Whisper, TTS servers). A shared
+session keeps TCP/TLS connections alive between requests instead of
+paying a fresh handshake on every top-level requests.get/post.
+
+get_aiohttp_session() is the async counterpart for coroutines (voice
+providers) running on an event loop.
+"""
+
+import asyncio
+import atexit
+import weakref
+from typing import Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from core.json_utils import dumps_bytes
+
+
+def create_pooled_session(
+    pool_connections: int = 32,
+    pool_maxsize: int = 64,
+    retries: int = 2
+) -> requests.Session:
+    """
+    Build a keep-alive requests.Session with a connection pool.
+
+    Args:
+        pool_connections: Number of per-host pools to cache
+        pool_maxsize: Max connections kept per host
+        retries: Retries for idempotent requests on connect errors and
+                 502/503/504 (POST bodies are never retried). Read timeouts
+                 are not retried, so a call never runs past its timeout=
+                 budget several times over.
+
+    Returns:
+        Configured session (thread-safe for concurrent requests)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# One keep-alive aiohttp session per event loop (sessions are bound to the
+# loop they were created on), plus one per Unix socket for same-host servers.
+# In practice that's the shared loop from core.async_runner.
+AIOHTTP_LIMIT = 64
+AIOHTTP_LIMIT_PER_HOST = 16
+AIOHTTP_KEEPALIVE_TIMEOUT = 75  # seconds an idle connection stays open
+AIOHTTP_DNS_CACHE_TTL = 300     # seconds
+_aiohttp_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = \
+    weakref.WeakKeyDictionary()
+
+
+def get_aiohttp_session(unix_socket: Optional[str] = None) -> aiohttp.ClientSession:
+    """
+    Return the pooled aiohttp session for the running event loop.
+
+    Must be called from a coroutine. Use it directly - don't wrap it in
+    `async with`, which would close the shared session.
+
+    Args:
+        unix_socket: Connect through this Unix domain socket instead of TCP
+                     (URLs keep their http://host form; host/port are ignored)
+    """
+    loop = asyncio.get_running_loop()
+    sessions = _aiohttp_sessions.setdefault(loop, {})
+    session = sessions.get(unix_socket)
+    if session is None or session.closed:
+        if unix_socket:
+            connector = aiohttp.UnixConnector(
+                path=unix_socket,
+                limit=AIOHTTP_LIMIT_PER_HOST,
+                keepalive_timeout=AIOHTTP_KEEPALIVE_TIMEOUT
+            )
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=AIOHTTP_LIMIT,
+                limit_per_host=AIOHTTP_LIMIT_PER_HOST,
+                keepalive_timeout=AIOHTTP_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=AIOHTTP_DNS_CACHE_TTL
+            )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            # json= request bodies go through orjson (aiohttp wants a str)
+            json_serialize=_json_dumps
+        )
+        sessions[unix_socket] = session
+    return session
+
+
+def _json_dumps(obj) -> str:
+    return dumps_bytes(obj).decode('utf-8')
+
+
+@atexit.register
+def _close_aiohttp_sessions():
+    """Close pooled sessions whose loops are still running (clean TLS shutdown)"""
+    for loop, sessions in list(_aiohttp_sessions.items()):
+        if not loop.is_running():
+            continue
+        for session in list(sessions.values()):
+            if session.closed:
+                continue
+            try:
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result(2)
+            except Exception:
+                pass
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Fast JSON Helpers
+=================
+
+Thin wrappers around orjson for the hot HTTP paths (mobile chat, Guardian
+heartbeats). Falls back to the stdlib json module when orjson isn't
+installed so the substrate still runs on a minimal environment.
+
+- loads(raw)        -> Python object from bytes/str
+- dumps_bytes(obj)  -> UTF-8 encoded JSON bytes
+"""
+
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(raw) -> Any:
+    """Decode JSON from bytes or str (raises ValueError on bad input)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode obj to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def parse_request_json(request) -> Optional[Any]:
+    """
+    Parse a Flask request body straight from its raw bytes.
+
+    Skips Flask's content-type check and stdlib decode. Returns None for an
+    empty or malformed body (callers answer with a 400).
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None
+    try:
+        return loads(raw)
+    except ValueError:
+        return None
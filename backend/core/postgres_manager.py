@@ -393,6 +393,24 @@ class PostgresManager:
                 ON message_summaries(session_id, created_at DESC)
             """)
             
+            # 6. GUARDIAN HEARTBEATS TABLE (Mobile GPS telemetry)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS guardian_heartbeats (
+                    id BIGSERIAL PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    received_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                    latitude DOUBLE PRECISION,
+                    longitude DOUBLE PRECISION,
+                    speed DOUBLE PRECISION,
+                    battery_level INTEGER
+                )
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_guardian_heartbeats_user
+                ON guardian_heartbeats(user_id, received_at DESC)
+            """)
+
             cursor.close()
             print("✅ PostgreSQL schema initialized - ALL TABLES READY!")
     
@@ -781,7 +799,39 @@ class PostgresManager:
             )
             
             cursor.close()
-    
+
+    # ============================================
+    # GUARDIAN METHODS
+    # ============================================
+
+    def add_guardian_heartbeats(self, rows: List[Tuple]) -> int:
+        """
+        Bulk-insert Guardian heartbeats in a single round trip.
+
+        Args:
+            rows: (user_id, received_at, latitude, longitude, speed, battery_level) tuples
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            extras.execute_values(
+                cursor,
+                """
+                INSERT INTO guardian_heartbeats
+                (user_id, received_at, latitude, longitude, speed, battery_level)
+                VALUES %s
+                """,
+                rows,
+                page_size=len(rows)
+            )
+            cursor.close()
+            return len(rows)
+
     # ============================================
     # UTILITIES
     # ============================================
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Optional Redis Client
+=====================
+
+Shared Redis connection for caches and cross-worker state. Redis is
+optional: when REDIS_URL is unset or the redis package isn't installed,
+get_redis() returns None and callers fall back to in-process storage.
+
+Environment Variables:
+- REDIS_URL: e.g. redis://localhost:6379/0 (unset = disabled)
+"""
+
+import os
+import logging
+import threading
+from typing import Optional
+
+from core.json_utils import loads, dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+REDIS_URL = os.getenv('REDIS_URL', '')
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_redis() -> Optional["redis.Redis"]:
+    """
+    Return the shared Redis client, or None if Redis isn't configured.
+
+    The client returns raw bytes (decode_responses=False) and uses short
+    socket timeouts so a slow Redis never stalls a request for long.
+    """
+    global _client
+    if not (REDIS_AVAILABLE and REDIS_URL):
+        return None
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            _client = redis.Redis.from_url(
+                REDIS_URL,
+                decode_responses=False,
+                socket_timeout=0.5,
+                socket_connect_timeout=0.5,
+                health_check_interval=30
+            )
+            logger.info(f"🧱 Redis client configured: {REDIS_URL.split('@')[-1]}")
+    return _client
+
+
+_MISSING = object()
+
+
+class SharedStateMap:
+    """
+    Dict-like JSON store shared across workers.
+
+    Backed by Redis when REDIS_URL is configured, otherwise by a plain
+    in-process dict (single-worker behaviour, same as before). Values must
+    be JSON-serializable. With Redis, get() returns a copy - write the value
+    back after mutating it.
+
+    Redis layout:
+    - ttl=None: one hash named `namespace` (field per key)
+    - ttl=N:    one string key per entry, `namespace:key`, expiring after N s
+
+    A write that fails while Redis is configured is kept in-process and
+    takes precedence for reads in this worker; the next operation that
+    reaches Redis replays it there, so it isn't lost when Redis recovers.
+    """
+
+    def __init__(self, namespace: str, ttl: Optional[int] = None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._local: dict = {}
+        self._local_lock = threading.Lock()
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _redis_set(self, r, key: str, value):
+        raw = dumps_bytes(value)
+        if self.ttl is None:
+            r.hset(self.namespace, key, raw)
+        else:
+            r.setex(self._redis_key(key), self.ttl, raw)
+
+    def _replay_local(self, r):
+        """Write entries buffered during a Redis outage back to Redis"""
+        if not self._local:
+            return
+        with self._local_lock:
+            pending = list(self._local.items())
+        for key, value in pending:
+            try:
+                self._redis_set(r, key, value)
+            except Exception:
+                return  # Still down - keep the rest buffered
+            with self._local_lock:
+                if self._local.get(key, _MISSING) is value:
+                    del self._local[key]
+        logger.info(f"🧱 Replayed buffered writes to Redis ({self.namespace})")
+
+    def get(self, key: str, default=None):
+        r = get_redis()
+        if r is None:
+            return self._local.get(key, default)
+        self._replay_local(r)
+        value = self._local.get(key, _MISSING)
+        if value is not _MISSING:
+            # Buffered write not replayed yet - newer than anything in Redis
+            return value
+        try:
+            if self.ttl is None:
+                raw = r.hget(self.namespace, key)
+            else:
+                raw = r.get(self._redis_key(key))
+        except Exception as e:
+            logger.warning(f"⚠️ Redis read failed ({self.namespace}): {e}")
+            return self._local.get(key, default)
+        return loads(raw) if raw is not None else default
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value):
+        r = get_redis()
+        if r is None:
+            self._local[key] = value
+            return
+        self._replay_local(r)
+        try:
+            self._redis_set(r, key, value)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis write failed, buffered until it recovers ({self.namespace}): {e}")
+            with self._local_lock:
+                self._local[key] = value
+            return
+        with self._local_lock:
+            self._local.pop(key, None)
+
+    def pop(self, key: str, default=None):
+        """Atomically read and remove an entry"""
+        r = get_redis()
+        if r is None:
+            return self._local.pop(key, default)
+        self._replay_local(r)
+        with self._local_lock:
+            local_value = self._local.pop(key, _MISSING)
+        if local_value is not _MISSING:
+            default = local_value
+        try:
+            pipe = r.pipeline(transaction=True)
+            if self.ttl is None:
+                pipe.hget(self.namespace, key)
+                pipe.hdel(self.namespace, key)
+            else:
+                pipe.get(self._redis_key(key))
+                pipe.delete(self._redis_key(key))
+            raw, _ = pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ Redis pop failed ({self.namespace}): {e}")
+            return default
+        if local_value is not _MISSING:
+            return local_value
+        return loads(raw) if raw is not None else default
+
+    def __delitem__(self, key: str):
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        r = get_redis()
+        if r is None:
+            return len(self._local)
+        try:
+            if self.ttl is None:
+                return r.hlen(self.namespace)
+            return sum(1 for _ in r.scan_iter(match=self._redis_key('*'), count=500))
+        except Exception as e:
+            logger.warning(f"⚠️ Redis count failed ({self.namespace}): {e}")
+            return len(self._local)
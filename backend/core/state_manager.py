@@ -1128,6 +1128,26 @@ class StateManager:
                     return row[0]
             return default
     
+    def state_length(self, key: str) -> Optional[int]:
+        """
+        Get the stored length of an agent state value without loading it.
+        
+        Args:
+            key: State key
+            
+        Returns:
+            Length in characters of the stored (serialized) value, or None if
+            the key doesn't exist
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT length(value) FROM agent_state WHERE key = ?
+            """, (key,))
+            
+            row = cursor.fetchone()
+            return row[0] if row else None
+    
     # ============================================
     # UTILITIES
     # ============================================
@@ -10,17 +10,32 @@ Supports: Cartesia Sonic, Hume Octave (custom voice), ElevenLabs (Turbo),
 Usage:
     provider = get_voice_provider()
     audio = await provider.text_to_speech("Hello User")
+
+    # Or chunk-by-chunk, for lower time-to-first-byte
+    async for chunk in provider.text_to_speech_stream("Hello User"):
+        ...
 """
 
 import os
+import asyncio
 import logging
+import threading
 import aiohttp
 import base64
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, Tuple
+
+from core.async_runner import get_async_loop
+from core.http_pool import create_pooled_session, get_aiohttp_session
 
 logger = logging.getLogger(__name__)
 
+# Chunk size when relaying streamed audio from an upstream
+STREAM_CHUNK_SIZE = 8192
+
+# Keep-alive pool for the sync (telephony) synthesis paths
+_http = create_pooled_session()
+
 
 class VoiceProvider(ABC):
     """Abstract base class for voice providers"""
@@ -35,6 +50,20 @@ class VoiceProvider(ABC):
         """Convert text to audio bytes"""
         pass
 
+    async def text_to_speech_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        speed: float = 1.0
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield audio chunks as they arrive.
+
+        Default is a single chunk with the full text_to_speech() result;
+        providers with a streaming upstream override this.
+        """
+        yield await self.text_to_speech(text, voice_id=voice_id, speed=speed)
+
     @abstractmethod
     async def speech_to_text(
         self,
@@ -49,6 +78,15 @@ class VoiceProvider(ABC):
         """Return provider identifier"""
         pass
 
+    async def warmup(self) -> None:
+        """
+        Open a pooled connection to the upstream ahead of the first request.
+
+        Default does nothing; HTTPS providers override it so the first
+        synthesis doesn't pay DNS + TCP + TLS setup.
+        """
+        return None
+
 
 class ElevenLabsTurboProvider(VoiceProvider):
     """
@@ -60,6 +98,13 @@ class ElevenLabsTurboProvider(VoiceProvider):
         self.api_key = os.getenv('ELEVENLABS_API_KEY')
         self.voice_id = os.getenv('ELEVENLABS_VOICE_ID', 'pNInz6obpgDQGcFmaJgB')  # Default: Adam
         self.model_id = os.getenv('ELEVENLABS_MODEL', 'eleven_turbo_v2_5')  # Turbo for low latency
+        # 32 kbps mono MP3 is plenty for speech and ~4x smaller than the
+        # 128 kbps API default - mobile egress is the bottleneck. Keep an
+        # mp3_* format: the TTS routes serve this provider as audio/mpeg.
+        self.output_format = os.getenv('ELEVENLABS_OUTPUT_FORMAT', 'mp3_22050_32')
+        # 0-4: higher trades some quality for earlier first audio bytes
+        # (4 also skips text normalization). Empty = API default.
+        self.streaming_latency = os.getenv('ELEVENLABS_OPTIMIZE_STREAMING_LATENCY', '3')
         self.base_url = "https://api.elevenlabs.io/v1"
 
         if not self.api_key:
@@ -67,6 +112,20 @@ class ElevenLabsTurboProvider(VoiceProvider):
 
         logger.info(f"🎙️ ElevenLabs provider initialized (voice: {self.voice_id}, model: {self.model_id})")
 
+    async def warmup(self) -> None:
+        """Cheap authenticated GET that leaves a warm TLS connection in the pool"""
+        try:
+            session = get_aiohttp_session()
+            async with session.get(
+                f"{self.base_url}/voices/{self.voice_id}",
+                headers={"xi-api-key": self.api_key},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                await response.read()
+            logger.info(f"🔥 ElevenLabs connection warmed ({response.status})")
+        except Exception as e:
+            logger.warning(f"⚠️ ElevenLabs warmup failed: {e}")
+
     async def text_to_speech(
         self,
         text: str,
@@ -75,8 +134,50 @@ class ElevenLabsTurboProvider(VoiceProvider):
     ) -> bytes:
         """Generate speech using ElevenLabs Turbo v2.5"""
 
+        url, headers, payload = self._build_request(text, voice_id)
+
+        try:
+            session = get_aiohttp_session()
+            async with session.post(url, headers=headers, json=payload) as response:
+                if response.status == 200:
+                    audio_data = await response.read()
+                    logger.info(f"✅ ElevenLabs TTS: {len(text)} chars -> {len(audio_data)} bytes")
+                    return audio_data
+                else:
+                    error_text = await response.text()
+                    logger.error(f"❌ ElevenLabs error {response.status}: {error_text}")
+                    raise Exception(f"ElevenLabs TTS failed: {response.status}")
+
+        except Exception as e:
+            logger.exception(f"ElevenLabs TTS error: {e}")
+            raise
+
+    async def text_to_speech_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        speed: float = 1.0
+    ) -> AsyncIterator[bytes]:
+        """Relay ElevenLabs' streaming endpoint chunk-by-chunk"""
+
+        url, headers, payload = self._build_request(text, voice_id)
+
+        session = get_aiohttp_session()
+        async with session.post(url, headers=headers, json=payload) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"❌ ElevenLabs error {response.status}: {error_text}")
+                raise Exception(f"ElevenLabs TTS failed: {response.status}")
+
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                yield chunk
+
+    def _build_request(self, text: str, voice_id: Optional[str]):
+        """URL, headers and JSON payload for a TTS call"""
         voice = voice_id or self.voice_id
-        url = f"{self.base_url}/text-to-speech/{voice}/stream"
+        url = f"{self.base_url}/text-to-speech/{voice}/stream?output_format={self.output_format}"
+        if self.streaming_latency:
+            url += f"&optimize_streaming_latency={self.streaming_latency}"
 
         headers = {
             "xi-api-key": self.api_key,
@@ -95,21 +196,7 @@ class ElevenLabsTurboProvider(VoiceProvider):
             }
         }
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        audio_data = await response.read()
-                        logger.info(f"✅ ElevenLabs TTS: {len(text)} chars -> {len(audio_data)} bytes")
-                        return audio_data
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"❌ ElevenLabs error {response.status}: {error_text}")
-                        raise Exception(f"ElevenLabs TTS failed: {response.status}")
-
-        except Exception as e:
-            logger.exception(f"ElevenLabs TTS error: {e}")
-            raise
+        return url, headers, payload
 
     async def speech_to_text(
         self,
@@ -271,15 +358,13 @@ class HumeOctaveProvider(VoiceProvider):
         Each streaming chunk is a complete WAV file, so we extract PCM from
         each and merge into a single WAV.
         """
-        import requests as http_requests
-
         body = self._build_request_body(text, speed)
         headers = {
             "X-Hume-Api-Key": self.api_key,
             "Content-Type": "application/json",
         }
 
-        response = http_requests.post(
+        response = _http.post(
             self.STREAMING_URL,
             headers=headers,
             json=body,
@@ -374,28 +459,28 @@ class HumeOctaveProvider(VoiceProvider):
 
         try:
             audio_chunks = []
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.STREAMING_URL, headers=headers, json=body,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Hume TTS failed ({response.status}): {error_text}")
-
-                    # Read streaming JSON lines
-                    import json
-                    async for line in response.content:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            chunk = json.loads(line)
-                            audio_b64 = chunk.get("audio")
-                            if audio_b64:
-                                audio_chunks.append(base64.b64decode(audio_b64))
-                        except Exception:
-                            continue
+            session = get_aiohttp_session()
+            async with session.post(
+                self.STREAMING_URL, headers=headers, json=body,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"Hume TTS failed ({response.status}): {error_text}")
+
+                # Read streaming JSON lines
+                import json
+                async for line in response.content:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        chunk = json.loads(line)
+                        audio_b64 = chunk.get("audio")
+                        if audio_b64:
+                            audio_chunks.append(base64.b64decode(audio_b64))
+                    except Exception:
+                        continue
 
             if not audio_chunks:
                 raise Exception("Hume TTS returned no audio data")
@@ -465,7 +550,10 @@ class PocketTTSProvider(VoiceProvider):
 
     def __init__(self):
         self.base_url = os.getenv('POCKETTTS_URL', 'http://localhost:8001')
-        logger.info(f"🎙️ Pocket TTS provider initialized ({self.base_url})")
+        # Same-host server: go through its Unix socket (pockettts_server --uds)
+        # instead of loopback TCP. Requests keep base_url for the path.
+        self.socket_path = os.getenv('POCKETTTS_UDS') or None
+        logger.info(f"🎙️ Pocket TTS provider initialized ({self.socket_path or self.base_url})")
 
     async def text_to_speech(
         self,
@@ -482,25 +570,54 @@ class PocketTTSProvider(VoiceProvider):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, timeout=30) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get('Content-Type', '')
+            session = get_aiohttp_session(self.socket_path)
+            async with session.post(url, json=payload, timeout=30) as response:
+                if response.status == 200:
+                    content_type = response.headers.get('Content-Type', '')
 
-                        if 'audio' in content_type:
-                            return await response.read()
-                        else:
-                            data = await response.json()
-                            if 'audio' in data:
-                                return base64.b64decode(data['audio'])
+                    if 'audio' in content_type:
+                        return await response.read()
+                    else:
+                        data = await response.json()
+                        if 'audio' in data:
+                            return base64.b64decode(data['audio'])
 
-                    logger.error(f"Pocket TTS error: {response.status}")
-                    raise Exception(f"Pocket TTS failed: {response.status}")
+                logger.error(f"Pocket TTS error: {response.status}")
+                raise Exception(f"Pocket TTS failed: {response.status}")
 
         except Exception as e:
             logger.exception(f"Pocket TTS error: {e}")
             raise
 
+    async def text_to_speech_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        speed: float = 1.0
+    ) -> AsyncIterator[bytes]:
+        """Relay Pocket TTS audio as it's generated (JSON replies arrive whole)"""
+
+        url = f"{self.base_url}/tts"
+        payload = {
+            "text": text,
+            "voice": voice_id or "default",
+        }
+
+        session = get_aiohttp_session(self.socket_path)
+        async with session.post(url, json=payload, timeout=30) as response:
+            if response.status != 200:
+                logger.error(f"Pocket TTS error: {response.status}")
+                raise Exception(f"Pocket TTS failed: {response.status}")
+
+            if 'audio' in response.headers.get('Content-Type', ''):
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    yield chunk
+            else:
+                data = await response.json()
+                if 'audio' not in data:
+                    raise Exception("Pocket TTS returned no audio")
+                yield base64.b64decode(data['audio'])
+
     async def speech_to_text(
         self,
         audio_data: bytes,
@@ -514,61 +631,124 @@ class PocketTTSProvider(VoiceProvider):
 
 
 # Provider factory
+#
+# The active provider is cached with the version it was built for.
+# reset_voice_provider() only bumps the version; the next
+# get_voice_provider() call rebuilds under a lock, so in-flight requests
+# finish on the instance they already hold. A rebuild whose voice config
+# (env vars) is unchanged keeps the existing instance and its HTTP sessions,
+# unless that instance was a fallback after another provider failed to init.
+_VOICE_CONFIG_PREFIXES = (
+    'VOICE_PROVIDER', 'ELEVENLABS_', 'CARTESIA_', 'HUME_', 'AWS_', 'POLLY_', 'POCKETTTS_'
+)
+
 _provider_instance: Optional[VoiceProvider] = None
+_provider_built_version = -1
+_provider_config: Optional[tuple] = None  # None = rebuild on next reset
+_PROVIDER_VERSION = 0
+_provider_lock = threading.Lock()
 
-def get_voice_provider() -> VoiceProvider:
-    """
-    Get the configured voice provider.
 
-    Priority:
-    1. VOICE_PROVIDER env var (elevenlabs, cartesia, hume, polly, pockettts)
-    2. If ELEVENLABS_API_KEY exists -> ElevenLabs
-    3. If CARTESIA_API_KEY exists -> Cartesia Sonic
-    4. If HUME_API_KEY exists -> Hume Octave
-    5. If AWS_ACCESS_KEY_ID exists -> Amazon Polly
-    6. Fallback to Pocket TTS
-    """
-    global _provider_instance
+def _voice_config_fingerprint() -> tuple:
+    """Snapshot of the env vars that select/configure the voice provider"""
+    return tuple(sorted(
+        (key, value) for key, value in os.environ.items()
+        if key.startswith(_VOICE_CONFIG_PREFIXES)
+    ))
 
-    if _provider_instance is not None:
-        return _provider_instance
 
+def _build_voice_provider() -> Tuple[VoiceProvider, bool]:
+    """
+    Instantiate the first configured provider that initializes.
+
+    Returns (provider, fell_back) - fell_back is True if a preferred
+    provider failed to initialize along the way.
+    """
     provider_name = os.getenv('VOICE_PROVIDER', 'auto')
+    fell_back = False
 
     if provider_name == 'elevenlabs' or (provider_name == 'auto' and os.getenv('ELEVENLABS_API_KEY')):
         try:
-            _provider_instance = ElevenLabsTurboProvider()
-            return _provider_instance
+            return ElevenLabsTurboProvider(), fell_back
         except Exception as e:
             logger.warning(f"ElevenLabs init failed, trying next provider: {e}")
+            fell_back = True
 
     if provider_name == 'cartesia' or (provider_name == 'auto' and os.getenv('CARTESIA_API_KEY')):
         try:
             from core.cartesia_provider import CartesiaSonicProvider
-            _provider_instance = CartesiaSonicProvider()
-            return _provider_instance
+            return CartesiaSonicProvider(), fell_back
         except Exception as e:
             logger.warning(f"Cartesia Sonic init failed, trying next provider: {e}")
+            fell_back = True
 
     if provider_name == 'hume' or (provider_name == 'auto' and os.getenv('HUME_API_KEY')):
         try:
-            _provider_instance = HumeOctaveProvider()
-            return _provider_instance
+            return HumeOctaveProvider(), fell_back
         except Exception as e:
             logger.warning(f"Hume Octave init failed, trying next provider: {e}")
+            fell_back = True
 
     if provider_name == 'polly' or (provider_name == 'auto' and os.getenv('AWS_ACCESS_KEY_ID')):
         try:
-            _provider_instance = AmazonPollyProvider()
-            return _provider_instance
+            return AmazonPollyProvider(), fell_back
         except Exception as e:
             logger.warning(f"Amazon Polly init failed, falling back to Pocket TTS: {e}")
+            fell_back = True
 
-    _provider_instance = PocketTTSProvider()
-    return _provider_instance
+    return PocketTTSProvider(), fell_back
+
+
+def get_voice_provider() -> VoiceProvider:
+    """
+    Get the configured voice provider.
+
+    Priority:
+    1. VOICE_PROVIDER env var (elevenlabs, cartesia, hume, polly, pockettts)
+    2. If ELEVENLABS_API_KEY exists -> ElevenLabs
+    3. If CARTESIA_API_KEY exists -> Cartesia Sonic
+    4. If HUME_API_KEY exists -> Hume Octave
+    5. If AWS_ACCESS_KEY_ID exists -> Amazon Polly
+    6. Fallback to Pocket TTS
+    """
+    global _provider_instance, _provider_built_version, _provider_config
+
+    # Fast path: no lock once built and current
+    instance = _provider_instance
+    if instance is not None and _provider_built_version == _PROVIDER_VERSION:
+        return instance
+
+    with _provider_lock:
+        version = _PROVIDER_VERSION
+        if _provider_instance is not None and _provider_built_version == version:
+            return _provider_instance
+
+        config = _voice_config_fingerprint()
+        if _provider_instance is None or config != _provider_config:
+            _provider_instance, fell_back = _build_voice_provider()
+            _provider_config = None if fell_back else config
+            # Fresh instance: open its upstream connection in the background
+            asyncio.run_coroutine_threadsafe(_provider_instance.warmup(), get_async_loop())
+        else:
+            logger.info("🔄 Voice config unchanged - keeping current provider instance")
+        _provider_built_version = version
+        return _provider_instance
+
+
+def warm_voice_provider():
+    """
+    Build the configured provider ahead of the first request.
+
+    Building it schedules warmup() on the shared loop, so this returns
+    immediately while the connection is opened in the background.
+    """
+    try:
+        get_voice_provider()
+    except Exception as e:
+        logger.warning(f"⚠️ Voice provider warmup skipped: {e}")
 
 
 def reset_voice_provider():
-    """Reset provider instance (for testing)"""
-    global _provider_instance
-    _provider_instance = None
+    """Mark the cached provider stale; it is rebuilt lazily on next use"""
+    global _PROVIDER_VERSION
+    _PROVIDER_VERSION += 1  # never blocks behind a rebuild in progress
@@ -9,27 +9,89 @@ Usage:
 
 Environment variables:
     POCKETTTS_PORT: Server port (default: 8001)
+    POCKETTTS_UDS: Also listen on this Unix socket path (same-host clients skip TCP)
     POCKETTTS_VOICES_DIR: Directory containing voice reference WAV/safetensors files (default: ./voices)
     POCKETTTS_DEFAULT_VOICE: Default voice file to use for cloning (e.g., 'Assistant.wav' or 'Assistant.safetensors')
     POCKETTTS_TEMP: Sampling temperature (default: 0.7)
+    POCKETTTS_WORKERS: Generation threads (default: 1 - requests queue for the model)
+    POCKETTTS_PRECISION: 'fp32' (default) or 'int8' - dynamic int8 quantization of Linear layers
+    POCKETTTS_THREADS: torch intra-op threads (default: torch's choice, or cores / POCKETTTS_WORKERS)
+    POCKETTTS_WARMUP: Run one short generation at startup (default: true)
+    POCKETTTS_PRELOAD_VOICES: Load every voice file's state at startup (default: true)
+    POCKETTTS_MP3_BITRATE: kbps for response_format=mp3 (default: 64, needs lameenc)
+    POCKETTTS_AUDIO_CACHE_SIZE: Generated utterances kept per (voice, text) (default: 128, 0 = off)
 
 Install:
-    pip install pocket-tts fastapi uvicorn
+    pip install pocket-tts fastapi "uvicorn[standard]"  # [standard] adds uvloop + httptools
+    pip install lameenc  # optional, for response_format=mp3
 """
 
 import argparse
-import io
+import asyncio
+import contextlib
+import hashlib
+import importlib.util
 import logging
 import os
+import socket
+import struct
 import sys
+import threading
 import time
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
-import scipy.io.wavfile
+import numpy as np
 from fastapi import FastAPI, HTTPException, Form, Query
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
+# torch arrives with pocket-tts. Imported on first use rather than here, so
+# `--help` and importing this module don't pay for it (a running server still
+# does, via pocket_tts in load_model); the server still runs without it.
+torch = None
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+
+
+def _ensure_torch() -> bool:
+    """Import torch on first call. Returns whether it's usable"""
+    global torch, TORCH_AVAILABLE
+    if torch is None and TORCH_AVAILABLE:
+        try:
+            import torch as _torch
+        except ImportError as e:
+            # Present but broken install - fall back as if it were missing
+            logger.warning(f"torch import failed, continuing without it: {e}")
+            TORCH_AVAILABLE = False
+        else:
+            torch = _torch
+    return torch is not None
+
+
+def _inference_mode():
+    """torch.inference_mode(), or a no-op context when torch isn't usable"""
+    return torch.inference_mode() if _ensure_torch() else contextlib.nullcontext()
+
+
+# orjson-backed JSON responses (/health, /v1/voices) when it's installed
+try:
+    from fastapi.responses import ORJSONResponse
+    import orjson  # noqa: F401 - ORJSONResponse needs it at render time
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
+# In-process MP3 encoding (libmp3lame) for response_format=mp3
+try:
+    import lameenc
+    LAMEENC_AVAILABLE = True
+except ImportError:
+    LAMEENC_AVAILABLE = False
+
+MP3_BITRATE = int(os.getenv("POCKETTTS_MP3_BITRATE", "64"))
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,14 +102,47 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Pocket TTS Server",
     description="Local TTS server using Pocket TTS (Kyutai)",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DEFAULT_RESPONSE_CLASS
+)
+
+
+@dataclass
+class AppState:
+    """Loaded model and voice configuration.
+
+    Built completely by load_model() and then published as app.state.tts in
+    one assignment, so a request always sees one consistent model/voices
+    pairing and /health only reports healthy once warmup has finished.
+    """
+    model: Any
+    voices_dir: str
+    default_voice: Optional[str]
+    voice_states: dict = field(default_factory=dict)  # Cache of loaded voice states
+
+
+app.state.tts = None  # AppState once the model is loaded
+
+# Voice directory listing, rebuilt only when the directory's mtime changes
+# (adding/removing/renaming a file bumps it): ((dir, mtime_ns), voices, file names)
+_voices_snapshot = (None, [], frozenset())
+
+# generate_audio() is blocking and pocket-tts has no batched generate, so
+# requests queue on a dedicated pool instead of running on the event loop -
+# /health and other requests stay responsive while audio is generated.
+GENERATION_WORKERS = int(os.getenv("POCKETTTS_WORKERS", "1"))
+_generation_executor = ThreadPoolExecutor(
+    max_workers=GENERATION_WORKERS,
+    thread_name_prefix="pockettts-gen"
 )
 
-# Global model instance
-tts_model = None
-voice_states = {}  # Cache of loaded voice states
-voices_dir = None
-default_voice_name = None
+# pocket-tts exposes no separate text frontend to cache, so short repeated
+# phrases (greetings, acks - telephony calls this server uncached) reuse the
+# whole generated utterance: (voice, text) -> int16 samples, LRU
+AUDIO_CACHE_SIZE = int(os.getenv("POCKETTTS_AUDIO_CACHE_SIZE", "128"))
+AUDIO_CACHE_MAX_TEXT = 200  # chars; longer text is rarely repeated and costly to hold
+_audio_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_audio_cache_lock = threading.Lock()
 
 
 class TTSRequest(BaseModel):
@@ -57,84 +152,100 @@ class TTSRequest(BaseModel):
     response_format: Optional[str] = "wav"
 
 
-def get_voice_path(voice_name: str) -> Optional[str]:
+def get_voice_path(st: AppState, voice_name: str) -> Optional[str]:
     """Get the full path to a voice file.
 
     Args:
+        st: Loaded server state
         voice_name: Voice name (e.g., 'Assistant', 'Assistant.wav', or 'Assistant.safetensors')
 
     Returns:
         Full path to voice file, or None if not found
     """
-    if not voices_dir:
-        return None
+    voices_dir = st.voices_dir
+    _, files = _voice_files(voices_dir)
 
     # Check for safetensors first (faster loading)
     if not voice_name.endswith(('.wav', '.safetensors')):
-        safetensors_path = os.path.join(voices_dir, f"{voice_name}.safetensors")
-        if os.path.exists(safetensors_path):
-            return safetensors_path
-        wav_path = os.path.join(voices_dir, f"{voice_name}.wav")
-        if os.path.exists(wav_path):
-            return wav_path
+        for candidate in (f"{voice_name}.safetensors", f"{voice_name}.wav"):
+            if candidate in files:
+                return os.path.join(voices_dir, candidate)
         return None
 
-    voice_path = os.path.join(voices_dir, voice_name)
-    if os.path.exists(voice_path):
-        return voice_path
+    if voice_name in files:
+        return os.path.join(voices_dir, voice_name)
     return None
 
 
-def list_available_voices() -> list:
+def list_available_voices(voices_dir: Optional[str]) -> list:
     """List all available voice files in the voices directory."""
-    if not voices_dir or not os.path.exists(voices_dir):
-        return []
+    voices, _ = _voice_files(voices_dir)
+    return voices
 
+
+def _voice_files(voices_dir: Optional[str]) -> tuple:
+    """(voices, file names) for voices_dir - one stat per call, listdir only on change"""
+    global _voices_snapshot
+
+    if not voices_dir:
+        return [], frozenset()
+    try:
+        version = (voices_dir, os.stat(voices_dir).st_mtime_ns)
+    except OSError:
+        return [], frozenset()
+
+    snapshot = _voices_snapshot
+    if snapshot[0] == version:
+        return snapshot[1], snapshot[2]
+
+    files = frozenset(os.listdir(voices_dir))
     voices = []
     seen = set()
-    for f in os.listdir(voices_dir):
+    for f in sorted(files):
         if f.endswith('.safetensors'):
             voice_id = f[:-len('.safetensors')]
-            if voice_id not in seen:
-                seen.add(voice_id)
-                voices.append({
-                    "voice_id": voice_id,
-                    "name": voice_id.title(),
-                    "file": f,
-                    "format": "safetensors"
-                })
+            fmt = "safetensors"
         elif f.endswith('.wav'):
             voice_id = f[:-4]
-            if voice_id not in seen:
-                seen.add(voice_id)
-                voices.append({
-                    "voice_id": voice_id,
-                    "name": voice_id.title(),
-                    "file": f,
-                    "format": "wav"
-                })
-    return voices
+            fmt = "wav"
+        else:
+            continue
+        if voice_id in seen:
+            continue
+        # Same preference as get_voice_path: safetensors over wav
+        if fmt == "wav" and f"{voice_id}.safetensors" in files:
+            continue
+        seen.add(voice_id)
+        voices.append({
+            "voice_id": voice_id,
+            "name": voice_id.title(),
+            "file": f,
+            "format": fmt
+        })
+
+    _voices_snapshot = (version, voices, files)
+    return voices, files
 
 
-def get_or_load_voice_state(voice_name: str):
+def get_or_load_voice_state(st: AppState, voice_name: str):
     """Get a cached voice state or load it from file.
 
     Args:
+        st: Loaded server state
         voice_name: Voice name or 'default' for the default voice
 
     Returns:
         Voice state object for Pocket TTS generation
     """
-    global voice_states
-
+    voice_states = st.voice_states
     if voice_name in voice_states:
         return voice_states[voice_name]
 
-    voice_path = get_voice_path(voice_name)
+    voice_path = get_voice_path(st, voice_name)
     if voice_path:
         logger.info(f"Loading voice state: {voice_name} ({voice_path})")
         start = time.time()
-        state = tts_model.get_state_for_audio_prompt(voice_path)
+        state = _load_voice_state(st, voice_path)
         logger.info(f"Voice state loaded in {time.time() - start:.2f}s")
         voice_states[voice_name] = state
         return state
@@ -142,14 +253,43 @@ def get_or_load_voice_state(voice_name: str):
     return None
 
 
+def _load_voice_state(st: AppState, voice_path: str):
+    """Voice state for a file, reusing a saved state for WAV prompts.
+
+    Encoding a WAV prompt depends only on the file's bytes, so the state is
+    saved under <voices_dir>/.state_cache/<sha256>.pt and later loads (and
+    restarts) skip the encoder. .safetensors files are already precomputed.
+    """
+    if not _ensure_torch() or not voice_path.endswith('.wav'):
+        return st.model.get_state_for_audio_prompt(voice_path)
+
+    with open(voice_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    cache_path = os.path.join(st.voices_dir, ".state_cache", f"{digest}.pt")
+
+    if os.path.exists(cache_path):
+        try:
+            return torch.load(cache_path, weights_only=False)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable voice state cache {cache_path}: {e}")
+
+    state = st.model.get_state_for_audio_prompt(voice_path)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        torch.save(state, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not cache voice state for {voice_path}: {e}")
+    return state
+
+
 def load_model(temp: float = None):
-    """Load the Pocket TTS model
+    """Load the Pocket TTS model and publish it as app.state.tts
 
     Args:
         temp: Sampling temperature (default: from env or 0.7)
     """
-    global tts_model, voices_dir, default_voice_name
-
     try:
         from pocket_tts import TTSModel
 
@@ -171,26 +311,45 @@ def load_model(temp: float = None):
         logger.info(f"Loading Pocket TTS model (temp: {temperature})")
         start_time = time.time()
 
-        tts_model = TTSModel.load_model(temp=temperature)
+        _configure_torch_threads()
+        st = AppState(
+            model=_apply_precision(TTSModel.load_model(temp=temperature)),
+            voices_dir=voices_dir,
+            default_voice=default_voice_name
+        )
 
         load_time = time.time() - start_time
         logger.info(f"Model loaded successfully in {load_time:.2f}s")
 
         # Pre-load default voice state if configured
         if default_voice_name:
-            state = get_or_load_voice_state(default_voice_name)
+            state = get_or_load_voice_state(st, default_voice_name)
             if state:
                 logger.info(f"Default voice pre-loaded: {default_voice_name}")
             else:
                 logger.warning(f"Default voice '{default_voice_name}' not found in {voices_dir}")
 
         # List available voices
-        available = list_available_voices()
+        available = list_available_voices(voices_dir)
         if available:
             logger.info(f"Available voices: {[v['voice_id'] for v in available]}")
         else:
             logger.info("No custom voice files found. Using Pocket TTS built-in voices.")
 
+        # Encode every voice file now rather than on its first request
+        if os.getenv("POCKETTTS_PRELOAD_VOICES", "true").lower() == "true":
+            with _inference_mode():
+                for v in available:
+                    if get_or_load_voice_state(st, v["voice_id"]) is None:
+                        logger.warning(f"Could not preload voice: {v['voice_id']}")
+
+        # One short generation before serving, so lazy init, allocator growth
+        # and kernel selection aren't paid by the first real request
+        if os.getenv("POCKETTTS_WARMUP", "true").lower() == "true":
+            _, _, warmup_time = _synthesize(st, "Warming up.", default_voice_name)
+            logger.info(f"Warmup generation done in {warmup_time:.2f}s")
+
+        app.state.tts = st
         return True
 
     except Exception as e:
@@ -198,6 +357,44 @@ def load_model(temp: float = None):
         return False
 
 
+def _configure_torch_threads():
+    """Size torch's intra-op pool (CPU model - there are no CUDA/cuDNN knobs to set)
+
+    With several generation workers each generate() would otherwise fan out
+    over every core and the pools oversubscribe the CPU; split the cores
+    between them instead unless POCKETTTS_THREADS says otherwise.
+    """
+    threads = int(os.getenv("POCKETTTS_THREADS", "0"))
+    if not threads and GENERATION_WORKERS > 1:
+        threads = max(1, (os.cpu_count() or 1) // GENERATION_WORKERS)
+    if threads and _ensure_torch():
+        torch.set_num_threads(threads)
+        logger.info(f"torch intra-op threads: {threads}")
+
+
+def _apply_precision(model):
+    """Quantize the model per POCKETTTS_PRECISION (CPU model, so only dynamic int8)
+
+    Dynamic int8 stores Linear weights at a quarter of the size and runs them
+    with int8 kernels - less memory bandwidth per generated frame. Opt-in since
+    it can shift voice timbre slightly; check output before enabling.
+    """
+    precision = os.getenv("POCKETTTS_PRECISION", "fp32").lower()
+    if precision == "fp32":
+        return model
+    if precision != "int8":
+        logger.warning(f"Unknown POCKETTTS_PRECISION '{precision}', keeping fp32")
+        return model
+    if not _ensure_torch() or not isinstance(model, torch.nn.Module):
+        logger.warning("int8 quantization needs a torch nn.Module model, keeping fp32")
+        return model
+
+    start = time.time()
+    model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    logger.info(f"Quantized Linear layers to int8 in {time.time() - start:.2f}s")
+    return model
+
+
 @app.on_event("startup")
 async def startup_event():
     """Load model on startup"""
@@ -208,20 +405,23 @@ async def startup_event():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    st = app.state.tts
+    voices_dir = st.voices_dir if st else None
     return {
-        "status": "healthy" if tts_model is not None else "unhealthy",
-        "model_loaded": tts_model is not None,
+        "status": "healthy" if st is not None else "unhealthy",
+        "model_loaded": st is not None,
         "engine": "pocket-tts",
         "voices_dir": voices_dir,
-        "default_voice": default_voice_name,
-        "available_voices": [v["voice_id"] for v in list_available_voices()]
+        "default_voice": st.default_voice if st else None,
+        "available_voices": [v["voice_id"] for v in list_available_voices(voices_dir)]
     }
 
 
 @app.get("/v1/voices")
 async def list_voices_endpoint():
     """List available voices for cloning"""
-    voices = list_available_voices()
+    st = app.state.tts
+    voices = list_available_voices(st.voices_dir if st else None)
 
     # Include Pocket TTS built-in voices
     builtins = ["alba", "marius", "javert", "jean", "fantine", "cosette", "eponine", "azelma"]
@@ -250,63 +450,28 @@ async def synthesize_speech(
     Args:
         text: The text to synthesize
         voice: Voice ID for cloning (e.g., 'Assistant'). Uses POCKETTTS_DEFAULT_VOICE if not specified.
-        response_format: Output format - 'wav' (only wav supported currently)
+        response_format: Output format - 'wav', or 'mp3' when lameenc is installed
+                         (falls back to wav otherwise; check Content-Type)
     """
-    if tts_model is None:
+    st = app.state.tts
+    if st is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
     if not text or not text.strip():
         raise HTTPException(status_code=400, detail="Text cannot be empty")
 
     try:
-        # Determine which voice to use
-        voice_to_use = voice or default_voice_name
-        voice_state = None
-
-        if voice_to_use and voice_to_use != "default":
-            voice_state = get_or_load_voice_state(voice_to_use)
-            if voice_state:
-                logger.info(f"Using voice: {voice_to_use}")
-            else:
-                # Try as a built-in Pocket TTS voice name
-                try:
-                    voice_state = tts_model.get_state_for_audio_prompt(voice_to_use)
-                    voice_states[voice_to_use] = voice_state
-                    logger.info(f"Using built-in voice: {voice_to_use}")
-                except Exception:
-                    logger.warning(f"Voice '{voice_to_use}' not found, using default")
-
-        # Fall back to a built-in voice if no voice state loaded
-        if voice_state is None:
-            voice_state = get_or_load_voice_state("alba")
-            if voice_state is None:
-                voice_state = tts_model.get_state_for_audio_prompt("alba")
-                voice_states["alba"] = voice_state
-
-        logger.info(f"Generating speech for text: {text[:50]}...")
-        start_time = time.time()
-
-        audio = tts_model.generate_audio(voice_state, text.strip())
-
-        gen_time = time.time() - start_time
-        logger.info(f"Generated audio in {gen_time:.2f}s")
-
-        # Convert to 16-bit PCM WAV (format 1) so Python's wave module can read it.
-        # pocket-tts returns float32 tensors; scipy would write those as format 3
-        # (IEEE float) which the wave module can't parse and requires slow conversion.
-        audio_np = audio.numpy()
-        if audio_np.dtype.kind == 'f':
-            audio_np = (audio_np * 32767).clip(-32768, 32767).astype('int16')
-        audio_buffer = io.BytesIO()
-        scipy.io.wavfile.write(audio_buffer, tts_model.sample_rate, audio_np)
-        audio_buffer.seek(0)
+        audio_bytes, media_type, gen_time = await asyncio.get_running_loop().run_in_executor(
+            _generation_executor, _synthesize, st, text, voice, response_format
+        )
+        extension = "mp3" if media_type == "audio/mpeg" else "wav"
 
         return Response(
-            content=audio_buffer.read(),
-            media_type="audio/wav",
+            content=audio_bytes,
+            media_type=media_type,
             headers={
                 "X-Generation-Time": str(gen_time),
-                "Content-Disposition": f'attachment; filename="speech.wav"'
+                "Content-Disposition": f'attachment; filename="speech.{extension}"'
             }
         )
 
@@ -315,6 +480,120 @@ async def synthesize_speech(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _synthesize(st: AppState, text: str, voice: Optional[str], response_format: str = "wav") -> tuple:
+    """Resolve the voice state, generate and encode audio (runs on the generation pool).
+
+    Returns:
+        (audio_bytes, media_type, generation_seconds)
+    """
+    key = (voice or st.default_voice, text.strip())
+    with _audio_cache_lock:
+        samples = _audio_cache.get(key)
+        if samples is not None:
+            _audio_cache.move_to_end(key)
+
+    if samples is not None:
+        gen_time = 0.0
+        logger.info(f"Audio cache hit for text: {text[:50]}...")
+    else:
+        # No autograd tracking for voice-state encoding or generation
+        with _inference_mode():
+            samples, gen_time = _generate_pcm16(st, text, voice)
+        if AUDIO_CACHE_SIZE > 0 and len(key[1]) <= AUDIO_CACHE_MAX_TEXT:
+            samples.flags.writeable = False  # shared between responses
+            with _audio_cache_lock:
+                _audio_cache[key] = samples
+                while len(_audio_cache) > AUDIO_CACHE_SIZE:
+                    _audio_cache.popitem(last=False)
+
+    if response_format == "mp3":
+        if LAMEENC_AVAILABLE:
+            return _pcm16_mp3(samples, st.model.sample_rate), "audio/mpeg", gen_time
+        logger.warning("mp3 requested but lameenc isn't installed; returning wav")
+    return _pcm16_wav(samples, st.model.sample_rate), "audio/wav", gen_time
+
+
+def _generate_pcm16(st: AppState, text: str, voice: Optional[str]) -> tuple:
+    """Generate speech as int16 samples. Returns (samples, generation_seconds)"""
+    model = st.model
+    voice_states = st.voice_states
+
+    # Determine which voice to use
+    voice_to_use = voice or st.default_voice
+    voice_state = None
+
+    if voice_to_use and voice_to_use != "default":
+        voice_state = get_or_load_voice_state(st, voice_to_use)
+        if voice_state:
+            logger.info(f"Using voice: {voice_to_use}")
+        else:
+            # Try as a built-in Pocket TTS voice name
+            try:
+                voice_state = model.get_state_for_audio_prompt(voice_to_use)
+                voice_states[voice_to_use] = voice_state
+                logger.info(f"Using built-in voice: {voice_to_use}")
+            except Exception:
+                logger.warning(f"Voice '{voice_to_use}' not found, using default")
+
+    # Fall back to a built-in voice if no voice state loaded
+    if voice_state is None:
+        voice_state = get_or_load_voice_state(st, "alba")
+        if voice_state is None:
+            voice_state = model.get_state_for_audio_prompt("alba")
+            voice_states["alba"] = voice_state
+
+    logger.info(f"Generating speech for text: {text[:50]}...")
+    start_time = time.time()
+
+    audio = model.generate_audio(voice_state, text.strip())
+
+    gen_time = time.time() - start_time
+    logger.info(f"Generated audio in {gen_time:.2f}s")
+
+    # Convert to 16-bit PCM WAV (format 1) so Python's wave module can read it.
+    # pocket-tts returns float32 tensors; written as-is they'd be format 3
+    # (IEEE float) which the wave module can't parse and requires slow conversion.
+    audio_np = audio.numpy()
+    if audio_np.dtype.kind == 'f':
+        audio_np = audio_np * 32767
+        np.clip(audio_np, -32768, 32767, out=audio_np)
+        audio_np = audio_np.astype('<i2')
+
+    return audio_np, gen_time
+
+
+def _pcm16_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """Serialize int16 samples ((n,) or (n, channels)) as a PCM WAV file.
+
+    The 44-byte header is packed directly and joined with a view of the
+    sample array, so the PCM is copied exactly once, into the returned bytes
+    (no tobytes() intermediate, no file-like buffer or generic WAV writer).
+    """
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    # No copy when samples are already contiguous little-endian int16
+    data = np.ascontiguousarray(samples, dtype='<i2')
+    block_align = channels * 2
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data.nbytes, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+        b'data', data.nbytes
+    )
+    return b''.join((header, data.data))
+
+
+def _pcm16_mp3(samples: np.ndarray, sample_rate: int) -> bytes:
+    """Encode int16 samples ((n,) or (n, channels)) as MP3 at MP3_BITRATE kbps"""
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(MP3_BITRATE)
+    encoder.set_in_sample_rate(sample_rate)
+    encoder.set_channels(channels)
+    encoder.set_quality(5)  # 2 = best, 7 = fastest
+    pcm = np.ascontiguousarray(samples, dtype='<i2').tobytes()
+    return bytes(encoder.encode(pcm) + encoder.flush())
+
+
 @app.post("/tts")
 async def tts_simple(request: TTSRequest):
     """Simple TTS endpoint"""
@@ -347,6 +626,8 @@ def main():
                         help="Port to listen on")
     parser.add_argument("--voice", default=None, help="Default voice to use (e.g., 'Assistant')")
     parser.add_argument("--temp", type=float, default=None, help="Sampling temperature")
+    parser.add_argument("--uds", default=os.getenv("POCKETTTS_UDS"),
+                        help="Also listen on this Unix socket path")
 
     args = parser.parse_args()
 
@@ -356,7 +637,28 @@ def main():
         os.environ["POCKETTTS_TEMP"] = str(args.temp)
 
     import uvicorn
-    uvicorn.run(app, host=args.host, port=args.port)
+
+    # uvloop + httptools when installed (uvicorn[standard]): faster socket I/O
+    # and request parsing than asyncio + h11. One worker - the model is
+    # loaded per process.
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info(f"Event loop: {loop}, HTTP parser: {http}")
+    if not args.uds:
+        uvicorn.run(app, host=args.host, port=args.port, loop=loop, http=http, workers=1)
+        return
+
+    # TCP for remote/sync clients plus a Unix socket for the co-located
+    # backend (POCKETTTS_UDS on its side too) - no loopback TCP stack per call
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(args.uds)
+    unix_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    unix_sock.bind(args.uds)
+    os.chmod(args.uds, 0o660)
+    tcp_sock = socket.create_server((args.host, args.port))
+    logger.info(f"Listening on {args.host}:{args.port} and unix:{args.uds}")
+    server = uvicorn.Server(uvicorn.Config(app, loop=loop, http=http))
+    server.run(sockets=[tcp_sock, unix_sock])
 
 
 if __name__ == "__main__":
@@ -75,12 +75,11 @@ def extract_text(file_path: str) -> str:
 
     ext = path.suffix.lower()
 
-    if ext == '.pdf':
-        return _extract_pdf(file_path)
-    elif ext in {'.txt', '.md', '.text', '.markdown'}:
-        return _extract_text_file(file_path)
-    else:
-        raise ValueError(f"Unsupported file type: {ext}")
+    try:
+        extractor = _EXTRACTORS[ext]
+    except KeyError:
+        raise ValueError(f"Unsupported file type: {ext}") from None
+    return extractor(file_path)
 
 
 def _extract_pdf(file_path: str) -> str:
@@ -104,6 +103,16 @@ def _extract_text_file(file_path: str) -> str:
         return f.read()
 
 
+# Extension -> extractor for extract_text(); keys match SUPPORTED_EXTENSIONS
+_EXTRACTORS = {
+    '.pdf': _extract_pdf,
+    '.txt': _extract_text_file,
+    '.md': _extract_text_file,
+    '.text': _extract_text_file,
+    '.markdown': _extract_text_file,
+}
+
+
 def chunk_text(
     text: str,
     chunk_size: int = 2000,